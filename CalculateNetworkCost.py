@@ -1,22 +1,49 @@
 #!/usr/bin/env python3
 import argparse
+import collections
+import concurrent.futures
 import datetime
+import glob
 import hashlib
+import itertools
 import json
 import logging
 import os
 import pathlib
 import re
+import selectors
+import shlex
+import signal
+import socketserver
 import subprocess
 import sys
+import threading
 import time
 import traceback
 import shutil
 import sqlite3
-from typing import List, Tuple, Union, Dict, Optional
+from typing import Callable, List, NamedTuple, Tuple, TypeVar, Union, Dict, Optional, Deque
 
 from rich.logging import RichHandler as rich_RichHandler
 
+from CalculateNetworkCost_ErrorSignatures import AMPL_ERROR_SIGNATURES, BARON_ERROR_SIGNATURES, \
+    KNITRO_ERROR_SIGNATURES, OCTERACT_ERROR_SIGNATURES, ErrorScanner
+from CalculateNetworkCost_ExtractResultFromAmplOutput import ExtractionError, extract_result
+from CalculateNetworkCost_Gams import EXPORT_PROGRAM_FILE_NAME, SOLUTION_CSV_FILE_NAME, GmsCache, \
+    gams_listing_to_ampl_output, read_solution_csv, solution_export_program
+from CalculateNetworkCost_LogAccess import MappedFile
+from CalculateNetworkCost_NetworkParser import NetworkData, load_network
+from CalculateNetworkCost_NetworkSimilarity import MAX_PARAMETER_DISTANCE, NetworkSignature, adapt_solution, \
+    estimate_infeasibility, network_signature, parameter_distance
+from CalculateNetworkCost_NlStub import NlStubCache, link_stub, solver_options_environment
+from CalculateNetworkCost_Portfolio import MAX_FEATURE_DISTANCE, NEIGHBOUR_NETWORKS, NetworkFeatures, SolveRecord, \
+    combination_statistics, feature_distance, network_features, select_portfolio, time_to_best
+from CalculateNetworkCost_SolverLogs import FLAG_INFEASIBLE, INFEASIBLE_OBJECTIVE_THRESHOLD, IncumbentPlateau, \
+    SolverLogFollower
+from CalculateNetworkCost_Verifier import NetworkVerifier, VerificationResult
+from CalculateNetworkCost_WarmStart import SUPPORTED_MODELS, AmplSolution, baron_cutoff, baron_cutoff_option, \
+    find_best_prior_solution, parse_ampl_solution
+
 g_logger = logging.getLogger('CNC')
 
 # ---
@@ -28,24 +55,23 @@ g_logger = logging.getLogger('CNC')
 #        solver instances depending on the conditions/parameters mentioned after this prefix.
 #      • The prefix 'r_' denotes that the variable is for some system resource (CPU, RAM, time, ...)
 #   2. 'pid_' and '.txt' are the prefix and suffix respectively
-#      for text file having PID of the bash running inside tmux.
-#   3. 'std_out_err_' and '.txt' are the prefix and suffix respectively for the text file
-#      having the merged content of `stdout` and `stderr` stream of the tmux session which
-#      runs the solver.
+#      for text file having PID of the bash running inside tmux (only used with `--launcher tmux`).
+#   3. 'std_out_err' and '.txt' are the prefix and suffix respectively for the text file
+#      having the merged content of `stdout` and `stderr` stream of the AMPL/GAMS process (or the
+#      tmux session) which runs the solver.
 #   4. Tmux session prefix is 'AR_NC_'.
 #   5. For naming files, always try to just use alpha-numeric letters and underscore ('_') only.
 
 
 # Assumptions
 #   1. Linux OS is used for execution
-#   2. `bash`, `which`, `nproc`, `tmux` are installed
+#   2. `bash`, `which`, `nproc` are installed (and `tmux` if `--launcher tmux` is used)
 #   3. Python lib `rich` is installed
 #   4. AMPL, Baron, Octeract are installed and properly configured
 #      (Execution is done from "mtp" directory or any other directory with the same directory structure)
 #   5. Model files are present at the right place
-#   6. There is no limitation on the amount of available RAM (This assumption make the program simpler.
-#      However, in future, it may be removed during deployment to make sure the solvers runs at optimal
-#      speed - accordingly changes need to be done in this program)
+#   6. The RAM used by a solver instance is known only after it is run once for the solver-model combination
+#      on a network of similar size (see `SolverSlotScheduler` and `get_learned_ram_requirement()`)
 #   7. Satisfy RegEx r'(a-zA-Z0-9_ )+' -> Absolute path of this Python script, and
 #                                         absolute path to graph/network (i.e. data/testcase file)
 
@@ -63,6 +89,14 @@ g_BASH_PATH = subprocess.check_output(['which', 'bash'], shell=False).decode().s
 
 global_execution_time = 300
 
+# REFER: `man 5 proc`, used to convert "starttime" of "/proc/PID/stat" to seconds
+g_CLOCK_TICKS_PER_SECOND = os.sysconf('SC_CLK_TCK')
+# "/proc/PID/task/TID/children" is only available if the kernel is built with CONFIG_PROC_CHILDREN
+g_PROC_CHILDREN_SUPPORTED = os.path.exists(f'/proc/self/task/{os.getpid()}/children')
+
+# Unix socket on which `--daemon` listens for solve requests (relative to the directory having this script)
+g_DEFAULT_DAEMON_SOCKET_PATH = './CalculateNetworkCost_daemon.sock'
+
 
 def run_command(cmd: str, default_result: str = '', debug_print: bool = False) -> Tuple[bool, str]:
     """Execute `cmd` using bash
@@ -137,10 +171,15 @@ def run_command_get_output(cmd: str, default_result: str = '0', debug_print: boo
 
 # ---
 
+# NOTE: One connection is shared by all the requests handled by this process (see `--daemon`). Hence, every
+#       access to `cursor` should be done while holding `g_db_lock`.
+g_db_lock = threading.Lock()
+
+
 def setup_database():
     # Connect to the database
     global cursor
-    connection = sqlite3.connect('networks.db')
+    connection = sqlite3.connect('networks.db', check_same_thread=False)
     cursor = connection.cursor()
 
     # Create the table
@@ -166,6 +205,54 @@ def setup_database():
                 alphaecp_m2_cost DECIMAL(10,2)
             )
         ''')
+    # Peak RAM used by a solver-model combination on a network, used to decide whether a solver instance can be
+    # launched without making the system swap, see `get_learned_ram_requirement()`
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS solver_memory_usage (
+            solver TEXT,
+            model TEXT,
+            network_size INTEGER,
+            peak_ram_gib REAL,
+            PRIMARY KEY (solver, model, network_size)
+        )
+    ''')
+    # Signature of every network (see `CalculateNetworkCost_NetworkSimilarity.py`), used to find an already solved
+    # network which differs only in a few parameters, see `get_similar_solved_networks()`
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS network_signatures (
+            hash_id TEXT PRIMARY KEY,
+            topology_hash TEXT,
+            pipes_hash TEXT,
+            parameters TEXT
+        )
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS network_signatures_structure ON network_signatures (topology_hash, pipes_hash)
+    ''')
+    # Features of every network and the result of every solver-model combination launched for it, used by
+    # `--portfolio auto` to select the combinations which win on similar networks, see `main_select_portfolio()`
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS network_features (
+            hash_id TEXT PRIMARY KEY,
+            num_nodes INTEGER,
+            num_arcs INTEGER,
+            num_pipes INTEGER,
+            num_loops INTEGER,
+            demand_spread REAL
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS solver_results (
+            hash_id TEXT,
+            run_id TEXT,
+            solve_time INTEGER,
+            solver TEXT,
+            model TEXT,
+            cost REAL,
+            time_to_best REAL,
+            PRIMARY KEY (hash_id, run_id, solver, model)
+        )
+    ''')
     # Commit the changes and close the connection
     connection.commit()
     g_logger.info("Database connected successfully")
@@ -180,16 +267,87 @@ def delete_last_lines(n=1):
     sys.stdout.flush()
 
 
+def read_meminfo() -> Dict[str, float]:
+    """Returns: fields of "/proc/meminfo" (e.g. 'MemAvailable', 'SwapFree') in GiB"""
+    res: Dict[str, float] = dict()
+    with open('/proc/meminfo') as f:
+        for line in f:
+            # Format: "MemAvailable:   12345678 kB"
+            key, _, value = line.partition(':')
+            value = value.split()
+            if len(value) > 0 and value[0].isdigit():
+                res[key] = int(value[0]) / 1024 / 1024
+    return res
+
+
 def get_free_ram() -> float:
     """Returns: free RAM in GiB"""
-    # REFER: https://stackoverflow.com/questions/34937580/get-available-memory-in-gb-using-single-bash-shell-command/34938001
-    return float(run_command_get_output(r'''awk '/MemFree/ { printf "%.3f\n", $2/1024/1024 }' /proc/meminfo'''))
+    return read_meminfo().get('MemFree', 0.0)
+
+
+def get_available_ram() -> float:
+    """Returns: RAM in GiB which can be used by new processes without swapping (includes reclaimable page cache)"""
+    return read_meminfo().get('MemAvailable', 0.0)
 
 
 def get_free_swap() -> float:
     """Returns: free Swap in GiB"""
-    # REFER: https://stackoverflow.com/questions/34937580/get-available-memory-in-gb-using-single-bash-shell-command/34938001
-    return float(run_command_get_output(r'''awk '/SwapFree/ { printf "%.3f\n", $2/1024/1024 }' /proc/meminfo'''))
+    return read_meminfo().get('SwapFree', 0.0)
+
+
+def get_network_size(data_file_path: str) -> int:
+    """
+    Returns:
+        Number of arcs (or links) multiplied by the number of pipes in the graph/network (i.e. data/testcase
+        file), which is roughly the number of variables of the model. 0 if it could not be found. This is used
+        only for the data files which can not be parsed by `load_network()`, i.e. the ones of model m3/m4
+    """
+    arcs, pipes, inside_arcs_table = 0, 0, False
+    try:
+        with open(data_file_path) as f:
+            for line in f:
+                line = line.strip()
+                if inside_arcs_table:
+                    if line.startswith(';'):
+                        break
+                    if line != '':
+                        arcs += 1
+                    if line.endswith(';'):
+                        break
+                elif line.startswith('set pipes'):
+                    pipes = len(line.partition(':=')[2].rstrip(';').split())
+                elif line.startswith('set links'):
+                    # Data files of model m3 and m4 have the arcs as "set links := 'Pipe_1_2', 'Pipe_2_4', ...;"
+                    arcs = len(line.partition(':=')[2].rstrip(';').replace(',', ' ').split())
+                elif re.match(r'param\s*:\s*arcs\b', line):
+                    inside_arcs_table = True
+    except OSError:
+        return 0
+    return arcs * max(1, pipes)
+
+
+def read_proc_stat(pid: Union[int, str]) -> Optional[Tuple[str, str, int, int]]:
+    """
+    Returns:
+        (comm, state, ppid, starttime) of the process with PID=pid from "/proc/PID/stat", None if it does not exist.
+        starttime is in clock ticks since boot. REFER: `man 5 proc`
+    """
+    try:
+        with open(f'/proc/{pid}/stat', 'rb') as f:
+            stat = f.read().decode(errors='replace')
+    except OSError:
+        return None
+    # NOTE: comm is inside parenthesis and can itself have spaces and parenthesis, so search for the last ')'
+    comm_end = stat.rfind(')')
+    fields = stat[comm_end + 2:].split()
+    # fields[0] is the 3rd field (state) of the file, so the 22nd field (starttime) is fields[19]
+    return stat[stat.find('(') + 1:comm_end], fields[0], int(fields[1]), int(fields[19])
+
+
+def get_system_uptime() -> float:
+    """Returns: seconds since boot"""
+    with open('/proc/uptime') as f:
+        return float(f.read().split()[0])
 
 
 def get_execution_time(pid: Union[int, str]) -> int:
@@ -197,12 +355,130 @@ def get_execution_time(pid: Union[int, str]) -> int:
     # NOTE: etime measures "wall clock time", i.e. difference between now and the moment the process was started
     #       REFER: https://stackoverflow.com/questions/17737531/linux-ps-command-get-process-running-time-different-between-etime-and-time-p
     # REFER: https://unix.stackexchange.com/questions/7870/how-to-check-how-long-a-process-has-been-running
-    return int(run_command(f'ps -o etimes= -p "{pid}"', str(10 ** 15))[1])  # 10**15 seconds == ~3.17 crore years
+    stat = read_proc_stat(pid)
+    if stat is None:
+        return 10 ** 15  # 10**15 seconds == ~3.17 crore years
+    return int(get_system_uptime() - stat[3] / g_CLOCK_TICKS_PER_SECOND)
 
 
 def get_process_running_status(pid: Union[int, str]) -> bool:
     """Returns: Whether the process with PID=pid is running or not"""
-    return run_command(f'ps -p {pid}')[0]
+    stat = read_proc_stat(pid)
+    return (stat is not None) and (stat[1] != 'Z')
+
+
+class ProcessTreeSnapshot:
+    def __init__(self, root_pids: List[Union[int, str]]):
+        """
+        Process trees rooted at `root_pids`, as they were when this object was created. This is built by reading
+        "/proc" directly, i.e. it replaces `pstree` and `ps` without launching any subprocess.
+
+        Args:
+            root_pids: PID of the AMPL/GAMS process (or the bash running inside tmux) of the solver instances
+        """
+        self.uptime: float = get_system_uptime()
+        # PID -> (comm, state, ppid, starttime)
+        self.processes: Dict[int, Tuple[str, str, int, int]] = dict()
+        self.children: Dict[int, List[int]] = dict()
+        root_pids = [int(pid) for pid in root_pids if str(pid) not in ('', '0', 'None')]
+        if g_PROC_CHILDREN_SUPPORTED:
+            self.__walk_children_files(root_pids)
+        else:
+            self.__scan_all_processes(root_pids)
+
+    def __walk_children_files(self, root_pids: List[int]) -> None:
+        to_visit = list(root_pids)
+        while len(to_visit) > 0:
+            pid = to_visit.pop()
+            if pid in self.processes:
+                continue
+            stat = read_proc_stat(pid)
+            if stat is None:
+                continue
+            self.processes[pid] = stat
+            self.children[pid] = list()
+            try:
+                for tid in os.listdir(f'/proc/{pid}/task'):
+                    with open(f'/proc/{pid}/task/{tid}/children') as f:
+                        self.children[pid].extend(int(i) for i in f.read().split())
+            except OSError:
+                pass  # The process exited while it was being read
+            to_visit.extend(self.children[pid])
+
+    def __scan_all_processes(self, root_pids: List[int]) -> None:
+        # "/proc/PID/task/TID/children" is only available if the kernel is built with CONFIG_PROC_CHILDREN
+        all_processes: Dict[int, Tuple[str, str, int, int]] = dict()
+        all_children: Dict[int, List[int]] = dict()
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            stat = read_proc_stat(entry)
+            if stat is None:
+                continue
+            all_processes[int(entry)] = stat
+            all_children.setdefault(stat[2], list()).append(int(entry))
+        to_visit = [pid for pid in root_pids if pid in all_processes]
+        while len(to_visit) > 0:
+            pid = to_visit.pop()
+            if pid in self.processes:
+                continue
+            self.processes[pid] = all_processes[pid]
+            self.children[pid] = all_children.get(pid, list())
+            to_visit.extend(self.children[pid])
+
+    def execution_time(self, pid: Union[int, str]) -> int:
+        """Same as `get_execution_time(pid)`, for a PID in this snapshot"""
+        stat = self.processes.get(int(pid))
+        if stat is None:
+            return 10 ** 15
+        return int(self.uptime - stat[3] / g_CLOCK_TICKS_PER_SECOND)
+
+    def find_processes(self, root_pid: Union[int, str], process_name: str) -> List[int]:
+        """Returns: PIDs of the processes named `process_name` in the tree rooted at `root_pid` (including it)"""
+        res, to_visit = list(), [int(root_pid)]
+        while len(to_visit) > 0:
+            pid = to_visit.pop()
+            if pid not in self.processes:
+                continue
+            if self.processes[pid][0] == process_name:
+                res.append(pid)
+            to_visit.extend(self.children[pid])
+        return res
+
+    def memory_usage(self, root_pid: Union[int, str]) -> Tuple[float, float]:
+        """
+        Returns:
+            Current RSS and peak RSS (both in GiB) of all the processes in the tree rooted at `root_pid`, added up
+        """
+        rss, peak_rss, to_visit = 0, 0, [int(root_pid)]
+        while len(to_visit) > 0:
+            pid = to_visit.pop()
+            if pid not in self.processes:
+                continue
+            to_visit.extend(self.children[pid])
+            try:
+                with open(f'/proc/{pid}/status') as f:
+                    for line in f:
+                        # Format: "VmRSS:     12345 kB"
+                        if line.startswith('VmRSS:'):
+                            rss += int(line.split()[1])
+                        elif line.startswith('VmHWM:'):
+                            peak_rss += int(line.split()[1])
+            except (OSError, ValueError, IndexError):
+                pass  # The process exited while it was being read
+        return rss / 1024 / 1024, max(rss, peak_rss) / 1024 / 1024
+
+    def format_tree(self, root_pid: Union[int, str], depth: int = 0) -> str:
+        """Returns: the tree rooted at `root_pid` in a format similar to `pstree -p`"""
+        root_pid = int(root_pid)
+        if root_pid not in self.processes:
+            return ''
+        lines = [f'{"  " * depth}{self.processes[root_pid][0]},{root_pid}']
+        for pid in self.children[root_pid]:
+            sub_tree = self.format_tree(pid, depth + 1)
+            if sub_tree != '':
+                lines.append(sub_tree)
+        return '\n'.join(lines)
 
 
 def file_hash_sha256(file_path) -> str:
@@ -237,6 +513,16 @@ def file_hash_sha256(file_path) -> str:
 
 # ---
 
+# Header of the solution table in `res.lst` of Baron
+BARON_SOLUTION_HEADER_REGEX = re.compile(rb'variable\s*xlo\s*xbest\s*xup')
+
+# The error signatures of every solver compiled once, see `SolverOutputAnalyzerParent.scan_errors()`
+AMPL_ERROR_SCANNER = ErrorScanner(AMPL_ERROR_SIGNATURES)
+BARON_ERROR_SCANNER = ErrorScanner(BARON_ERROR_SIGNATURES)
+KNITRO_ERROR_SCANNER = ErrorScanner(KNITRO_ERROR_SIGNATURES)
+OCTERACT_ERROR_SCANNER = ErrorScanner(OCTERACT_ERROR_SIGNATURES)
+
+
 class SolverOutputAnalyzerParent:
     def __init__(self, engine_path: str, engine_options: str, process_name_to_stop_using_ctrl_c: str):
         """
@@ -252,6 +538,8 @@ class SolverOutputAnalyzerParent:
         self.engine_path = engine_path
         self.engine_options = engine_options
         self.process_name_to_stop_using_ctrl_c = process_name_to_stop_using_ctrl_c
+        # Whether the solver is run using GAMS instead of AMPL, see `AutoExecutorSettings.start_solver()`
+        self.uses_gams = False
 
     def check_solution_found(self, exec_info: 'NetworkExecutionInformation') -> bool:
         """
@@ -305,72 +593,98 @@ class SolverOutputAnalyzerParent:
             A boolean value telling whether everything is ok (True) or not (False)
             A string value containing the error message
         """
-        # AMPL binary does not exist
-        try:
-            err_idx = file_txt.index('no such file or directory: ./ampl.linux-intel64/ampl')
-            err_msg = file_txt.strip()
-            g_logger.debug(err_msg)
-            return False, err_msg
-        except ValueError:
-            pass  # substring not found
-
-        # Execute permission not available for AMPL
-        try:
-            err_idx = file_txt.index('permission denied: ./ampl.linux-intel64/ampl')
-            err_msg = file_txt.strip()
-            g_logger.debug(err_msg)
-            return False, err_msg
-        except ValueError:
-            pass  # substring not found
-
-        # Execute permission not available for Solver
-        try:
-            if 'Cannot invoke' in file_txt and 'Permission denied' in file_txt:
-                err_idx = file_txt.index('Permission denied')
-                err_msg = file_txt[:err_idx + len('Permission denied') + 1].strip()
-                g_logger.debug(err_msg)
-                return False, err_msg
-        except Exception as e:
-            g_logger.error(f'FIXME: {type(e)}:\n{e}')
+        return AMPL_ERROR_SCANNER.check(file_txt)
 
-        # AMPL demo licence limitation
-        err_idx = None
-        try:
-            err_idx = file_txt.index('Sorry, a demo license for AMPL is limited to')
-            err_msg = file_txt[err_idx:file_txt.index('ampl:', err_idx)].replace('\n', ' ').strip()
-            g_logger.debug(err_msg)
-            return False, err_msg
-        except ValueError:
-            if err_idx is not None:
-                g_logger.debug(file_txt[err_idx:])
-                return False, file_txt[err_idx:]
-            pass  # substring not found
-
-        # Probable explanation: some error occurred before the presolve phase
-        err_idx = None
-        try:
-            err_idx = file_txt.index('Error executing "solve" command:')
-            err_msg = file_txt[err_idx:file_txt.index('<BREAK>', err_idx)].replace('\n', ' ').strip()
-            g_logger.debug(err_msg)
-            return False, err_msg
-        except ValueError:
-            if err_idx is not None:
-                g_logger.debug(file_txt[err_idx:])
-                return False, file_txt[err_idx:]
-            pass  # substring not found
-        del err_idx
-
-        # Solver did not proceed due to some impossible situations, e.g. X should be <= 3 and >= 7
-        try:
-            if '_total_solve_time = 0' in file_txt:
-                err_idx = file_txt.index('presolve:')
-                err_msg = file_txt[err_idx: file_txt.index('_total_solve_time')]
-                g_logger.debug(err_msg)
-                return False, err_msg
-        except ValueError:
-            pass  # substring not found
+    @staticmethod
+    def extract_best_solution_from_progress(
+            exec_info: 'NetworkExecutionInformation',
+            solver_display_name: str
+    ) -> Tuple[bool, float]:
+        """
+        Fallback of `self.extract_best_solution()` if `total_cost` was not displayed by AMPL (e.g. the solver did not
+        terminate properly). The last upper bound reported by the solver in its output is used, see
+        `SolverLogFollower.last_row`
+        """
+        row = exec_info.log_follower.update().last_row
+        g_logger.debug(f'{row=}')
+        if row is None or row.upper_bound is None:
+            return False, 0.0
+        if FLAG_INFEASIBLE in row.flags:
+            g_logger.warning(f"Infeasible solution found by {solver_display_name}: '{row}'")
+            return False, 0.0
+        if row.upper_bound > INFEASIBLE_OBJECTIVE_THRESHOLD:
+            g_logger.warning(f"Probably an infeasible solution found by {solver_display_name}: '{row}'")
+            g_logger.info(f'Instance={exec_info}')
+            return False, row.upper_bound
+        return True, row.upper_bound
 
-        return True, 'No Errors'
+    @staticmethod
+    def scan_errors(scanner: ErrorScanner, exec_info: 'NetworkExecutionInformation') -> Tuple[bool, str]:
+        """
+        Check the std_out_err.txt file of `exec_info` for the error signatures of `scanner`. The file is scanned
+        again only if it changed since the last call for the same `exec_info`, see `ErrorScanner.check_file()`
+        """
+        return scanner.check_file(exec_info.uniq_std_out_err_file_path, exec_info.error_check_cache)
+
+    @staticmethod
+    def extract_res_lst_file_path(exec_info: 'NetworkExecutionInformation') -> Tuple[bool, str]:
+        """Returns: path of `res.lst` in the scratch directory retained by Baron (printed at the end of its output)"""
+        # Printed by Baron at the end, so the file is searched backwards
+        with MappedFile(exec_info.uniq_std_out_err_file_path) as log:
+            line = log.last_line_containing(b'Retaining scratch directory')
+        match = None if line is None else re.search(r'Retaining scratch directory "/tmp/(.+)"\.', line)
+        if match is None or match.group(1) == '':
+            return False, 'RegEx search failed'
+        solution_dir_name = match.group(1)
+        return True, (pathlib.Path(exec_info.aes.OUTPUT_DIR_LEVEL_1_DATA) / solution_dir_name / 'res.lst').resolve()
+
+    @staticmethod
+    def extract_solution_vector_from_res_lst(
+            exec_info: 'NetworkExecutionInformation'
+    ) -> Tuple[bool, str, float, str]:
+        """
+        `self.extract_solution_vector()` of the solvers whose output has the same format as Baron, i.e. the best
+        solution is in `res.lst` of the scratch directory retained by the solver
+
+        Returns: Tuple(status, file_to_parse, objective_value, solution_vector)
+        """
+        ok, file_to_parse = SolverOutputAnalyzerParent.extract_res_lst_file_path(exec_info)
+        if not ok:
+            return False, file_to_parse, float('nan'), 'Failed to extract solution file path'
+        with MappedFile(str(file_to_parse)) as res_lst:
+            # NOTE: The best solution is printed at the end of `res.lst`, which can be many MB for long runs. So,
+            #       the file is searched backwards, and only the solution table is decoded
+            objective_value = 'NotDefined'
+            idx_end = res_lst.rfind(b'The above solution has an objective value of')
+            try:
+                objective_value = re.search(r'The above solution has an objective value of:(.+)',
+                                            res_lst.line(idx_end) if idx_end != -1 else '').group(1).strip()
+                objective_value = float(objective_value)
+            except Exception as e:
+                g_logger.error(f'Exception e:\n{e}')
+                return False, file_to_parse, float('nan'), f"Objective value (='{objective_value}') RegEx search " \
+                                                           f"failed (Probably: no feasible solution was found)"
+            try:
+                # The lines from '^The best solution found is.+' till the End Of File
+                # idx = file_txt.index('The best solution found is:')
+                idx_header = res_lst.rfind(b'xbest', 0, idx_end)
+                idx_start = BARON_SOLUTION_HEADER_REGEX.search(
+                    res_lst.data, res_lst.line_start(idx_header) if idx_header != -1 else idx_end
+                ).end()
+                solution_vector_list = list()
+                for line in res_lst.text(idx_start, idx_end).strip().splitlines(keepends=False):
+                    vals = line.strip().split()
+                    solution_vector_list.append(f'{vals[0]}: {vals[2]}')  # Variable Name, Best Value
+                return True, file_to_parse, objective_value, '\n'.join(solution_vector_list)
+            except AttributeError as e:
+                # re.search returned None
+                g_logger.debug(f'{type(e)}: {e}')
+                g_logger.debug(f'{exec_info.uniq_std_out_err_file_path=}')
+                return False, file_to_parse, objective_value, 'Solution vector RegEx search failed'
+            except Exception as e:
+                g_logger.error(f'FIXME: {type(e)}:\n{e}')
+        # noinspection PyUnreachableCode
+        return False, file_to_parse, objective_value, 'FIXME: Unhandled unknown case'
 
 
 class SolverOutputAnalyzerBaron(SolverOutputAnalyzerParent):
@@ -410,119 +724,34 @@ class SolverOutputAnalyzerBaron(SolverOutputAnalyzerParent):
         process_name_to_stop_using_ctrl_c = 'baron'  # For 1 core and multi core, same process is to be stopped
         super().__init__(engine_path, engine_options, process_name_to_stop_using_ctrl_c)
 
-    def __baron_extract_output_table(self, std_out_err_file_path: str) -> str:
-        return run_command_get_output(f"bash output_table_extractor_baron.sh '{std_out_err_file_path}'", '')
-
     def extract_best_solution(self, exec_info: 'NetworkExecutionInformation') -> Tuple[bool, float]:
         # Extract the solution from the std_out_err file using the value printed by the AMPL commands:
         #     option display_precision 0;
         #     display total_cost;
-        try:
-            file_txt = open(exec_info.uniq_std_out_err_file_path, 'r').read()
-            best_solution = re.search(r'^total_cost\s*=\s*(.*)$', file_txt, re.M).group(1)
-            best_solution = float(best_solution)
+        best_solution = exec_info.log_follower.update().total_cost
+        if best_solution is not None:
             ok = True
             if best_solution == 0 or best_solution > 1e40:
                 g_logger.warning(f"Probably an infeasible solution found by Baron: '{best_solution}'")
                 g_logger.info(f'Instance={exec_info}')
                 ok = False
             return ok, best_solution
-        except Exception as e:
-            g_logger.error(f'CHECKME: {type(e)}, error:\n{e}')
-            g_logger.debug('Probably, Baron did not terminate immediately even after receiving the appropriate signal')
+        g_logger.error(f'CHECKME: `total_cost` not found in {exec_info.uniq_std_out_err_file_path=}')
+        g_logger.debug('Probably, Baron did not terminate immediately even after receiving the appropriate signal')
 
         g_logger.info('Using fallback mechanism to extract the best solution')
 
-        csv = self.__baron_extract_output_table(exec_info.uniq_std_out_err_file_path)
-        if csv == '':
-            return False, 0.0
-        lines = csv.split('\n')
-        lines = [line for line in lines if line != ',' and (not line.startswith('Processing file'))]
-        g_logger.debug(f'{lines=}')
-
-        ok = len(lines) > 0
-        best_solution = 0.0
-        if len(lines) > 0:
-            best_solution = float(lines[-1].split(',')[1])
-        if best_solution > 1e40:
-            g_logger.warning(f"Probably an infeasible solution found by Baron: '{lines[-1]}'")
-            g_logger.info(f'Instance={exec_info}')
-            ok = False
-        return ok, best_solution
+        return self.extract_best_solution_from_progress(exec_info, 'Baron')
 
     def check_solution_found(self, exec_info: 'NetworkExecutionInformation') -> bool:
-        return self.extract_best_solution(exec_info)[0]
+        # Only the bytes appended since the last call are parsed, see `SolverLogFollower`
+        return exec_info.log_follower.update().solution_found()
 
     def check_errors(self, exec_info: 'NetworkExecutionInformation') -> Tuple[bool, str]:
-        file_txt = open(exec_info.uniq_std_out_err_file_path, 'r').read()
-
-        ok, err_msg = self.ampl_check_errors(file_txt)
-        if not ok:
-            return ok, err_msg
-
-        try:
-            err_idx = file_txt.index('Sorry, a demo license is limited to 10 variables')
-            err_msg = file_txt[err_idx:file_txt.index('exit value 1', err_idx)].replace('\n', ' ').strip()
-            g_logger.debug(err_msg)
-            return False, err_msg
-        except ValueError:
-            pass  # substring not found
-
-        try:
-            err_idx = re.search(r'''Can't\s+find\s+file\s+['"]?.+['"]?''', file_txt).start()
-            g_logger.debug(file_txt[err_idx:])
-            return False, file_txt[err_idx:]
-        except AttributeError as e:
-            # re.search returned None
-            g_logger.debug(f'{type(e)}: {e}')
-            g_logger.debug(f'{exec_info.uniq_std_out_err_file_path=}')
-        except Exception as e:
-            g_logger.error(f'FIXME: {type(e)}:\n{e}')
-
-        if 'No feasible solution was found' in file_txt:
-            return False, 'No feasible solution was found'
-
-        return True, 'No Errors'
-
-    def __baron_extract_solution_file_path(self, exec_info: 'NetworkExecutionInformation') -> Tuple[bool, str]:
-        file_txt = open(exec_info.uniq_std_out_err_file_path, 'r').read()
-        solution_dir_name = re.search(r'Retaining scratch directory "/tmp/(.+)"\.', file_txt).group(1)
-        if solution_dir_name == '':
-            return False, 'RegEx search failed'
-        return True, (pathlib.Path(exec_info.aes.OUTPUT_DIR_LEVEL_1_DATA) / solution_dir_name / 'res.lst').resolve()
+        return self.scan_errors(BARON_ERROR_SCANNER, exec_info)
 
     def extract_solution_vector(self, exec_info: 'NetworkExecutionInformation') -> Tuple[bool, str, float, str]:
-        ok, file_to_parse = self.__baron_extract_solution_file_path(exec_info)
-        if not ok:
-            return False, file_to_parse, float('nan'), 'Failed to extract solution file path'
-        file_txt = open(file_to_parse, 'r').read()
-        objective_value = 'NotDefined'
-        try:
-            objective_value = re.search(r'The above solution has an objective value of:(.+)', file_txt).group(1).strip()
-            objective_value = float(objective_value)
-        except Exception as e:
-            g_logger.error(f'Exception e:\n{e}')
-            return False, file_to_parse, float('nan'), f"Objective value (='{objective_value}') RegEx search failed " \
-                                                       f"(Probably: no feasible solution was found)"
-        try:
-            # The lines from '^The best solution found is.+' till the End Of File
-            # idx = file_txt.index('The best solution found is:')
-            idx_start = re.search(r'variable\s*xlo\s*xbest\s*xup', file_txt).end()
-            idx_end = re.search(r'The above solution has an objective value of', file_txt).start()
-            solution_vector_list = list()
-            for line in file_txt[idx_start:idx_end].strip().splitlines(keepends=False):
-                vals = line.strip().split()
-                solution_vector_list.append(f'{vals[0]}: {vals[2]}')  # Variable Name, Best Value
-            return True, file_to_parse, objective_value, '\n'.join(solution_vector_list)
-        except AttributeError as e:
-            # re.search returned None
-            g_logger.debug(f'{type(e)}: {e}')
-            g_logger.debug(f'{exec_info.uniq_std_out_err_file_path=}')
-            return False, file_to_parse, objective_value, 'Solution vector RegEx search failed'
-        except Exception as e:
-            g_logger.error(f'FIXME: {type(e)}:\n{e}')
-        # noinspection PyUnreachableCode
-        return False, file_to_parse, objective_value, 'FIXME: Unhandled unknown case'
+        return self.extract_solution_vector_from_res_lst(exec_info)
 
 
 class SolverOutputAnalyzerKnitro(SolverOutputAnalyzerParent):
@@ -562,131 +791,40 @@ class SolverOutputAnalyzerKnitro(SolverOutputAnalyzerParent):
         process_name_to_stop_using_ctrl_c = 'knitro'
         super().__init__(engine_path, engine_options, process_name_to_stop_using_ctrl_c)
 
-    def __knitro_extract_output_table(self, std_out_err_file_path: str) -> str:
-        return run_command_get_output(f"bash output_table_extractor_knitro.sh '{std_out_err_file_path}'", '')
-
     def extract_best_solution(self, exec_info: 'NetworkExecutionInformation') -> Tuple[bool, float]:
         # Extract the solution from the std_out_err file using the value printed by the AMPL commands:
         #     option display_precision 0;
         #     display total_cost;
-        try:
-            file_txt = open(exec_info.uniq_std_out_err_file_path, 'r').read()
-            best_solution = re.search(r'^total_cost\s*=\s*(.*)$', file_txt, re.M).group(1)
-            # Find if knitro returned correct output
-            # feasibility_error = re.search()
-            best_solution = float(best_solution)
+        best_solution = exec_info.log_follower.update().total_cost
+        # Find if knitro returned correct output
+        # feasibility_error = re.search()
+        if best_solution is not None:
             ok = True
             if best_solution == 0 or best_solution > 1e40:
-                g_logger.warning(f"Probably an infeasible solution found by Baron: '{best_solution}'")
+                g_logger.warning(f"Probably an infeasible solution found by Knitro: '{best_solution}'")
+                g_logger.info(f'Instance={exec_info}')
+                ok = False
+            elif exec_info.log_follower.final_point_infeasible:
+                g_logger.warning(f"Knitro exited with an infeasible final point: '{best_solution}'")
                 g_logger.info(f'Instance={exec_info}')
                 ok = False
             return ok, best_solution
-        except Exception as e:
-            g_logger.error(f'CHECKME: {type(e)}, error:\n{e}')
-            g_logger.debug('Probably, Knitro did not terminate immediately even after receiving the appropriate signal')
+        g_logger.error(f'CHECKME: `total_cost` not found in {exec_info.uniq_std_out_err_file_path=}')
+        g_logger.debug('Probably, Knitro did not terminate immediately even after receiving the appropriate signal')
 
         g_logger.info('Using fallback mechanism to extract the best solution')
 
-        csv = self.__knitro_extract_output_table(exec_info.uniq_std_out_err_file_path)
-        if csv == '':
-            return False, 0.0
-        lines = csv.split('\n')
-        lines = [line for line in lines if line != ',' and (not line.startswith('Processing file'))]
-        g_logger.debug(f'{lines=}')
-
-        ok = len(lines) > 0
-        best_solution = 0.0
-        if len(lines) > 0:
-            best_solution = float(lines[-1].split(',')[1])
-        if best_solution > 1e40:
-            g_logger.warning(f"Probably an infeasible solution found by Knitro: '{lines[-1]}'")
-            g_logger.info(f'Instance={exec_info}')
-            ok = False
-        return ok, best_solution
+        return self.extract_best_solution_from_progress(exec_info, 'Knitro')
 
     def check_solution_found(self, exec_info: 'NetworkExecutionInformation') -> bool:
-        return self.extract_best_solution(exec_info)[0]
+        # Only the bytes appended since the last call are parsed, see `SolverLogFollower`
+        return exec_info.log_follower.update().solution_found()
 
     def check_errors(self, exec_info: 'NetworkExecutionInformation') -> Tuple[bool, str]:
-        file_txt = open(exec_info.uniq_std_out_err_file_path, 'r').read()
-
-        ok, err_msg = self.ampl_check_errors(file_txt)
-        if not ok:
-            return ok, err_msg
-
-        try:
-            err_idx = file_txt.index('Sorry, a demo license is limited to 10 variables')
-            err_msg = file_txt[err_idx:file_txt.index('exit value 1', err_idx)].replace('\n', ' ').strip()
-            g_logger.debug(err_msg)
-            return False, err_msg
-        except ValueError:
-            pass  # substring not found
-
-        try:
-            err_idx = re.search(r'''Can't\s+find\s+file\s+['"]?.+['"]?''', file_txt).start()
-            g_logger.debug(file_txt[err_idx:])
-            return False, file_txt[err_idx:]
-        except AttributeError as e:
-            # re.search returned None
-            g_logger.debug(f'{type(e)}: {e}')
-            g_logger.debug(f'{exec_info.uniq_std_out_err_file_path=}')
-        except Exception as e:
-            g_logger.error(f'FIXME: {type(e)}:\n{e}')
-
-        # Checking if Knitro bugged :
-        try:
-            err_idx = re.search(r'''1\.8(?:0?)e\+308''', file_txt).start()
-            g_logger.debug("KNitro Bug found")
-            return False, file_txt[err_idx:]
-        except Exception as e:
-            # re.search returned None
-            g_logger.debug(f'{type(e)}: {e}')
-            g_logger.debug(f'{exec_info.uniq_std_out_err_file_path=}')
-
-        if 'No feasible solution was found' in file_txt or 'infeasible' in file_txt:
-            return False, 'No feasible solution was found'
-
-        return True, 'No Errors'
-
-    def __baron_extract_solution_file_path(self, exec_info: 'NetworkExecutionInformation') -> Tuple[bool, str]:
-        file_txt = open(exec_info.uniq_std_out_err_file_path, 'r').read()
-        solution_dir_name = re.search(r'Retaining scratch directory "/tmp/(.+)"\.', file_txt).group(1)
-        if solution_dir_name == '':
-            return False, 'RegEx search failed'
-        return True, (pathlib.Path(exec_info.aes.OUTPUT_DIR_LEVEL_1_DATA) / solution_dir_name / 'res.lst').resolve()
+        return self.scan_errors(KNITRO_ERROR_SCANNER, exec_info)
 
     def extract_solution_vector(self, exec_info: 'NetworkExecutionInformation') -> Tuple[bool, str, float, str]:
-        ok, file_to_parse = self.__baron_extract_solution_file_path(exec_info)
-        if not ok:
-            return False, file_to_parse, float('nan'), 'Failed to extract solution file path'
-        file_txt = open(file_to_parse, 'r').read()
-        objective_value = 'NotDefined'
-        try:
-            objective_value = re.search(r'The above solution has an objective value of:(.+)', file_txt).group(1).strip()
-            objective_value = float(objective_value)
-        except Exception as e:
-            g_logger.error(f'Exception e:\n{e}')
-            return False, file_to_parse, float('nan'), f"Objective value (='{objective_value}') RegEx search failed " \
-                                                       f"(Probably: no feasible solution was found)"
-        try:
-            # The lines from '^The best solution found is.+' till the End Of File
-            # idx = file_txt.index('The best solution found is:')
-            idx_start = re.search(r'variable\s*xlo\s*xbest\s*xup', file_txt).end()
-            idx_end = re.search(r'The above solution has an objective value of', file_txt).start()
-            solution_vector_list = list()
-            for line in file_txt[idx_start:idx_end].strip().splitlines(keepends=False):
-                vals = line.strip().split()
-                solution_vector_list.append(f'{vals[0]}: {vals[2]}')  # Variable Name, Best Value
-            return True, file_to_parse, objective_value, '\n'.join(solution_vector_list)
-        except AttributeError as e:
-            # re.search returned None
-            g_logger.debug(f'{type(e)}: {e}')
-            g_logger.debug(f'{exec_info.uniq_std_out_err_file_path=}')
-            return False, file_to_parse, objective_value, 'Solution vector RegEx search failed'
-        except Exception as e:
-            g_logger.error(f'FIXME: {type(e)}:\n{e}')
-        # noinspection PyUnreachableCode
-        return False, file_to_parse, objective_value, 'FIXME: Unhandled unknown case'
+        return self.extract_solution_vector_from_res_lst(exec_info)
 
 
 class SolverOutputAnalyzerAlphaecp(SolverOutputAnalyzerParent):
@@ -694,260 +832,36 @@ class SolverOutputAnalyzerAlphaecp(SolverOutputAnalyzerParent):
     def __init__(self, engine_path: str, engine_options: str, threads: int):
         process_name_to_stop_using_ctrl_c = 'alphaecp'  # For 1 core and multi core, same process is to be stopped
         super().__init__(engine_path, engine_options, process_name_to_stop_using_ctrl_c)
-
-    def __alphaecp_extract_output_table(self, std_out_err_file_path: str) -> str:
-        return run_command_get_output(f"bash output_table_extractor_baron.sh '{std_out_err_file_path}'", '')
+        self.uses_gams = True
 
     def gams_to_ampl_parser_m1(self, gams_file_path, output_file_path):
-
         try:
-            gams_file_text = open(gams_file_path, 'r').read()
-            output_file_txt = open(output_file_path, 'w')
-
             g_logger.info(f'In the gams_to_ampl_parser {gams_file_path} {output_file_path}')
-
-            h_variable = "---- VAR h"
-            q_variable = "---- VAR q"
-            l_variable = "---- VAR l"
-
-            # READ FILE
-            df = open(gams_file_path)
-
-            # read file
-            read = df.read()
-
-            # return cursor to the beginning of the file.
-            df.seek(0)
-            read
-
-            arr = []  # will store all the lines
-
-            # count number of lines in the file
-            line = 1
-            for word in read:
-                if word == '\n':
-                    line += 1
-
-            for i in range(line):
-                # readline() method,
-                # reads one line at
-                # a time
-                arr.append(df.readline())
-
-            h_variable_start = 0
-            h_variable_end = 0
-            q_variable_start = 0
-            q_variable_end = 0
-            l_variable_start = 0
-            l_variable_end = 0
-            for i in range(len(arr)):
-
-                if h_variable in arr[i]:
-                    q_variable_end = i - 4
-                    h_variable_start = i + 4
-
-                if "**** REPORT SUMMARY" in arr[i]:
-                    h_variable_end = i - 1
-
-                if q_variable in arr[i]:
-                    q_variable_start = i + 4
-                    l_variable_end = i - 1
-
-                if l_variable in arr[i]:
-                    l_variable_start = i + 4
-
-            total_execution_time = re.search(r'EXECUTION TIME\s+=\s+(\d+\.\d+) SECONDS', gams_file_text, re.M).group(1)
-            output_file_txt.write(f'_total_solve_time = {total_execution_time}\n\n')
-
-            # printing head values
-            output_file_txt.write("h[i] [*] :=\n")
-            for i in range(h_variable_start, h_variable_end - 1):
-                line = arr[i].strip().split()
-                head_value = float(line[2])
-                output_file_txt.write(f'{line[0]}  {head_value}\n')
-            output_file_txt.write(';\n\n')
-
-            # printing flow values
-            output_file_txt.write("q[i,j] :=\n")
-            min_length = 6
-            for i in range(q_variable_start, q_variable_end - 1):
-                line = arr[i].strip().split()
-                length = len(line)
-                min_length = min(min_length, length)
-            for i in range(q_variable_start, q_variable_end - 1):
-                line = arr[i].strip().split()
-                srcToDest = ''
-                for j in range(0, len(line) - min_length + 1):
-                    srcToDest += line[j]
-                srcToDest = srcToDest.split('.')
-                output_file_txt.write(f'{srcToDest[0]} {srcToDest[1]}\t{line[(len(line)) - 3]}\n')
-            output_file_txt.write(';\n\n')
-
-            # printing length values
-            output_file_txt.write("l[i,j,k] :=\n")
-            min_length = 7
-            # print(l_variable_start,l_variable_end)
-
-            for i in range(l_variable_start, l_variable_end):
-                links = re.findall(r'(\d+)\s*\.(\d+)\s*\.(\d+)', arr[i])
-                line = arr[i].strip().split()
-                if line[len(line) - 3] == '.':
-                    continue
-                length_value = float(line[len(line) - 3])
-                output_file_txt.write(f'{links[0][0]}  {links[0][1]}  {links[0][2]}\t{length_value}\n')
-            output_file_txt.write(';\n\n')
-
-            output_file_txt.write(f'_total_solve_time = {total_execution_time}\n\n')
-
-            # **** OBJECTIVE VALUE
-            best_solution = re.search(r"\*\*\*\* OBJECTIVE VALUE\s+([0-9]+\.[0-9]+)", gams_file_text, re.M).group(
-                1)  # if there is no value then 'NoneType' object has no attribute 'group'
-            output_file_txt.write(f'total_cost = {best_solution}')
-
+            gams_listing_to_ampl_output(gams_file_path, output_file_path, 'm1')
             g_logger.info("gams_to_ampl parser finished")
-
         except Exception as e:
             g_logger.error(f'CHECKME: {type(e)}, error:\n{e}')
             g_logger.info("There was some error while parsing the gams output file")
 
     def gams_to_ampl_parser_m2(self, gams_file_path, output_file_path):
-        gams_file_text = open(gams_file_path, 'r').read()
-        output_file_txt = open(output_file_path, 'w')
-
-        h_variable = "---- VAR h"
-        q1_variable = "---- VAR q1"
-        q2_variable = "---- VAR q2"
-        l_variable = "---- VAR l"
-
-        # READ FILE
-        df = open(gams_file_path)
-
-        # read file
-        read = df.read()
-
-        # return cursor to the beginning of the file.
-        df.seek(0)
-        read
-
-        arr = []  # will store all the lines
-
-        # count number of lines in the file
-        line = 1
-        for word in read:
-            if word == '\n':
-                line += 1
-
-        for i in range(line):
-            # readline() method,
-            # reads one line at
-            # a time
-            arr.append(df.readline())
-
-        h_variable_start = 0
-        h_variable_end = 0
-        q1_variable_start = 0
-        q1_variable_end = 0
-        q2_variable_start = 0
-        q2_variable_end = 0
-        l_variable_start = 0
-        l_variable_end = 0
-        for i in range(len(arr)):
-
-            if h_variable in arr[i]:
-                q2_variable_end = i - 4
-                h_variable_start = i + 4
-
-            if "**** REPORT SUMMARY" in arr[i]:
-                h_variable_end = i - 1
-
-            if q2_variable in arr[i]:
-                q2_variable_start = i + 4
-                q1_variable_end = i - 1
-
-            if l_variable in arr[i]:
-                l_variable_start = i + 4
-
-            if q1_variable in arr[i]:
-                q1_variable_start = i + 4
-                l_variable_end = i - 1
-
-        # print(q1_variable_start , q1_variable_end)
-        # print(q2_variable_start , q2_variable_end)
-
-        total_execution_time = re.search(r'EXECUTION TIME\s+=\s+(\d+\.\d+) SECONDS', gams_file_text, re.M).group(1)
-        output_file_txt.write(f'_total_solve_time = {total_execution_time}\n\n')
-
-        # printing head values
-        output_file_txt.write("h[i] [*] :=\n")
-        for i in range(h_variable_start, h_variable_end - 1):
-            line = arr[i].strip().split()
-            head_value = float(line[2])
-            output_file_txt.write(f'{line[0]}  {head_value}\n')
-        output_file_txt.write(';\n\n')
-
-        # printing flow values
-        output_file_txt.write(":         q1[i,j]       q2[i,j]      :=\n")
-        flow_dict = {}
-        min_length = 6
-        for i in range(q1_variable_start, q1_variable_end):
-            line = arr[i].strip().split()
-            length = len(line)
-            min_length = min(min_length, length)
-
-        # print(min_length)
-
-        for i in range(q1_variable_start, q1_variable_end):
-            line = arr[i].strip().split()
-            srcToDest = ''
-            for j in range(0, len(line) - min_length + 1):
-                srcToDest += line[j]
-            # print(srcToDest)
-            if line[(len(line)) - 3] != '.':
-                flow_dict[srcToDest] = line[(len(line)) - 3]
-
-        # print(flow_dict)
-
-        for i in range(q2_variable_start, q2_variable_end - 1):
-            line = arr[i].strip().split()
-            srcToDest = ''
-            for j in range(0, len(line) - min_length + 1):
-                srcToDest += line[j]
-            if srcToDest not in flow_dict.keys():
-                srcToDest = srcToDest.split('.')
-                output_file_txt.write(f'{srcToDest[0]} {srcToDest[1]}\t\t0\t\t{line[(len(line)) - 3]}\n')
-            else:
-                flow_value = flow_dict[srcToDest]
-                srcToDest = srcToDest.split('.')
-                output_file_txt.write(f'{srcToDest[0]} {srcToDest[1]}\t\t{flow_value}\t\t0\n')
-
-        output_file_txt.write(';\n\n')
-
-        # printing length values
-        output_file_txt.write("l[i,j,k] :=\n")
-        min_length = 7
-        # print(l_variable_start,l_variable_end)
-
-        for i in range(l_variable_start, l_variable_end):
-            links = re.findall(r'(\d+)\s*\.(\d+)\s*\.(\d+)', arr[i])
-            line = arr[i].strip().split()
-            if line[len(line) - 3] == '.':
-                continue
-            length_value = float(line[len(line) - 3])
-            output_file_txt.write(f'{links[0][0]}  {links[0][1]}  {links[0][2]}\t{length_value}\n')
-        output_file_txt.write(';\n\n')
+        # NOTE: Errors are handled by the caller, i.e. `self.check_errors()`
+        gams_listing_to_ampl_output(gams_file_path, output_file_path, 'm2')
 
-        output_file_txt.write(f'_total_solve_time = {total_execution_time}\n\n')
-
-        # **** OBJECTIVE VALUE
-        best_solution = re.search(r"\*\*\*\* OBJECTIVE VALUE\s+([0-9]+\.[0-9]+)", gams_file_text, re.M).group(
-            1)  # if there is no value then 'NoneType' object has no attribute 'group'
-        output_file_txt.write(f'total_cost = {best_solution}')
+    @staticmethod
+    def listing_file_path(exec_info: 'NetworkExecutionInformation') -> str:
+        """Returns: path of the GAMS listing file (`o=` option of GAMS) of the solver instance"""
+        return f'{exec_info.uniq_exec_output_dir.resolve()}/' \
+               f'{exec_info.data_file_hash}{exec_info.short_uniq_model_name}{exec_info.prefix}.lst'
 
     def check_errors(self, exec_info: 'NetworkExecutionInformation') -> Tuple[bool, str]:
-        """By default, it is assumed that everything is ok (i.e. error free)"""
+        """
+        Check the listing file of GAMS, and convert the solution to the format of the values displayed by AMPL in
+        `std_out_err.txt` (the output of GAMS is kept in `gams_terminal_output.txt`). Only the files in
+        `exec_info.uniq_exec_output_dir` are read and written
+        """
 
         try:
-            output_file_directory = exec_info.uniq_exec_output_dir  # move the output files in this directory
+            output_file_directory = exec_info.uniq_exec_output_dir  # all the output files are in this directory
             g_logger.info(f'gams output file {output_file_directory}')
 
             model_name = exec_info.short_uniq_model_name
@@ -956,28 +870,25 @@ class SolverOutputAnalyzerAlphaecp(SolverOutputAnalyzerParent):
             model_idx = exec_info.idx
             g_logger.info(model_idx)
 
-            prefix = exec_info.prefix
-            g_logger.info(prefix)
-
-            data_file_hash = exec_info.data_file_hash
-
-            source_file = f'{data_file_hash}{model_name}.lst'
-            copy_source_file = f'{data_file_hash}{model_name}{prefix}.lst'
-            shutil.copy(source_file, copy_source_file)
-
-            destination_address = f'{output_file_directory}/{copy_source_file}'
-            os.replace(copy_source_file, destination_address)
-            g_logger.info(f'gams output has been moved. os.replace({copy_source_file}, {destination_address})')
-
+            # NOTE: GAMS writes the listing file directly in `output_file_directory` (see `self.listing_file_path()`),
+            #       so nothing outside the directory of this solver instance is touched. This is required because
+            #       the solver instances are checked in parallel, see `map_solver_instances()`
+            destination_address = self.listing_file_path(exec_info)
             gams_output_file = open(destination_address, 'r').read()
 
             gams_licensing_error = re.search(r"Terminated due to a licensing error", gams_output_file)
             if gams_licensing_error:
                 return False, "Terminated due to licensing error"
 
-            solver_status = re.search(r"SOLVER STATUS\s+(\d+)", gams_output_file).group(1)
-
-            model_status = re.search(r"MODEL STATUS\s+(\d+)", gams_output_file).group(1)
+            # Written by the program of `solution_export_program()`. It is absent if GAMS stopped before the `solve`
+            # statement finished, or if the `.gms` file was run directly, then the listing file is parsed instead
+            solution_file_path = f'{output_file_directory}/{SOLUTION_CSV_FILE_NAME}'
+            solution = read_solution_csv(solution_file_path) if os.path.isfile(solution_file_path) else None
+            if solution is not None:
+                solver_status, model_status = solution.solver_status, solution.model_status
+            else:
+                solver_status = int(re.search(r"SOLVER STATUS\s+(\d+)", gams_output_file).group(1))
+                model_status = int(re.search(r"MODEL STATUS\s+(\d+)", gams_output_file).group(1))
 
             if model_status == 4:
                 return False, "Solution was infeasible"
@@ -990,7 +901,9 @@ class SolverOutputAnalyzerAlphaecp(SolverOutputAnalyzerParent):
 
             current_std_error = exec_info.uniq_std_out_err_file_path
             rename_std_out_err = f'{output_file_directory}/gams_terminal_output.txt'
-            shutil.copy(current_std_error, rename_std_out_err)
+            # `std_out_err.txt` was already converted if this is not the first call for `exec_info`
+            if not os.path.isfile(rename_std_out_err):
+                shutil.copy(current_std_error, rename_std_out_err)
 
             g_logger.info("gams terminal output has been changed to std_err_out file and std_err_out has been deleted")
 
@@ -1000,18 +913,12 @@ class SolverOutputAnalyzerAlphaecp(SolverOutputAnalyzerParent):
             except OSError as e:
                 print("Error while deleting the gams output file. Erorr : %s - %s." % (e.filename, e.strerror))
 
-            copy_source_file_path = f'{output_file_directory}/{copy_source_file}'
-            if model_name == 'm1':
-                self.gams_to_ampl_parser_m1(copy_source_file_path, current_std_error)
+            if solution is not None:
+                solution.write_ampl_output(current_std_error, model_name)
+            elif model_name == 'm1':
+                self.gams_to_ampl_parser_m1(destination_address, current_std_error)
             else:
-                self.gams_to_ampl_parser_m2(copy_source_file_path, current_std_error)
-
-            #     delete the .lst file after processing for 1 hr
-            if prefix == '1hour':
-                try:
-                    os.remove(source_file)
-                except OSError as e:
-                    print("Error while deleting the gams output file. Erorr : %s - %s." % (e.filename, e.strerror))
+                self.gams_to_ampl_parser_m2(destination_address, current_std_error)
 
         except Exception as e:
             g_logger.error(f'CHECKME: {type(e)}, error:\n{e}')
@@ -1025,43 +932,24 @@ class SolverOutputAnalyzerAlphaecp(SolverOutputAnalyzerParent):
         # Extract the solution from the std_out_err file using the value printed by the AMPL commands:
         #     option display_precision 0;
         #     display total_cost;
-        try:
-            file_txt = open(exec_info.uniq_std_out_err_file_path, 'r').read()
-            best_solution = re.search(r'^total_cost\s*=\s*(.*)$', file_txt, re.M).group(1)
-            best_solution_string = str(best_solution)
-            best_solution = float(best_solution)
+        best_solution = exec_info.log_follower.update().total_cost
+        if best_solution is not None:
             ok = True
-            if best_solution == 0 or best_solution > 1e40 or len(best_solution_string) == 0:
+            if best_solution == 0 or best_solution > 1e40:
                 g_logger.warning(f"Probably an infeasible solution found by alphaecp: '{best_solution}'")
                 g_logger.info(f'Instance={exec_info}')
                 ok = False
             return ok, best_solution
-        except Exception as e:
-            g_logger.error(f'CHECKME: {type(e)}, error:\n{e}')
-            g_logger.debug(
-                'Probably, alphaecp did not terminate immediately even after receiving the appropriate signal')
+        g_logger.error(f'CHECKME: `total_cost` not found in {exec_info.uniq_std_out_err_file_path=}')
+        g_logger.debug('Probably, alphaecp did not terminate immediately even after receiving the appropriate signal')
 
         g_logger.info('Using fallback mechanism to extract the best solution')
 
-        csv = self.__alphaecp_extract_output_table(exec_info.uniq_std_out_err_file_path)
-        if csv == '':
-            return False, 0.0
-        lines = csv.split('\n')
-        lines = [line for line in lines if line != ',' and (not line.startswith('Processing file'))]
-        g_logger.debug(f'{lines=}')
-
-        ok = len(lines) > 0
-        best_solution = 0.0
-        if len(lines) > 0:
-            best_solution = float(lines[-1].split(',')[1])
-        if best_solution > 1e40:
-            g_logger.warning(f"Probably an infeasible solution found by alphaecp: '{lines[-1]}'")
-            g_logger.info(f'Instance={exec_info}')
-            ok = False
-        return ok, best_solution
+        return self.extract_best_solution_from_progress(exec_info, 'alphaecp')
 
     def check_solution_found(self, exec_info: 'NetworkExecutionInformation') -> bool:
-        return self.extract_best_solution(exec_info)[0]
+        # Only the bytes appended since the last call are parsed, see `SolverLogFollower`
+        return exec_info.log_follower.update().solution_found()
 
 
 class SolverOutputAnalyzerOcteract(SolverOutputAnalyzerParent):
@@ -1083,27 +971,21 @@ class SolverOutputAnalyzerOcteract(SolverOutputAnalyzerParent):
             process_name_to_stop_using_ctrl_c = 'mpirun'
         super().__init__(engine_path, engine_options, process_name_to_stop_using_ctrl_c)
 
-    def __octeract_extract_output_table(self, std_out_err_file_path: str) -> str:
-        return run_command_get_output(f"bash output_table_extractor_octeract.sh '{std_out_err_file_path}'", '')
-
     def extract_best_solution(self, exec_info: 'NetworkExecutionInformation') -> Tuple[bool, float]:
         # Extract the solution from the std_out_err file using the value printed by the AMPL commands:
         #     option display_precision 0;
         #     display total_cost;
-        try:
-            file_txt = open(exec_info.uniq_std_out_err_file_path, 'r').read()
-            best_solution = re.search(r'^total_cost\s*=\s*(.*)$', file_txt, re.M).group(1)
-            best_solution = float(best_solution)
+        best_solution = exec_info.log_follower.update().total_cost
+        if best_solution is not None:
             ok = True
             if best_solution == 0 or best_solution > 1e40:
                 g_logger.warning(f"Probably an infeasible solution found by Octeract: '{best_solution}'")
                 g_logger.info(f'Instance={exec_info}')
                 ok = False
             return ok, best_solution
-        except Exception as e:
-            g_logger.error(f'CHECKME: {type(e)}, error:\n{e}')
-            g_logger.debug('Probably, Octeract did not terminate immediately '
-                           'even after receiving the appropriate signal')
+        g_logger.error(f'CHECKME: `total_cost` not found in {exec_info.uniq_std_out_err_file_path=}')
+        g_logger.debug('Probably, Octeract did not terminate immediately '
+                       'even after receiving the appropriate signal')
 
         g_logger.info('Using fallback mechanism to extract the best solution')
 
@@ -1122,119 +1004,24 @@ class SolverOutputAnalyzerOcteract(SolverOutputAnalyzerParent):
                                         file_txt.find('\n', idx_found_solution + 120)])
                 pass
 
-        # Use bash script to extract the values from the table printed to output by Octeract
-        csv = self.__octeract_extract_output_table(exec_info.uniq_std_out_err_file_path)
-        if csv == '':
-            return False, 0.0
-        lines = csv.split('\n')
-        lines = [line for line in lines if line != ',' and (not line.startswith('Processing file'))]
-        g_logger.debug(f'{lines=}')
-
-        status = len(lines) > 0
-        best_solution = 0.0
-        g_logger.info(f'Instance={exec_info}')
-        if len(lines) > 0:
-            last_line_splitted = lines[-1].split(',')
-            if len(last_line_splitted) > 2:
-                if last_line_splitted[-1] == '(I)':
-                    g_logger.warning(f"Infeasible solution found by Octeract: '{lines[-1]}'")
-                    status = False
-                else:
-                    g_logger.warning(f"FIXME: Unhandled unknown case, probably an infeasible "
-                                     f"solution found by Octeract: '{lines[-1]}'")
-            else:
-                best_solution = float(last_line_splitted[1])
-        g_logger.debug((status, best_solution))
-        return status, best_solution
+        return self.extract_best_solution_from_progress(exec_info, 'Octeract')
 
     def check_solution_found(self, exec_info: 'NetworkExecutionInformation') -> bool:
-        return self.extract_best_solution(exec_info)[0]
+        # Only the bytes appended since the last call are parsed, see `SolverLogFollower`
+        return exec_info.log_follower.update().solution_found()
 
     def check_errors(self, exec_info: 'NetworkExecutionInformation') -> Tuple[bool, str]:
-        file_txt = open(exec_info.uniq_std_out_err_file_path, 'r').read()
-
-        if 'Found solution during preprocessing' in file_txt:
-            return True, 'Solution found during preprocessing'
-        if 'Iteration            GAP               LLB          BUB            Pool       Time       Mem' in file_txt:
-            return True, 'Probably No Errors'
-
-        ok, err_msg = self.ampl_check_errors(file_txt)
-        if not ok:
-            return ok, err_msg
-
-        try:
-            err_idx = re.search(r'''Can't\s+find\s+file\s+['"]?.+['"]?''', file_txt).start()
-            g_logger.debug(file_txt[err_idx:])
-            return False, file_txt[err_idx:]
-        except IndexError as e:
-            g_logger.error(f'{type(e)}: {e}')
-            g_logger.debug(f'{exec_info.uniq_std_out_err_file_path=}')
-        except AttributeError as e:
-            # re.search failed, returned `None`
-            g_logger.debug(f'{type(e)}: {e}')
-            g_logger.debug(f'{exec_info.uniq_std_out_err_file_path=}')
-        except Exception as e:
-            g_logger.error(f'FIXME: {type(e)}:\n{e}')
-
-        err_idx = None
-        try:
-            err_idx = file_txt.index('Request_Error')
-            err_msg = file_txt[err_idx:file_txt.index('exit value 1', err_idx)].replace('\n', ' ').strip()
-            g_logger.debug(err_msg)
-            return False, err_msg
-        except ValueError:
-            if err_idx is not None:
-                g_logger.debug(file_txt[err_idx:])
-                return False, file_txt[err_idx:]
-            pass  # substring not found
-
-        # Octeract solver failed to establish connection to their server. Hence, it does not proceed
-        # with the solving.
-        err_idx = None
-        try:
-            err_idx = file_txt.index('Error: Failed to establish connection to server.')
-            if ("----------------------------------------------------------------------"
-                "--------------------------" not in file_txt) or "can't open /tmp/at" in file_txt:
-                err_msg = file_txt[err_idx:file_txt.index('ampl:', err_idx)].replace('\n', ' ').strip()
-                g_logger.debug(err_msg)
-                return False, err_msg
-            else:
-                g_logger.debug(f'CHECKME: {file_txt[err_idx:]=}')
-        except ValueError:
-            if err_idx is not None:
-                g_logger.debug(file_txt[err_idx:])
-                return False, file_txt[err_idx:]
-            pass  # substring not found
-
-        try:
-            err_idx = file_txt.index('presolve messages suppressed')
-            if '_total_solve_time' in file_txt:
-                err_msg = file_txt[:file_txt.index('_total_solve_time')]
-            else:
-                err_msg = file_txt[:err_idx + len('presolve messages suppressed') + 1]
-            err_msg = err_msg.strip()
-            g_logger.debug(err_msg)
-            return False, err_msg
-        except ValueError:
-            pass  # substring not found
-
-        try:
-            if 'all variables eliminated, but lower bound' in file_txt:
-                err_idx = file_txt.index('_total_solve_time')
-                err_msg = file_txt[:err_idx]
-                g_logger.debug(err_msg)
-                return False, err_msg
-        except ValueError:
-            pass  # substring not found
-
-        return True, 'No Errors'
+        return self.scan_errors(OCTERACT_ERROR_SCANNER, exec_info)
 
     def __octeract_extract_solution_file_path(self, exec_info: 'NetworkExecutionInformation') -> Tuple[bool, str]:
-        file_txt = open(exec_info.uniq_std_out_err_file_path, 'r').read()
-        solution_file_name = re.search(r'Solution file written to: /tmp/(.+)', file_txt).group(1)
-        if solution_file_name == '':
-            g_logger.debug(f"FIXME: log file path='{exec_info.uniq_std_out_err_file_path}', file_txt:\n{file_txt}")
+        # Printed by Octeract at the end, so the file is searched backwards
+        with MappedFile(exec_info.uniq_std_out_err_file_path) as log:
+            line = log.last_line_containing(b'Solution file written to:')
+        match = None if line is None else re.search(r'Solution file written to: /tmp/(.+)', line)
+        if match is None or match.group(1) == '':
+            g_logger.debug(f"FIXME: log file path='{exec_info.uniq_std_out_err_file_path}', {line=}")
             return False, 'RegEx search failed'
+        solution_file_name = match.group(1)
         return True, (pathlib.Path(exec_info.aes.OUTPUT_DIR_LEVEL_1_DATA) / solution_file_name).resolve()
 
     def extract_solution_vector(self, exec_info: 'NetworkExecutionInformation') -> Tuple[bool, str, float, str]:
@@ -1251,6 +1038,162 @@ class SolverOutputAnalyzerOcteract(SolverOutputAnalyzerParent):
         return True, file_to_parse, objective_value, solution_vector
 
 
+# ---
+
+class SolverSlotScheduler:
+    # Free RAM and Swap change without any notification, so they are re-checked at this interval while waiting
+    MEMORY_CHECK_INTERVAL = 2.0  # seconds
+
+    def __init__(self, max_slots: int, min_free_ram: float = 0.0, min_free_swap: float = 0.0):
+        """
+        Admission scheduler which limits the total number of CPU cores used by the solver instances launched by this
+        process, and launches a solver instance only if there is enough RAM for it. One object of this class is
+        shared by all the requests handled by the daemon (see `--daemon`), so that all of them have the same view
+        of the server.
+
+        Args:
+            max_slots: Maximum number of CPU cores which can be used by all the solver instances put together
+            min_free_ram: RAM (GiB) which should remain available after the RAM required by a new solver instance
+            min_free_swap: Free Swap (GiB) required to launch a solver instance, not checked if the system has less
+                           Swap than this
+        """
+        self.max_slots: int = max(1, int(max_slots))
+        self.used_slots: int = 0
+        self.min_free_ram: float = min_free_ram
+        self.min_free_swap: float = min_free_swap
+        # RAM (GiB) expected to be used by the admitted solver instances which they have not started using yet
+        self.reserved_ram: float = 0.0
+        self.__condition = threading.Condition()
+        # Callers of `self.acquire()` are admitted in the order in which they started waiting, so that a solver
+        # instance requiring more resources does not wait forever (e.g. networks given using `-p` are solved in order)
+        self.__waiting: Deque[object] = collections.deque()
+
+    def __memory_available(self, ram: float) -> bool:
+        if self.used_slots == 0:
+            # Nothing launched by this process is running, so waiting will not free any memory
+            return True
+        meminfo = read_meminfo()
+        available_ram = meminfo.get('MemAvailable', 0.0) - self.reserved_ram
+        if available_ram - ram < self.min_free_ram:
+            return False
+        if meminfo.get('SwapTotal', 0.0) >= self.min_free_swap > meminfo.get('SwapFree', 0.0):
+            return False
+        return True
+
+    def acquire(self, n: int, timeout: Optional[float] = None, ram: float = 0.0) -> bool:
+        """
+        Reserve `n` slots and `ram` GiB of RAM. Wait for at most `timeout` seconds (`None` means wait forever) for
+        them to become free.
+
+        Returns:
+            True if the slots were reserved, otherwise False
+        """
+        # A solver instance asking for more slots than what exist should still be able to run, alone
+        n = min(n, self.max_slots)
+        end_time = None if timeout is None else time.time() + timeout
+        ticket = object()
+        with self.__condition:
+            self.__waiting.append(ticket)
+            try:
+                while True:
+                    if self.__waiting[0] is ticket and self.used_slots + n <= self.max_slots \
+                            and self.__memory_available(ram):
+                        break
+                    wait_time = self.MEMORY_CHECK_INTERVAL
+                    if end_time is not None:
+                        wait_time = min(wait_time, end_time - time.time())
+                        if wait_time <= 0:
+                            return False
+                    self.__condition.wait(wait_time)
+                self.used_slots += n
+                self.reserved_ram += ram
+                return True
+            finally:
+                self.__waiting.remove(ticket)
+                # The next caller in the queue may be admitted now
+                self.__condition.notify_all()
+
+    def release(self, n: int, ram: float = 0.0) -> None:
+        """
+        Return `n` slots and `ram` GiB of the reserved RAM. `n` is 0 when a running solver instance has started
+        using the RAM reserved for it (i.e. it is now accounted for in "MemAvailable").
+        """
+        with self.__condition:
+            self.used_slots = max(0, self.used_slots - n)
+            self.reserved_ram = max(0.0, self.reserved_ram - ram)
+            self.__condition.notify_all()
+
+
+# ---
+
+class SolverCompletionNotifier:
+    # Used only for the processes which cannot be watched using a pidfd (i.e. `os.pidfd_open` is not available)
+    POLL_INTERVAL = 1.0  # seconds
+
+    def __init__(self):
+        """
+        Wake up the orchestrator the moment any of the registered solver instances exits, instead of checking
+        the running instances at regular intervals. A pidfd (REFER: `man 2 pidfd_open`) becomes readable when the
+        process exits, so all of them are waited upon at once using `selectors`.
+        """
+        self.__selector = selectors.DefaultSelector()
+        # Solver instances for which a pidfd could not be created
+        self.__polled: List['NetworkExecutionInformation'] = list()
+
+    def register(self, info: 'NetworkExecutionInformation') -> None:
+        if info.tmux_bash_pid in (None, '0', 0):
+            return
+        try:
+            pidfd = os.pidfd_open(int(info.tmux_bash_pid))
+        except (AttributeError, OSError) as e:
+            # `AttributeError` -> Python < 3.9 or non-Linux OS, `ProcessLookupError` -> the process already exited
+            g_logger.debug(f'pidfd not available for {info=}, {type(e)}: {e}')
+            self.__polled.append(info)
+            return
+        self.__selector.register(pidfd, selectors.EVENT_READ, info)
+
+    def wait(self, timeout: float) -> List['NetworkExecutionInformation']:
+        """
+        Block until at least one registered solver instance exits, or until `timeout` seconds have passed
+
+        Returns:
+            Solver instances which exited since the last call (each instance is returned only once)
+        """
+        deadline = time.time() + max(0.0, timeout)
+        while True:
+            exited = [info for info in self.__polled if not info.is_running()]
+            for info in exited:
+                self.__polled.remove(info)
+
+            select_timeout = 0.0 if len(exited) > 0 else max(0.0, deadline - time.time())
+            if len(self.__polled) > 0:
+                select_timeout = min(select_timeout, SolverCompletionNotifier.POLL_INTERVAL)
+            if len(self.__selector.get_map()) == 0:
+                time.sleep(select_timeout)
+                events = list()
+            else:
+                events = self.__selector.select(select_timeout)
+
+            for key, _ in events:
+                self.__selector.unregister(key.fd)
+                os.close(key.fd)
+                info: NetworkExecutionInformation = key.data
+                if info.process is not None:
+                    # Reap the child (i.e. `os.waitpid`) so that it does not remain a zombie
+                    info.process.poll()
+                exited.append(info)
+
+            if len(exited) > 0 or time.time() >= deadline:
+                return exited
+
+    def close(self) -> None:
+        for key in list(self.__selector.get_map().values()):
+            self.__selector.unregister(key.fd)
+            os.close(key.fd)
+        self.__selector.close()
+        self.__polled.clear()
+
+
 # ---
 
 class NetworkExecutionInformation:
@@ -1259,6 +1202,23 @@ class NetworkExecutionInformation:
         This constructor will set all data members except `self.tmux_bash_pid`
         """
         self.tmux_bash_pid: Union[str, None] = None  # This has to be set manually
+        # Set only when `aes.launcher == 'direct'`, `self.tmux_bash_pid` is then the PID of this process
+        self.process: Optional[subprocess.Popen] = None
+        # Number of slots of `aes.scheduler` reserved by this solver instance, this has to be set manually
+        self.scheduler_slots: int = 0
+        # RAM (GiB) expected to be used by this solver instance, see `get_learned_ram_requirement()`, and the part
+        # of it still reserved in `aes.scheduler` (i.e. not used yet). Both of these have to be set manually
+        self.expected_ram: float = 0.0
+        self.scheduler_ram: float = 0.0
+        # Peak RAM (GiB) used by the process tree of this solver instance, see `self.update_memory_usage()`
+        self.peak_ram: float = 0.0
+        # Constraint violations of the solution found by this solver instance, see `verify_solution()`
+        self.verification: Optional[VerificationResult] = None
+        # Set after the solver instance has finished, see `analyze_solver_instance()`
+        self.analysis: Optional['SolverInstanceAnalysis'] = None
+        # Result of `self.solver_info.check_errors()` for the last seen size and modification time of
+        # `self.uniq_std_out_err_file_path`, see `ErrorScanner.check_file()`
+        self.error_check_cache: Dict[str, Tuple[Tuple[int, int], Tuple[bool, str]]] = dict()
         self.idx: int = idx
         self.aes: 'AutoExecutorSettings' = aes
         self.solver_name, self.model_name = aes.solver_model_combinations[idx]
@@ -1290,8 +1250,32 @@ class NetworkExecutionInformation:
             pathlib.Path(aes.output_dir_level_1_network_specific) / self.short_uniq_combination
 
         self.uniq_tmux_session_name: str = f'{aes.TMUX_UNIQUE_PREFIX}{self.short_uniq_combination}'
-        self.uniq_pid_file_path: str = f'/tmp/pid_{self.short_uniq_combination}.txt'
+        self.uniq_pid_file_path: str = f'/tmp/pid_{self.uniq_tmux_session_name}.txt'
         self.uniq_std_out_err_file_path: str = f'{self.uniq_exec_output_dir.resolve()}/std_out_err.txt'
+        # Parses `self.uniq_std_out_err_file_path` incrementally, see `SolverLogFollower`
+        self.log_follower = SolverLogFollower(self.uniq_std_out_err_file_path, self.solver_name)
+
+    def is_running(self) -> bool:
+        """Returns: Whether the solver instance (i.e. AMPL/GAMS process or its tmux session) is still running"""
+        if self.process is not None:
+            # NOTE: `ps -p` can not be used here because it reports the exited child as running until it is reaped
+            return self.process.poll() is None
+        if self.tmux_bash_pid in (None, '0', 0):
+            return False
+        return get_process_running_status(self.tmux_bash_pid)
+
+    def update_memory_usage(self, snapshot: ProcessTreeSnapshot) -> None:
+        """
+        Update `self.peak_ram` using `snapshot`, and return the part of `self.scheduler_ram` which this solver
+        instance has started using to `aes.scheduler` (it is now accounted for in the free RAM of the system)
+        """
+        if self.tmux_bash_pid in (None, '0', 0):
+            return
+        self.peak_ram = max(self.peak_ram, snapshot.memory_usage(self.tmux_bash_pid)[1])
+        still_reserved_ram = min(self.scheduler_ram, max(0.0, self.expected_ram - self.peak_ram))
+        if still_reserved_ram < self.scheduler_ram and self.aes.scheduler is not None:
+            self.aes.scheduler.release(0, self.scheduler_ram - still_reserved_ram)
+            self.scheduler_ram = still_reserved_ram
 
     def __str__(self):
         return f'NetworkExecutionInformation[pid={self.tmux_bash_pid}, idx={self.idx}, solver={self.solver_name}, ' \
@@ -1306,14 +1290,40 @@ class NetworkExecutionInformation:
 # ---
 
 
+class EarlyTermination(NamedTuple):
+    # `kind` values, see `get_early_termination_reason()`
+    OPTIMAL = 'optimal'
+    TARGET = 'target'
+    PLATEAU = 'plateau'
+
+    # The best solution is known to be optimal (`OPTIMAL`), or it is only as good as what was asked for using
+    # `--target-cost`/`--target-gap` (`TARGET`) or `--plateau-time` (`PLATEAU`)
+    kind: str
+    message: str
+
+    def __str__(self):
+        return self.message
+
+
+# ---
+
+
 class AutoExecutorSettings:
     # Level 0 is main directory inside which everything will exist
     OUTPUT_DIR_LEVEL_0 = './NetworkResults/'.rstrip('/')  # Note: Do not put trailing forward slash ('/')
     OUTPUT_DIR_LEVEL_1_DATA = f'{OUTPUT_DIR_LEVEL_0}/SolutionData'
+    # Binary cache of the parsed networks, see `CalculateNetworkCost_NetworkParser.load_network()`
+    NETWORK_CACHE_DIR = f'{OUTPUT_DIR_LEVEL_0}/NetworkCache'
     # Please ensure that proper escaping of white spaces and other special characters
     # is done because this will be executed in a fashion similar to `./a.out`
     AMPL_PATH = './ampl.linux-intel64/ampl'
     GAMS_PATH = '/opt/gams/gams42.3_linux_x64_64_sfx/gams'
+    # Shared by all the requests handled by this process, see `AutoExecutorSettings.get_nl_stub()`
+    NL_STUB_CACHE = NlStubCache(f'{OUTPUT_DIR_LEVEL_0}/NlStubCache', AMPL_PATH)
+    # GAMS source of model m1/m2 for every network solved using GAMS, see `AutoExecutorSettings.start_solver_gams()`
+    GMS_CACHE = GmsCache(f'{OUTPUT_DIR_LEVEL_0}/GmsCache')
+    # Shared by all the requests handled by this process, see `map_solver_instances()`
+    ANALYSIS_POOL = concurrent.futures.ThreadPoolExecutor(thread_name_prefix='CNC_analysis')
     AVAILABLE_SOLVERS = ['alphaecp', 'baron', 'octeract',
                          'knitro']  # NOTE: Also look at `__update_solver_dict()` method when updating this
     AVAILABLE_MODELS = {1: 'm1_basic.R', 2: 'm2_basic2_v2.R', 3: 'm3_descrete_segment.R', 4: 'm4_parallel_links.R'}
@@ -1326,6 +1336,7 @@ class AutoExecutorSettings:
         self.r_max_parallel_solvers = 44
         # Time is in seconds, set this to any value <= 0 to ignore this parameter
         self.r_execution_time_limit = (0 * 60 * 60) + (5 * 60) + 0
+        # Used by `SolverSlotScheduler` to decide when a solver instance can be launched
         self.r_min_free_ram = 2  # GiB
         self.r_min_free_swap = 8  # GiB, usefulness of this variable depends on the swappiness of the system
         self.prefix = ''
@@ -1338,9 +1349,59 @@ class AutoExecutorSettings:
         # Path to graph/network (i.e. data/testcase file)
         self.data_file_path: str = ''
         self.data_file_hash: str = ''
+        # Parsed graph/network, None if it is not a data file of model m1/m2
+        self.network: Optional[NetworkData] = None
+        # A solution is rejected if it violates any constraint of the model by more than this, see `verify_solution()`
+        self.r_verification_tolerance = 1.0
+        # See `get_network_size()`
+        self.network_size: int = 0
         self.output_dir_level_1_network_specific: str = ''
         self.output_network_specific_result: str = ''
         self.output_result_summary_file: str = ''
+        # Shared by all the requests handled by this process, see `SolverSlotScheduler`
+        self.scheduler: Optional[SolverSlotScheduler] = None
+        # 'direct' = child process in its own process group, 'tmux' = inside a tmux session (can be attached to)
+        self.launcher = 'direct'
+        # All solver instances started using `self.start_solver*()`
+        self.launched_instances: List[NetworkExecutionInformation] = list()
+        self.completion_notifier = SolverCompletionNotifier()
+        # Stop all solver instances as soon as the optimal solution is known, see `get_early_termination_reason()`
+        self.r_race = True
+        # Relative gap between upper and lower bound at which the solution is considered optimal
+        self.r_race_tolerance = 1e-4
+        # Stop all solver instances once the best feasible solution is <= this, None to disable
+        self.r_target_cost: Optional[float] = None
+        # Stop all solver instances once the relative gap between best upper and lower bound is <= this, None to disable
+        self.r_target_gap: Optional[float] = None
+        # Stop all solver instances once the best feasible solution has not improved by more than
+        # `self.r_plateau_tolerance` (relative) for this many seconds, None to disable, see `IncumbentPlateau`
+        self.r_plateau_time: Optional[float] = None
+        self.r_plateau_tolerance = 1e-3
+        # The solver instances are never stopped due to a plateau before this many seconds
+        self.r_plateau_min_time = 60
+        self.plateau: Optional[IncumbentPlateau] = None
+        # Maximum time (in seconds) for which the solver instances are kept running after the time limit if none of
+        # them has found a feasible solution, see `main_give_extra_time_if_no_solution_found()`
+        self.r_max_extra_time = 300
+        # Reason due to which all solver instances were stopped before their time limit, None if they were not
+        self.early_termination_reason: Optional[EarlyTermination] = None
+        # Reuse the result of an earlier run on the same network with an equal or longer time limit, see
+        # `main_use_cached_result()`
+        self.r_use_cache = True
+        # Start the solvers from the best solution found by an earlier run on the same network, see
+        # `main_load_warm_start()`
+        self.r_warm_start = True
+        self.warm_start_solution: Optional[AmplSolution] = None
+        # 'all' = launch all the solver-model combinations, 'auto' = launch only the `self.r_portfolio_size`
+        # combinations which won most often on similar networks, see `main_select_portfolio()`
+        self.r_portfolio = 'all'
+        self.r_portfolio_size = 2
+        # Signature of the network, None if it is not a data file of model m1/m2, see `main_load_warm_start()`
+        self.network_signature: Optional[NetworkSignature] = None
+        # Run the solvers directly on a cached `.nl` stub instead of a separate AMPL session for each of them, see
+        # `self.get_nl_stub()`. Model file name -> stub path (None if AMPL failed to write it)
+        self.r_use_nl_stub = True
+        self.nl_stubs: Dict[str, Optional[str]] = dict()
 
         self.__update_solver_dict()
 
@@ -1389,6 +1450,10 @@ class AutoExecutorSettings:
         self.r_execution_time_limit = self.r_execution_time_limit - 10
         self.__update_solver_dict()
 
+    def set_job_id(self, job_id: str) -> None:
+        """Make the tmux session names unique when multiple requests are handled by the same process"""
+        self.TMUX_UNIQUE_PREFIX = f'{AutoExecutorSettings.TMUX_UNIQUE_PREFIX}{job_id}_'
+
     def set_cpu_cores_per_solver(self, n: int) -> None:
         self.r_cpu_cores_per_solver = n
         self.__update_solver_dict()
@@ -1396,6 +1461,11 @@ class AutoExecutorSettings:
     def set_data_file_path(self, data_file_path: str, prefix: str) -> None:
         self.data_file_path = data_file_path
         self.data_file_hash = file_hash_sha256(data_file_path)
+        self.network = load_network(data_file_path, self.NETWORK_CACHE_DIR, self.data_file_hash)
+        if self.network is not None:
+            self.network_size = self.network.num_arcs * max(1, self.network.num_pipes)
+        else:
+            self.network_size = get_network_size(data_file_path)
         self.output_dir_level_1_network_specific = f'{AutoExecutorSettings.OUTPUT_DIR_LEVEL_0}' \
                                                    f'/{self.data_file_hash}'
         self.prefix = prefix
@@ -1407,7 +1477,9 @@ class AutoExecutorSettings:
 
     def start_solver(self, idx: int) -> NetworkExecutionInformation:
         """
-        Launch the solver using `tmux` and `AMPL` in background (i.e. asynchronously / non-blocking)
+        Launch the solver using `AMPL` in background (i.e. asynchronously / non-blocking). The solver is run directly
+        on the cached `.nl` stub if possible, see `self.get_nl_stub()`. The solvers run using GAMS (e.g. alphaecp)
+        are launched using `self.start_solver_gams()`
 
         Args:
             idx: Index of `self.solver_model_combinations`
@@ -1415,6 +1487,8 @@ class AutoExecutorSettings:
         Returns:
             `class NetworkExecutionInformation` object which has all the information regarding the execution
         """
+        if self.solvers[self.solver_model_combinations[idx][0]].uses_gams:
+            return self.start_solver_gams(idx)
         info = NetworkExecutionInformation(self, idx)
 
         info.uniq_exec_output_dir.mkdir(exist_ok=True)
@@ -1422,26 +1496,31 @@ class AutoExecutorSettings:
             g_logger.warning(f"Some directory(s) do not exist in the path: '{info.uniq_exec_output_dir.resolve()}'")
             info.uniq_exec_output_dir.mkdir(parents=True, exist_ok=True)
 
-        # REFER: https://stackoverflow.com/questions/2500436/how-does-cat-eof-work-in-bash
-        #        📝 'EOF' should be the only word on the line without any space before and after it.
-        # NOTE: The statement `echo > /dev/null` is required to make the below command work. Without
-        #       it, AMPL is not started. Probably, it has something to do with the `EOF` thing.
-        # NOTE: The order of > and 2>&1 matters in the below command
+        stub_path = self.get_nl_stub(info)
+        if stub_path is not None:
+            self.__start_solver_using_nl_stub(info, stub_path)
+            return info
+
         # REFER: https://github.com/fenilgmehta/Jaltantra-Code-and-Scripts/blob/main/Files/main.run
         #        For AMPL commands
-        run_command_get_output(rf'''
-            tmux new-session -d -s '{info.uniq_tmux_session_name}' '
-echo $$ > "{info.uniq_pid_file_path}"
-{self.AMPL_PATH} > "{info.uniq_std_out_err_file_path}" 2>&1 <<EOF
+        ampl_commands = rf'''
     reset;
     model "{info.models_dir}/{info.model_name}";
     data "{info.data_file_path}";
     option solver "{info.engine_path}";
     option presolve_eps 1e-9;
     {info.engine_options};
+{self.get_warm_start_commands(info)}
     solve;
-    ''' + r'''
-    display _total_solve_time;
+    ''' + self.get_display_commands(info, 'display _total_solve_time;')
+        self.__launch(info, [self.AMPL_PATH], ampl_commands)
+        return info
+
+    @staticmethod
+    def get_display_commands(info: NetworkExecutionInformation, display_solve_time_command: str) -> str:
+        """Returns: AMPL commands which display the solution, to be executed after the solver has finished"""
+        return r'''
+    ''' + display_solve_time_command + r'''
     option display_1col 9223372036854775807;
     option display_precision 6;
     display {i in nodes} h[i];
@@ -1449,33 +1528,91 @@ echo $$ > "{info.uniq_pid_file_path}"
     option display_eps 1e-4;
     option omit_zero_rows 1;
     display {(i,j) in arcs, k in pipes} l[i,j,k];
-    display _total_solve_time;
+    ''' + display_solve_time_command + r'''
     option display_precision 0;
     display total_cost;
-EOF
-echo > /dev/null
-'
-        ''', debug_print=self.debug)
-        # At max we wait for 60 seconds
-        pid_file_wait_time = 0
-        while (not os.path.exists(info.uniq_pid_file_path)) and (pid_file_wait_time < 60):
-            g_logger.info('PID file not generated. Sleeping for 1 second...')
-            pid_file_wait_time += 1
-            time.sleep(1)
-        if os.path.exists(info.uniq_pid_file_path):
-            info.tmux_bash_pid = run_command_get_output(f'cat "{info.uniq_pid_file_path}"')
-        else:
-            g_logger.error(f'FIXME: CHECKME: PID file not created for {info=}')
-            info.tmux_bash_pid = 0
-        return info
+'''
+
+    def get_nl_stub(self, info: NetworkExecutionInformation) -> Optional[str]:
+        """
+        Returns:
+            Path (without the `.nl` extension) of the stub of `info.model_name` and `self.data_file_path` in
+            `self.NL_STUB_CACHE`, it is written by AMPL the first time. None if `self.r_use_nl_stub` is False, the
+            solver options can not be passed without AMPL, or AMPL failed to write the stub
+        """
+        if not self.r_use_nl_stub or solver_options_environment(info.engine_options) is None:
+            return None
+        if info.model_name not in self.nl_stubs:
+            self.nl_stubs[info.model_name] = self.NL_STUB_CACHE.get(
+                f'{info.models_dir}/{info.model_name}',
+                info.data_file_path,
+                self.get_warm_start_let_statements(info),
+                timeout=(self.r_execution_time_limit if self.r_execution_time_limit > 0 else None)
+            )
+        return self.nl_stubs[info.model_name]
+
+    def __start_solver_using_nl_stub(self, info: NetworkExecutionInformation, stub_path: str) -> None:
+        """
+        Run the solver on a hard link of `stub_path` in `info.uniq_exec_output_dir` (so that every solver instance
+        writes its own `.sol` file), and then display the solution using AMPL. Both are done by `run.sh` because
+        the output of both should go to `std_out_err.txt`
+        """
+        instance_stub_path = f'{info.uniq_exec_output_dir.resolve()}/stub'
+        link_stub(stub_path, instance_stub_path)
+        if os.path.exists(instance_stub_path + '.sol'):
+            os.remove(instance_stub_path + '.sol')
+
+        options_name, options_value = solver_options_environment(info.engine_options)
+        if info.solver_name == 'baron' and self.warm_start_solution is not None \
+                and self.warm_start_solution.is_feasible and self.get_warm_start_let_statements(info) != '':
+            options_value += f' cutoff={baron_cutoff(self.warm_start_solution.total_cost)!r}'
+
+        # NOTE: `$SOLVE_TIME` is expanded by bash as the here-document delimiter is not quoted. It is the CPU time
+        #       (user + system) of the solver, same as `_total_solve_time` of AMPL, e.g. '1.234 + 0.056' which is
+        #       added by the AMPL `printf` command. The output of the solver goes to fd 3 (i.e. `std_out_err.txt`),
+        #       and only the output of `time` is captured
+        script_path = f'{info.uniq_exec_output_dir.resolve()}/run.sh'
+        with open(script_path, 'w') as f:
+            f.write(f'''#!/bin/bash
+# Generated by CalculateNetworkCost.py
+export {options_name}={shlex.quote(options_value)}
+exec 3>&1
+TIMEFORMAT='%3U + %3S'
+SOLVE_TIME=$( {{ time {shlex.quote(info.engine_path)} {shlex.quote(instance_stub_path)} -AMPL 1>&3 2>&3 ; }} 2>&1 )
+{shlex.quote(self.AMPL_PATH)} <<EOF
+    reset;
+    model "{info.models_dir}/{info.model_name}";
+    data "{info.data_file_path}";
+    option presolve_eps 1e-9;
+    solution "{instance_stub_path}.sol";
+''' + self.get_display_commands(info, r'printf "_total_solve_time = %s\n", $SOLVE_TIME;') + 'EOF\n')
+        self.__launch(info, ['bash', script_path], None)
+
+    def get_warm_start_let_statements(self, info: NetworkExecutionInformation) -> str:
+        """Returns: AMPL `let` statements which set the initial values of the variables of `info.model_name`"""
+        if self.warm_start_solution is None:
+            return ''
+        return self.warm_start_solution.ampl_let_statements(info.short_uniq_model_name)
+
+    def get_warm_start_commands(self, info: NetworkExecutionInformation) -> str:
+        """
+        Returns:
+            AMPL commands to be executed before `solve` which set the initial values of the variables (and the
+            objective cutoff for Baron) using `self.warm_start_solution`. Empty string if there is nothing to set
+        """
+        commands = self.get_warm_start_let_statements(info)
+        if commands == '':
+            return ''
+        if info.solver_name == 'baron' and self.warm_start_solution.is_feasible:
+            commands += '\n' + baron_cutoff_option(self.warm_start_solution.total_cost)
+        return commands
 
     def start_solver_gams(self, idx: int) -> NetworkExecutionInformation:
         """
-        Launch the solver using `tmux` and `gams` in background (i.e. asynchronously / non-blocking)
+        Launch the solver using `gams` in background (i.e. asynchronously / non-blocking)
 
         Args:
-            modelname: name of the solver
-            my_settings : Auto Executor Settings
+            idx: Index of `self.solver_model_combinations`
 
         Returns:
             `class NetworkExecutionInformation` object which has all the information regarding the execution
@@ -1487,33 +1624,95 @@ echo > /dev/null
             g_logger.warning(f"Some directory(s) do not exist in the path: '{info.uniq_exec_output_dir.resolve()}'")
             info.uniq_exec_output_dir.mkdir(parents=True, exist_ok=True)
 
-        data_file = info.data_file_path
+        # The GAMS source of the network is generated only once, REFER: `CalculateNetworkCost_Gams.GmsCache`
+        model_name = info.short_uniq_model_name
+        gms_file_path = None if self.network is None else self.GMS_CACHE.get(self.network, model_name)
+        if gms_file_path is None:
+            g_logger.error(f'GAMS source not available for {info.short_uniq_combination}, not launching it')
+            info.tmux_bash_pid = '0'
+            return info
 
-        data_file_name = data_file.replace(".R", "")
+        time_option = info.execution_time_limit - 20
 
-        if idx == 0:
-            data_file_name = data_file_name + 'm1.gms'
-        if idx == 1:
-            data_file_name = data_file_name + 'm2.gms'
+        # The `.gms` file is run through a wrapper which suppresses the listing and writes the solution to a CSV
+        # file, REFER: `CalculateNetworkCost_Gams.solution_export_program()`
+        solution_file_path = info.uniq_exec_output_dir.resolve() / SOLUTION_CSV_FILE_NAME
+        if solution_file_path.exists():
+            solution_file_path.unlink()
+        # Written by `SolverOutputAnalyzerAlphaecp.check_errors()` of an earlier run
+        terminal_output_path = info.uniq_exec_output_dir.resolve() / 'gams_terminal_output.txt'
+        if terminal_output_path.exists():
+            terminal_output_path.unlink()
+        export_program_path = info.uniq_exec_output_dir.resolve() / EXPORT_PROGRAM_FILE_NAME
+        export_program_path.write_text(solution_export_program(
+            str(pathlib.Path(gms_file_path).resolve()), model_name, str(solution_file_path)
+        ))
+        # NOTE: `o=` puts the listing file in the directory of the solver instance instead of the current working
+        #       directory, REFER: `SolverOutputAnalyzerAlphaecp.check_errors()`
+        listing_file_path = SolverOutputAnalyzerAlphaecp.listing_file_path(info)
+        self.__launch(
+            info, [self.GAMS_PATH, str(export_program_path), f'reslim={time_option}', f'o={listing_file_path}'], None
+        )
+        return info
 
-        time_option = info.execution_time_limit - 20
+    def __launch(self, info: NetworkExecutionInformation, cmd: List[str], stdin_text: Optional[str]) -> None:
+        """
+        Start `cmd` in background with its `stdout` and `stderr` written to `info.uniq_std_out_err_file_path`,
+        and set `info.tmux_bash_pid`. Uses `self.launcher` to decide how the process is started.
 
-        info.uniq_exec_output_dir.mkdir(exist_ok=True)
-        if not info.uniq_exec_output_dir.exists():
-            g_logger.warning(f"Some directory(s) do not exist in the path: '{info.uniq_exec_output_dir.resolve()}'")
-            info.uniq_exec_output_dir.mkdir(parents=True, exist_ok=True)
+        Args:
+            info: Solver instance which is being launched
+            cmd: Program and its arguments
+            stdin_text: Text to be written to `stdin` of `cmd` (e.g. AMPL commands), `None` if not required
+        """
+        if self.launcher == 'tmux':
+            self.__launch_using_tmux(info, cmd, stdin_text)
+        else:
+            self.__launch_directly(info, cmd, stdin_text)
+        self.launched_instances.append(info)
+        self.completion_notifier.register(info)
 
+    def __launch_directly(self, info: NetworkExecutionInformation, cmd: List[str], stdin_text: Optional[str]) -> None:
+        # NOTE: `start_new_session=True` puts the solver in its own process group. So, signals sent to this
+        #       program (e.g. Ctrl+C in the terminal) are not delivered to the solvers, same as with tmux.
+        try:
+            with open(info.uniq_std_out_err_file_path, 'w') as std_out_err_file:
+                info.process = subprocess.Popen(
+                    cmd,
+                    stdin=(subprocess.DEVNULL if stdin_text is None else subprocess.PIPE),
+                    stdout=std_out_err_file,
+                    stderr=subprocess.STDOUT,
+                    start_new_session=True
+                )
+            if stdin_text is not None:
+                info.process.stdin.write(stdin_text.encode())
+                info.process.stdin.close()
+        except OSError as e:
+            g_logger.error(f'FIXME: CHECKME: unable to launch {cmd=} for {info=}, {type(e)}: {e}')
+            info.process = None
+            info.tmux_bash_pid = '0'
+            return
+        info.tmux_bash_pid = str(info.process.pid)
+        if self.debug:
+            g_logger.debug(f'COMMAND: {cmd}, PID={info.tmux_bash_pid}')
+
+    def __launch_using_tmux(self, info: NetworkExecutionInformation, cmd: List[str], stdin_text: Optional[str]) -> None:
         # REFER: https://stackoverflow.com/questions/2500436/how-does-cat-eof-work-in-bash
         #        📝 'EOF' should be the only word on the line without any space before and after it.
         # NOTE: The statement `echo > /dev/null` is required to make the below command work. Without
         #       it, AMPL is not started. Probably, it has something to do with the `EOF` thing.
         # NOTE: The order of > and 2>&1 matters in the below command
-        # REFER: https://github.com/fenilgmehta/Jaltantra-Code-and-Scripts/blob/main/Files/main.run
-        #        For AMPL commands
+        # NOTE: `\EOF` disables the expansion of `$` in the here-document, which is used by the AMPL commands
+        #       (e.g. `$baron_options`, see `baron_cutoff_option()`)
+        cmd_str = ' '.join(f'"{i}"' for i in cmd)
         run_command_get_output(rf'''
             tmux new-session -d -s '{info.uniq_tmux_session_name}' '
 echo $$ > "{info.uniq_pid_file_path}"
-"{self.GAMS_PATH}" "{data_file_name}" reslim="{time_option}" > "{info.uniq_std_out_err_file_path}" 2>&1 <<EOF '
+{cmd_str} > "{info.uniq_std_out_err_file_path}" 2>&1 <<\EOF
+{'' if stdin_text is None else stdin_text}
+EOF
+echo > /dev/null
+'
         ''', debug_print=self.debug)
         # At max we wait for 60 seconds
         pid_file_wait_time = 0
@@ -1525,8 +1724,13 @@ echo $$ > "{info.uniq_pid_file_path}"
             info.tmux_bash_pid = run_command_get_output(f'cat "{info.uniq_pid_file_path}"')
         else:
             g_logger.error(f'FIXME: CHECKME: PID file not created for {info=}')
-            info.tmux_bash_pid = 0
-        return info
+            info.tmux_bash_pid = '0'
+
+    def count_running_solver_instances(self) -> int:
+        """Returns: Number of solver instances launched using these settings which are still running"""
+        if self.launcher == 'tmux':
+            return int(run_command(f'tmux ls 2> /dev/null | grep "{self.TMUX_UNIQUE_PREFIX}" | wc -l', '0', True)[1])
+        return sum(1 for info in self.launched_instances if info.is_running())
 
 
 # ---
@@ -1537,7 +1741,8 @@ class MonitorAndStopper:
             tmux_monitor_list: List[NetworkExecutionInformation],
             tmux_finished_list: List[NetworkExecutionInformation],
             execution_time_limit: float,
-            blocking: bool
+            blocking: bool,
+            completion_notifier: Optional[SolverCompletionNotifier] = None
     ) -> None:
         """
         Monitor and stop solver instances based on the time for which they have been running on the system
@@ -1546,7 +1751,8 @@ class MonitorAndStopper:
             tmux_monitor_list: List of Solver instances which are to be monitored
             tmux_finished_list: List of Solver instances which have been stopped in this iteration (initially this will be empty)
             execution_time_limit: Time in seconds. (This should be > 0)
-            blocking: Wait until one of the solver instance in `tmux_monitor_list` is stopped
+            blocking: Wait until one of the solver instance in `tmux_monitor_list` is stopped (or exits on its own)
+            completion_notifier: If given, then `blocking` wakes up as soon as any solver instance exits
         """
         if execution_time_limit <= 0.0:
             g_logger.error(f'FIXME: `execution_time_limit` is not greater than 0')
@@ -1557,42 +1763,73 @@ class MonitorAndStopper:
         to_run_the_loop = True
         while to_run_the_loop:
             to_run_the_loop = blocking
+            # One scan of "/proc" per iteration for all the monitored solver instances
+            snapshot = ProcessTreeSnapshot([ne_info.tmux_bash_pid for ne_info in tmux_monitor_list])
             for i, ne_info in enumerate(tmux_monitor_list):
-                if get_execution_time(ne_info.tmux_bash_pid) < execution_time_limit:
+                ne_info.update_memory_usage(snapshot)
+                if not ne_info.is_running():
+                    g_logger.info(f'Solver instance (with PID={ne_info.tmux_bash_pid}) exited on its own')
+                    tmux_finished_list_idx.append(i)
+                    tmux_finished_list.append(ne_info)
+                    to_run_the_loop = False
+                    continue
+                if snapshot.execution_time(ne_info.tmux_bash_pid) < execution_time_limit:
                     continue
-                # NOTE: only SIGINT signal (i.e. Ctrl+C) does proper termination of the octeract-engine
-                g_logger.debug(run_command_get_output(
-                    f"pstree -ap {ne_info.tmux_bash_pid}  # Time 1", debug_print=True
-                ))
-                g_logger.debug(run_command_get_output(
-                    f"pstree -ap {ne_info.tmux_bash_pid} | "
-                    f"grep -oE '{ne_info.solver_info.process_name_to_stop_using_ctrl_c},[0-9]+'  # Time 2"
-                ))
-                g_logger.debug(run_command_get_output(
-                    f"pstree -aps {ne_info.tmux_bash_pid} | "
-                    f"grep -oE '{ne_info.solver_info.process_name_to_stop_using_ctrl_c},[0-9]+'  # Time 3"
-                ))
-                success, pid = run_command(
-                    f"pstree -ap {ne_info.tmux_bash_pid} | "
-                    f"grep -oE '{ne_info.solver_info.process_name_to_stop_using_ctrl_c},[0-9]+' | "
-                    f"grep -oE '[0-9]+'  # Time Monitor 4",
-                    '0',
-                    True
-                )
                 tmux_finished_list_idx.append(i)
                 tmux_finished_list.append(ne_info)
                 to_run_the_loop = False
-                if success:
-                    g_logger.info(run_command_get_output(f'kill -s SIGINT {pid}  # Time Monitor', debug_print=True))
-                else:
-                    g_logger.info(f'TIME_LIMIT: tmux session (with bash PID={ne_info.tmux_bash_pid}) already finished')
+                MonitorAndStopper.sigint_solver(snapshot, ne_info, 'TIME_LIMIT')
                 time.sleep(2)
             for i in tmux_finished_list_idx[::-1]:
                 tmux_monitor_list.pop(i)
-            time.sleep(2)
+            if not to_run_the_loop:
+                break
+            if completion_notifier is not None:
+                completion_notifier.wait(2)
+            else:
+                time.sleep(2)
         g_logger.debug(f'{tmux_finished_list_idx=}')
         pass
 
+    @staticmethod
+    def mas_all(
+            tmux_monitor_list: List[NetworkExecutionInformation],
+            tmux_finished_list: List[NetworkExecutionInformation],
+            reason: str
+    ) -> None:
+        """
+        Stop all solver instances of `tmux_monitor_list` irrespective of the time for which they have been running,
+        and move them to `tmux_finished_list`
+
+        Args:
+            tmux_monitor_list: List of Solver instances which are to be stopped (this will be empty after the call)
+            tmux_finished_list: List of Solver instances which have been stopped
+            reason: Logged with every stopped instance
+        """
+        snapshot = ProcessTreeSnapshot([ne_info.tmux_bash_pid for ne_info in tmux_monitor_list])
+        for ne_info in tmux_monitor_list:
+            if ne_info.is_running():
+                MonitorAndStopper.sigint_solver(snapshot, ne_info, reason)
+        tmux_finished_list.extend(tmux_monitor_list)
+        tmux_monitor_list.clear()
+
+    @staticmethod
+    def sigint_solver(snapshot: ProcessTreeSnapshot, ne_info: NetworkExecutionInformation, reason: str) -> None:
+        """Send SIGINT to the solver process of `ne_info` so that it stops and returns its best solution to AMPL"""
+        # NOTE: only SIGINT signal (i.e. Ctrl+C) does proper termination of the octeract-engine
+        process_name = ne_info.solver_info.process_name_to_stop_using_ctrl_c
+        g_logger.debug(f'Process tree of {ne_info}:\n{snapshot.format_tree(ne_info.tmux_bash_pid)}')
+        pids_to_stop = snapshot.find_processes(ne_info.tmux_bash_pid, process_name)
+        for pid in pids_to_stop:
+            try:
+                os.kill(pid, signal.SIGINT)
+            except ProcessLookupError:
+                pass
+        if len(pids_to_stop) > 0:
+            g_logger.info(f'{reason}: SIGINT sent to "{process_name}" ({pids_to_stop=}) of {ne_info}')
+        else:
+            g_logger.info(f'{reason}: solver instance (with PID={ne_info.tmux_bash_pid}) already finished')
+
 
 def check_solution_status(tmux_monitor_list: List[NetworkExecutionInformation]) -> bool:
     """Return True if a feasible solution has been found by any one of the tmux session (i.e. solver-model combination)"""
@@ -1602,6 +1839,82 @@ def check_solution_status(tmux_monitor_list: List[NetworkExecutionInformation])
     return False
 
 
+def get_early_termination_reason(
+        my_settings: AutoExecutorSettings,
+        instances: List[NetworkExecutionInformation]
+) -> Optional[EarlyTermination]:
+    """
+    There is no need to wait for the solver instances to reach their time limit if:
+        1. (Racing policy) the optimal solution is known, i.e. any instance has found a feasible solution and
+           reported it to be globally optimal, or the best upper bound (feasible solution) meets the best lower
+           bound (reported by Baron/Octeract) within `my_settings.r_race_tolerance`
+        2. the best feasible solution is <= `my_settings.r_target_cost`
+        3. the relative gap between the best upper bound and the best lower bound is <= `my_settings.r_target_gap`
+        4. the best feasible solution has plateaued, see `my_settings.plateau`
+
+    Returns:
+        Reason to stop all the solver instances (its `kind` is `EarlyTermination.OPTIMAL` for rule 1,
+        `EarlyTermination.TARGET` for rule 2 and 3, and `EarlyTermination.PLATEAU` for rule 4), None if they should
+        continue
+    """
+    gap_tolerance = max(
+        my_settings.r_race_tolerance if my_settings.r_race else -1.0,
+        my_settings.r_target_gap if my_settings.r_target_gap is not None else -1.0
+    )
+    if gap_tolerance < 0 and my_settings.r_target_cost is None and my_settings.plateau is None:
+        return None
+    # NOTE: Bounds are only compared between the instances of the same model, because the models are different
+    #       formulations and a lower bound of one model is not guaranteed to be valid for another model
+    best_upper_bound: Dict[str, Tuple[float, NetworkExecutionInformation]] = dict()
+    best_lower_bound: Dict[str, Tuple[float, NetworkExecutionInformation]] = dict()
+    for info in instances:
+        follower = info.log_follower.update()
+        model = info.short_uniq_model_name
+        ok, upper_bound = follower.best_solution()
+        if ok and my_settings.r_target_cost is not None and upper_bound <= my_settings.r_target_cost:
+            return EarlyTermination(
+                EarlyTermination.TARGET,
+                f'{info.solver_name} found {upper_bound} for model {model} which is <= target cost '
+                f'{my_settings.r_target_cost}'
+            )
+        if ok and my_settings.r_race and follower.global_optimum_proved:
+            return EarlyTermination(
+                EarlyTermination.OPTIMAL,
+                f'{info.solver_name} proved that {upper_bound} is globally optimal for model {model}'
+            )
+        if ok and upper_bound < best_upper_bound.get(model, (float('inf'), None))[0]:
+            best_upper_bound[model] = (upper_bound, info)
+        if follower.lower_bound > best_lower_bound.get(model, (float('-inf'), None))[0]:
+            best_lower_bound[model] = (follower.lower_bound, info)
+    # NOTE: Unlike the bounds, the feasible solutions of all the models are compared, as all of them are the cost of
+    #       the same network
+    best_cost = min((upper_bound for upper_bound, _ in best_upper_bound.values()), default=float('inf'))
+    if my_settings.plateau is not None and my_settings.plateau.update(best_cost):
+        return EarlyTermination(
+            EarlyTermination.PLATEAU,
+            f'best feasible solution {best_cost} did not improve by more than '
+            f'{my_settings.plateau.tolerance * 100:g}% in the last {my_settings.plateau.duration:g} seconds'
+        )
+    if gap_tolerance < 0:
+        return None
+    for model, (upper_bound, ub_info) in best_upper_bound.items():
+        if model not in best_lower_bound:
+            continue
+        lower_bound, lb_info = best_lower_bound[model]
+        gap = upper_bound - lower_bound
+        if gap > gap_tolerance * max(1.0, abs(upper_bound)):
+            continue
+        # NOTE: The gap may be within `--target-gap` but not within the racing tolerance, then the solution is not
+        #       proved to be optimal
+        is_optimal = my_settings.r_race and gap <= my_settings.r_race_tolerance * max(1.0, abs(upper_bound))
+        return EarlyTermination(
+            EarlyTermination.OPTIMAL if is_optimal else EarlyTermination.TARGET,
+            f'upper bound {upper_bound} ({ub_info.solver_name}) is within relative gap {gap_tolerance} of '
+            f'lower bound {lower_bound} ({lb_info.solver_name}) for model {model}'
+        )
+    return None
+
+
 def extract_best_solution(
         my_settings: AutoExecutorSettings,
         tmux_monitor_list: List[NetworkExecutionInformation],
@@ -1617,8 +1930,16 @@ def extract_best_solution(
     all_results: List = list()  # Only used for debugging
     best_result_till_now, best_result_exec_info = float('inf'), None
     solver_results = {}
-    for exec_info in tmux_monitor_list:
-        ok, curr_res = exec_info.solver_info.extract_best_solution(exec_info)
+    verifier = None if my_settings.network is None else NetworkVerifier(my_settings.network)
+    analyses = map_solver_instances(
+        lambda exec_info: analyze_solver_instance(my_settings, verifier, exec_info), tmux_monitor_list
+    )
+    for analysis in analyses:
+        exec_info, ok, curr_res = analysis.exec_info, analysis.solution_found, analysis.best_cost
+        if exec_info.verification is not None:
+            run_command(f"echo 'solver={exec_info.solver_name}, model={exec_info.short_uniq_model_name}, "
+                        f"max constraint violation: {exec_info.verification}' "
+                        f">> '{my_settings.output_result_summary_file}'")
         all_results.append((exec_info.solver_name, exec_info.short_uniq_model_name, ok, curr_res))
         g_logger.info(f'solver={exec_info.solver_name}, model={exec_info.short_uniq_model_name}, {ok=}, {curr_res=}')
         # `if` solution not found by this solver instance `or` a better solution is already known, then `continue`
@@ -1637,28 +1958,274 @@ def extract_best_solution(
         else:
             solver_results[solver_name + "_" + model_name] = float('inf')
     update_all_solves_table(my_settings, solver_results)
+    update_solver_results_table(my_settings, analyses)
 
     return best_result_exec_info is not None, best_result_till_now, best_result_exec_info
 
 
+def verify_solution(
+        my_settings: AutoExecutorSettings,
+        verifier: NetworkVerifier,
+        exec_info: NetworkExecutionInformation
+) -> bool:
+    """
+    Check the solution displayed in `std_out_err.txt` of `exec_info` against all the constraints of the model, and
+    set `exec_info.verification`
+
+    Returns:
+        False if the solution violates some constraint by more than `my_settings.r_verification_tolerance`. True if it
+        does not, or if it can not be verified (e.g. model m3/m4, or the solution was not displayed)
+    """
+    if exec_info.short_uniq_model_name not in SUPPORTED_MODELS:
+        return True
+    solution = parse_ampl_solution(exec_info.uniq_std_out_err_file_path)
+    if solution is None:
+        g_logger.debug(f'VERIFY: solution not found in the output of {exec_info}')
+        return True
+    exec_info.verification = verifier.verify(solution)
+    if not exec_info.verification.ok(my_settings.r_verification_tolerance):
+        g_logger.warning(f'VERIFY: rejecting the solution of {exec_info} as it violates the constraints, '
+                         f'{exec_info.verification}')
+        return False
+    g_logger.info(f'VERIFY: max constraint violation of {exec_info}: {exec_info.verification}')
+    return True
+
+
+class SolverInstanceAnalysis(NamedTuple):
+    exec_info: NetworkExecutionInformation
+    # Result of `exec_info.solver_info.check_errors()`
+    no_errors: bool
+    error_message: str
+    # Whether a solution satisfying all the constraints (see `verify_solution()`) was found, and its cost
+    solution_found: bool
+    best_cost: float
+
+
+def analyze_solver_instance(
+        my_settings: AutoExecutorSettings,
+        verifier: Optional[NetworkVerifier],
+        exec_info: NetworkExecutionInformation
+) -> SolverInstanceAnalysis:
+    """
+    Check the errors, extract the best solution and verify it for a finished solver instance, and set
+    `exec_info.analysis`. This is executed in parallel for all the solver instances (see `map_solver_instances()`),
+    so it must not modify anything other than `exec_info` and the files in `exec_info.uniq_exec_output_dir`
+    """
+    no_errors, error_message = exec_info.solver_info.check_errors(exec_info)
+    ok, best_cost = exec_info.solver_info.extract_best_solution(exec_info)
+    if ok and verifier is not None:
+        ok = verify_solution(my_settings, verifier, exec_info)
+    exec_info.analysis = SolverInstanceAnalysis(exec_info, no_errors, error_message, ok, best_cost)
+    return exec_info.analysis
+
+
+T = TypeVar('T')
+
+
+def map_solver_instances(
+        function: Callable[[NetworkExecutionInformation], T],
+        exec_infos: List[NetworkExecutionInformation]
+) -> List[T]:
+    """
+    Returns:
+        `[function(i) for i in exec_infos]` computed in parallel using `AutoExecutorSettings.ANALYSIS_POOL`. So, the
+        time taken is that of the slowest solver instance (large logs), and not the sum for all of them. `function`
+        must only modify its own solver instance (e.g. no files in the current working directory)
+    """
+    return list(AutoExecutorSettings.ANALYSIS_POOL.map(function, exec_infos))
+
+
 def update_all_solves_table(
         my_settings: AutoExecutorSettings,
         solver_results: dict()
 ) -> None:
     hash_id = my_settings.data_file_hash
     time_limit = my_settings.r_execution_time_limit
-    knitro_m1_cost = solver_results["knitro_m1"]
-    knitro_m2_cost = solver_results["knitro_m2"]
-    baron_m1_cost = solver_results["baron_m1"]
-    baron_m2_cost = solver_results["baron_m2"]
-    alphaecp_m1_cost = solver_results["alphaecp_m1"]
-    alphaecp_m2_cost = solver_results["alphaecp_m2"]
-    cursor.execute("INSERT OR REPLACE INTO all_solves (hash_id, solve_time,  knitro_m1_cost, knitro_m2_cost, "
-                   "baron_m1_cost, baron_m2_cost, alphaecp_m1_cost, alphaecp_m2_cost) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                   (hash_id, time_limit, knitro_m1_cost, knitro_m2_cost, baron_m1_cost, baron_m2_cost,
-                    alphaecp_m1_cost, alphaecp_m2_cost))
-    # Commit the changes
-    cursor.connection.commit()
+    # NULL for the combinations which were not launched
+    knitro_m1_cost = solver_results.get("knitro_m1")
+    knitro_m2_cost = solver_results.get("knitro_m2")
+    baron_m1_cost = solver_results.get("baron_m1")
+    baron_m2_cost = solver_results.get("baron_m2")
+    alphaecp_m1_cost = solver_results.get("alphaecp_m1")
+    alphaecp_m2_cost = solver_results.get("alphaecp_m2")
+    with g_db_lock:
+        cursor.execute("INSERT OR REPLACE INTO all_solves (hash_id, solve_time,  knitro_m1_cost, knitro_m2_cost, "
+                       "baron_m1_cost, baron_m2_cost, alphaecp_m1_cost, alphaecp_m2_cost) "
+                       "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                       (hash_id, time_limit, knitro_m1_cost, knitro_m2_cost, baron_m1_cost, baron_m2_cost,
+                        alphaecp_m1_cost, alphaecp_m2_cost))
+        # Commit the changes
+        cursor.connection.commit()
+
+
+def update_solver_results_table(my_settings: AutoExecutorSettings, analyses: List[SolverInstanceAnalysis]) -> None:
+    # NOTE: Every run gets its own rows (unlike `all_solves`), so that the number of runs of every combination is
+    #       known, see `select_portfolio()`
+    run_id = f'{my_settings.TMUX_UNIQUE_PREFIX}{int(time.time())}'
+    rows = list()
+    for analysis in analyses:
+        exec_info = analysis.exec_info
+        cost = analysis.best_cost if analysis.solution_found else float('inf')
+        # NOTE: The time to best is not known (NULL) for the solvers which do not print a progress table with the
+        #       solver time, e.g. Knitro and AlphaECP
+        best_time = None
+        if analysis.solution_found and exec_info.log_follower.has_progress_table:
+            best_time = time_to_best(exec_info.log_follower.trajectory, cost)
+        rows.append((
+            my_settings.data_file_hash, run_id, my_settings.r_execution_time_limit, exec_info.solver_name,
+            exec_info.short_uniq_model_name, cost, best_time
+        ))
+    with g_db_lock:
+        cursor.executemany(
+            "INSERT OR REPLACE INTO solver_results (hash_id, run_id, solve_time, solver, model, cost, time_to_best) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        cursor.connection.commit()
+
+
+def update_network_features_table(data_file_hash: str, features: NetworkFeatures) -> None:
+    with g_db_lock:
+        cursor.execute(
+            "INSERT OR REPLACE INTO network_features (hash_id, num_nodes, num_arcs, num_pipes, num_loops, "
+            "demand_spread) VALUES (?, ?, ?, ?, ?, ?)",
+            (data_file_hash, *features)
+        )
+        cursor.connection.commit()
+
+
+def get_similar_network_solve_records(data_file_hash: str, features: NetworkFeatures) -> List[SolveRecord]:
+    """
+    Returns:
+        Results of all the earlier runs on the same network and on the `NEIGHBOUR_NETWORKS` networks with the closest
+        features (see `feature_distance()`). The rows of the `all_solves` table are used for the runs which were
+        recorded before the `solver_results` table existed, their time to best is not known
+    """
+    with g_db_lock:
+        rows = cursor.execute(
+            "SELECT hash_id, num_nodes, num_arcs, num_pipes, num_loops, demand_spread FROM network_features"
+        ).fetchall()
+    distances: List[Tuple[float, str]] = list()
+    for hash_id, *values in rows:
+        distance = 0.0 if hash_id == data_file_hash else feature_distance(features, NetworkFeatures(*values))
+        if distance <= MAX_FEATURE_DISTANCE:
+            distances.append((distance, hash_id))
+    hash_ids = [hash_id for _, hash_id in sorted(distances)[:NEIGHBOUR_NETWORKS + 1]]
+    if len(hash_ids) == 0:
+        return list()
+
+    placeholders = ', '.join('?' * len(hash_ids))
+    with g_db_lock:
+        result_rows = cursor.execute(
+            f"SELECT hash_id, run_id, solve_time, solver, model, cost, time_to_best FROM solver_results "
+            f"WHERE hash_id IN ({placeholders})",
+            hash_ids
+        ).fetchall()
+        all_solves_rows = cursor.execute(
+            f"SELECT hash_id, solve_time, knitro_m1_cost, knitro_m2_cost, baron_m1_cost, baron_m2_cost, "
+            f"alphaecp_m1_cost, alphaecp_m2_cost FROM all_solves WHERE hash_id IN ({placeholders})",
+            hash_ids
+        ).fetchall()
+    records = [SolveRecord(hash_id, run_id, solver_name, model_name, cost, best_time)
+               for hash_id, run_id, _, solver_name, model_name, cost, best_time in result_rows]
+    recorded_runs = set((row[0], row[2]) for row in result_rows)
+    columns = [('knitro', 'm1'), ('knitro', 'm2'), ('baron', 'm1'), ('baron', 'm2'), ('alphaecp', 'm1'),
+               ('alphaecp', 'm2')]
+    for hash_id, solve_time, *costs in all_solves_rows:
+        if (hash_id, solve_time) in recorded_runs:
+            continue
+        for (solver_name, model_name), cost in zip(columns, costs):
+            if cost is not None:
+                records.append(SolveRecord(hash_id, f'all_solves_{solve_time}', solver_name, model_name, float(cost)))
+    return records
+
+
+def get_learned_ram_requirement(solver_name: str, model_name: str, network_size: int) -> float:
+    """
+    Estimate the RAM required by a solver-model combination using the peak RAM recorded for the same combination
+    on the network with the closest size (see `update_solver_memory_usage_table()`). The recorded value is scaled
+    up linearly if the given network is larger.
+
+    Args:
+        solver_name: One of `AutoExecutorSettings.AVAILABLE_SOLVERS`
+        model_name: Model file name (e.g. 'm1_basic.R') or unique model name (e.g. 'm1')
+        network_size: See `get_network_size()`
+
+    Returns:
+        RAM in GiB, 0.0 if nothing is recorded for the solver-model combination
+    """
+    short_model_name = model_name.split('_')[0]
+    with g_db_lock:
+        row = cursor.execute(
+            "SELECT network_size, peak_ram_gib FROM solver_memory_usage WHERE solver = ? AND model = ? "
+            "ORDER BY ABS(network_size - ?) LIMIT 1",
+            (solver_name, short_model_name, network_size)
+        ).fetchone()
+    if row is None:
+        return 0.0
+    recorded_network_size, peak_ram = row
+    return peak_ram * max(1.0, network_size / max(1, recorded_network_size))
+
+
+def update_network_signatures_table(data_file_hash: str, signature: NetworkSignature) -> None:
+    with g_db_lock:
+        cursor.execute(
+            "INSERT OR REPLACE INTO network_signatures (hash_id, topology_hash, pipes_hash, parameters) "
+            "VALUES (?, ?, ?, ?)",
+            (data_file_hash, signature.topology_hash, signature.pipes_hash, signature.parameters_json())
+        )
+        cursor.connection.commit()
+
+
+def get_similar_solved_networks(
+        data_file_hash: str,
+        signature: NetworkSignature
+) -> List[Tuple[str, NetworkSignature, float]]:
+    """
+    Find the other networks in the `network_signatures` table which have the same topology and pipe table, and whose
+    parameters differ by at most `MAX_PARAMETER_DISTANCE`. Whether they were solved successfully is not checked.
+
+    Returns:
+        List of (hash of the network, its signature, `parameter_distance()`), the most similar network first
+    """
+    with g_db_lock:
+        rows = cursor.execute(
+            "SELECT hash_id, parameters FROM network_signatures "
+            "WHERE topology_hash = ? AND pipes_hash = ? AND hash_id != ?",
+            (signature.topology_hash, signature.pipes_hash, data_file_hash)
+        ).fetchall()
+    res: List[Tuple[str, NetworkSignature, float]] = list()
+    for hash_id, parameters in rows:
+        try:
+            other = NetworkSignature.from_json(signature.topology_hash, signature.pipes_hash, parameters)
+        except (ValueError, KeyError, TypeError):
+            g_logger.warning(f'Invalid row in network_signatures table for {hash_id=}')
+            continue
+        distance = parameter_distance(signature, other)
+        if distance <= MAX_PARAMETER_DISTANCE:
+            res.append((hash_id, other, distance))
+    res.sort(key=lambda x: x[2])
+    return res
+
+
+def update_solver_memory_usage_table(
+        my_settings: AutoExecutorSettings,
+        tmux_original_list: List[NetworkExecutionInformation]
+) -> None:
+    """Record the peak RAM used by every solver instance, only the maximum is kept for a network size"""
+    with g_db_lock:
+        for exec_info in tmux_original_list:
+            if exec_info.peak_ram <= 0:
+                continue
+            cursor.execute(
+                "INSERT INTO solver_memory_usage (solver, model, network_size, peak_ram_gib) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (solver, model, network_size) "
+                "DO UPDATE SET peak_ram_gib = MAX(peak_ram_gib, excluded.peak_ram_gib)",
+                (exec_info.solver_name, exec_info.short_uniq_model_name, my_settings.network_size,
+                 exec_info.peak_ram)
+            )
+        cursor.connection.commit()
+
 
 # ---
 
@@ -1669,10 +2236,33 @@ def main(my_settings: AutoExecutorSettings) -> None:
     tmux_monitor_list: List[NetworkExecutionInformation] = list()
     tmux_finished_list: List[NetworkExecutionInformation] = list()
 
+    if my_settings.r_use_cache and main_use_cached_result(my_settings):
+        my_settings.completion_notifier.close()
+        return
+
+    try:
+        main_launch_and_monitor(my_settings, tmux_original_list, tmux_monitor_list, tmux_finished_list)
+    finally:
+        # The slots are shared with the other requests handled by this process, so they should never be leaked
+        for exec_info in tmux_original_list:
+            release_solver_slots(my_settings, exec_info)
+        my_settings.completion_notifier.close()
+
+
+def main_launch_and_monitor(
+        my_settings: AutoExecutorSettings,
+        tmux_original_list: List[NetworkExecutionInformation],
+        tmux_monitor_list: List[NetworkExecutionInformation],
+        tmux_finished_list: List[NetworkExecutionInformation]
+) -> None:
     main_initialize_directories(my_settings)
 
     main_write_requests_metadata(my_settings)
 
+    main_load_warm_start(my_settings)
+
+    main_select_portfolio(my_settings)
+
     # Decide how many solvers to start in the first batch
     min_combination_parallel_solvers: int = min(
         len(my_settings.solver_model_combinations),
@@ -1680,7 +2270,9 @@ def main(my_settings: AutoExecutorSettings) -> None:
     )
 
     # Begin execution of first batch
-    main_start_first_batch(my_settings, tmux_original_list, tmux_monitor_list, min_combination_parallel_solvers)
+    main_start_first_batch(
+        my_settings, tmux_original_list, tmux_monitor_list, tmux_finished_list, min_combination_parallel_solvers
+    )
 
     # Error checking - Round 1
     # This is done to find and log the errors that occurred just after launching the tmux sessions
@@ -1694,12 +2286,14 @@ def main(my_settings: AutoExecutorSettings) -> None:
     # Error checking - Round 2
     main_error_checking_round_2(tmux_original_list)
 
-    main_give_extra_time_if_no_solution_found(tmux_monitor_list)
+    # Nothing more is to be done if the optimal solution is already known (see `get_early_termination_reason()`)
+    if my_settings.early_termination_reason is None:
+        main_give_extra_time_if_no_solution_found(my_settings, tmux_monitor_list)
 
-    # Begin execution of the remaining solver-model combinations
-    main_start_second_batch(
-        my_settings, tmux_original_list, tmux_monitor_list, tmux_finished_list, min_combination_parallel_solvers
-    )
+        # Begin execution of the remaining solver-model combinations
+        main_start_second_batch(
+            my_settings, tmux_original_list, tmux_monitor_list, tmux_finished_list, min_combination_parallel_solvers
+        )
 
     main_terminate_all_instances_post_timeout(my_settings, tmux_monitor_list, tmux_finished_list)
 
@@ -1710,6 +2304,8 @@ def main(my_settings: AutoExecutorSettings) -> None:
 
     main_wait_for_solvers_to_end(my_settings)
 
+    update_solver_memory_usage_table(my_settings, tmux_original_list)
+
     status, best_cost, best_cost_instance_exec_info = main_extract_best_solution_among_all(
         my_settings, tmux_original_list, tmux_monitor_list, tmux_finished_list
     )
@@ -1721,6 +2317,46 @@ def main(my_settings: AutoExecutorSettings) -> None:
     return
 
 
+def acquire_solver_slots(
+        my_settings: AutoExecutorSettings,
+        idx: int,
+        timeout: Optional[float] = None
+) -> Tuple[int, float]:
+    """
+    Reserve the CPU cores and the RAM required by the solver instance `my_settings.solver_model_combinations[idx]`
+    from the scheduler shared by all the requests
+
+    Returns:
+        Number of slots reserved (0 if they could not be reserved within `timeout` seconds)
+        RAM (GiB) reserved
+    """
+    n = my_settings.r_cpu_cores_per_solver
+    solver_name, model_name = my_settings.solver_model_combinations[idx]
+    ram = get_learned_ram_requirement(solver_name, model_name, my_settings.network_size)
+    if my_settings.scheduler is None:
+        return n, 0.0
+    if my_settings.scheduler.acquire(n, timeout, ram):
+        return n, ram
+    return 0, 0.0
+
+
+def release_solver_slots(my_settings: AutoExecutorSettings, exec_info: NetworkExecutionInformation) -> None:
+    """Return the slots reserved by `exec_info` to the shared scheduler. Calling this multiple times is safe."""
+    if my_settings.scheduler is not None and (exec_info.scheduler_slots > 0 or exec_info.scheduler_ram > 0):
+        my_settings.scheduler.release(exec_info.scheduler_slots, exec_info.scheduler_ram)
+    exec_info.scheduler_slots = 0
+    exec_info.scheduler_ram = 0.0
+
+
+def release_finished_solver_slots(
+        my_settings: AutoExecutorSettings,
+        tmux_original_list: List[NetworkExecutionInformation]
+) -> None:
+    for exec_info in tmux_original_list:
+        if (exec_info.scheduler_slots > 0 or exec_info.scheduler_ram > 0) and not exec_info.is_running():
+            release_solver_slots(my_settings, exec_info)
+
+
 def main_initialize_directories(my_settings: AutoExecutorSettings) -> None:
     # Create the required directory structure
     run_command_get_output(f'mkdir -p "{my_settings.OUTPUT_DIR_LEVEL_0}"')
@@ -1753,63 +2389,114 @@ def main_write_requests_metadata(my_settings: AutoExecutorSettings) -> None:
     g_logger.info('FINISHED: Writing requests metadata to 0_metadata file')
 
 
+def main_load_warm_start(my_settings: AutoExecutorSettings) -> None:
+    """
+    Set `my_settings.warm_start_solution` to the best solution found by the earlier runs on the same network. If
+    there is none, then the solution of the most similar solved network is used (see `get_similar_solved_networks()`)
+    """
+    if my_settings.network is not None:
+        my_settings.network_signature = network_signature(my_settings.network)
+        update_network_signatures_table(my_settings.data_file_hash, my_settings.network_signature)
+    if not my_settings.r_warm_start:
+        return
+    my_settings.warm_start_solution = find_best_prior_solution(
+        AutoExecutorSettings.OUTPUT_DIR_LEVEL_0, my_settings.data_file_hash
+    )
+    if my_settings.warm_start_solution is not None:
+        g_logger.info(f'WARM_START: solvers of model m1 and m2 will start from the earlier solution with '
+                      f'cost={my_settings.warm_start_solution.total_cost}')
+        return
+    if my_settings.network_signature is None:
+        return
+    for similar_hash, similar_signature, distance in get_similar_solved_networks(
+            my_settings.data_file_hash, my_settings.network_signature
+    ):
+        solution = find_best_prior_solution(AutoExecutorSettings.OUTPUT_DIR_LEVEL_0, similar_hash)
+        if solution is None:
+            continue
+        my_settings.warm_start_solution = adapt_solution(solution, my_settings.network_signature, similar_signature)
+        infeasibility = estimate_infeasibility(my_settings.warm_start_solution, my_settings.network)
+        g_logger.info(f'WARM_START: solvers of model m1 and m2 will start from the solution of the similar network '
+                      f'{similar_hash} ({distance=:.6f}, cost={my_settings.warm_start_solution.total_cost}), '
+                      f'max constraint violation: {infeasibility}')
+        return
+
+
+def main_select_portfolio(my_settings: AutoExecutorSettings) -> None:
+    """
+    Record the features of the network, and with `--portfolio auto`, keep only the `my_settings.r_portfolio_size`
+    solver-model combinations with the highest win rate (and then the lowest time to best) on the earlier runs of
+    similar networks (see `get_similar_network_solve_records()`), one of them being the least tried combination (see
+    `select_portfolio()`). All the combinations are kept if there is no history
+    """
+    if my_settings.network is None:
+        return
+    features = network_features(my_settings.network)
+    update_network_features_table(my_settings.data_file_hash, features)
+    if my_settings.r_portfolio != 'auto' \
+            or len(my_settings.solver_model_combinations) <= my_settings.r_portfolio_size:
+        return
+    stats = combination_statistics(get_similar_network_solve_records(my_settings.data_file_hash, features))
+    if not any(stat.wins > 0 for stat in stats.values()):
+        g_logger.info(f'PORTFOLIO: no earlier results for networks similar to {features}, launching all the '
+                      f'solver-model combinations')
+        return
+    # NOTE: The history has the unique model names (e.g. 'm1'), while the combinations have the model file names
+    short_names = {(solver_name, model_name.split('_')[0]): (solver_name, model_name)
+                   for solver_name, model_name in my_settings.solver_model_combinations}
+    for combination in short_names.keys():
+        g_logger.debug(f'PORTFOLIO: {combination}: {stats.get(combination)}')
+    selected, explored = select_portfolio(list(short_names.keys()), stats, my_settings.r_portfolio_size)
+    my_settings.solver_model_combinations = [short_names[i] for i in selected]
+    g_logger.info(f'PORTFOLIO: launching {my_settings.solver_model_combinations} out of {len(short_names)} '
+                  f'solver-model combinations ({explored} is the least tried one), network features: {features}')
+
+
 def main_start_first_batch(
         my_settings: AutoExecutorSettings,
         tmux_original_list: List[NetworkExecutionInformation],
         tmux_monitor_list: List[NetworkExecutionInformation],
+        tmux_finished_list: List[NetworkExecutionInformation],
         min_combination_parallel_solvers: int
 ) -> None:
     g_logger.info('START: Execution of first batch of solvers')
     run_command(f"echo 'running' > {my_settings.output_dir_level_1_network_specific}/0_status")
     for i in range(min_combination_parallel_solvers):
-        if i == 0 or i == 1:
-            exec_info = my_settings.start_solver_gams(i)
-        else:
-            exec_info = my_settings.start_solver(i)
+        # Wait until the CPU cores required are not being used by solver instances of other requests, and there
+        # is enough RAM for this solver instance
+        scheduler_slots, scheduler_ram = acquire_solver_slots(my_settings, i, timeout=5)
+        while scheduler_slots == 0:
+            # NOTE: The RAM may be in use by the solver instances launched above, so their execution time
+            #       limit has to be enforced while waiting
+            g_logger.info(f'WAITING for CPU cores and RAM to launch {my_settings.solver_model_combinations[i]}')
+            MonitorAndStopper.mas_time(tmux_monitor_list, tmux_finished_list, my_settings.r_execution_time_limit, False)
+            release_finished_solver_slots(my_settings, tmux_original_list)
+            scheduler_slots, scheduler_ram = acquire_solver_slots(my_settings, i, timeout=5)
+        exec_info = my_settings.start_solver(i)
+        exec_info.scheduler_slots, exec_info.scheduler_ram = scheduler_slots, scheduler_ram
+        exec_info.expected_ram = scheduler_ram
         g_logger.debug(str(exec_info))
         g_logger.debug(f'{exec_info.tmux_bash_pid=}')
         if exec_info.tmux_bash_pid == '0':
             g_logger.error('FIXME: exec_info.tmux_bash_pid is 0')
+            release_solver_slots(my_settings, exec_info)
             continue
         tmux_original_list.append(exec_info)
         tmux_monitor_list.append(exec_info)
-        g_logger.info(f'tmux session "{exec_info.short_uniq_combination}" -> {exec_info.tmux_bash_pid}')
-        time.sleep(0.2)
+        g_logger.info(f'solver instance "{exec_info.short_uniq_combination}" -> {exec_info.tmux_bash_pid}')
+        if my_settings.launcher == 'tmux':
+            time.sleep(0.2)
         g_logger.debug(f'{len(tmux_monitor_list)=}')
     del i, exec_info
     g_logger.info('FINISHED: Execution of first batch of solvers')
 
 
-def main_start_first_batch_gams(
-        my_settings: AutoExecutorSettings,
-        tmux_original_list: List[NetworkExecutionInformation],
-        tmux_monitor_list: List[NetworkExecutionInformation]
-) -> None:
-    g_logger.info('START: Execution of first batch of gams solvers')
-    run_command(f"echo 'running' > {my_settings.output_dir_level_1_network_specific}/0_status")
-
-    exec_info = my_settings.start_solver_gams('m1', my_settings)
-    g_logger.debug(str(exec_info))
-    g_logger.debug(f'{exec_info.tmux_bash_pid=}')
-    if exec_info.tmux_bash_pid == '0':
-        g_logger.error('FIXME: exec_info.tmux_bash_pid is 0')
-    else:
-        tmux_original_list.append(exec_info)
-        tmux_monitor_list.append(exec_info)
-        g_logger.info(f'tmux session "{exec_info.short_uniq_combination}" -> {exec_info.tmux_bash_pid}')
-        time.sleep(0.2)
-        g_logger.debug(f'{len(tmux_monitor_list)=}')
-
-    del exec_info
-    g_logger.info('FINISHED: Execution of first batch of gams solvers')
-
-
 def main_error_checking_round_1(tmux_monitor_list: List[NetworkExecutionInformation],
                                 tmux_finished_list: List[NetworkExecutionInformation]) -> None:
     g_logger.info('START: Error checking - Round 1')
     tmux_monitor_list_idx_to_remove = list()
     for idx, exec_info in enumerate(tmux_monitor_list):
-        if get_process_running_status(exec_info.tmux_bash_pid):
+        if exec_info.is_running():
             continue
         g_logger.warning(f'tmux session stopped "{exec_info.short_uniq_combination}" -> {exec_info.tmux_bash_pid}')
         g_logger.error(exec_info.solver_info.check_errors(exec_info))
@@ -1854,6 +2541,28 @@ def main_check_launch_errors(
         exit(3)
 
 
+def main_check_early_termination(
+        my_settings: AutoExecutorSettings,
+        tmux_monitor_list: List[NetworkExecutionInformation],
+        tmux_finished_list: List[NetworkExecutionInformation]
+) -> bool:
+    """
+    Stop all the running solver instances if `get_early_termination_reason()` says so
+
+    Returns:
+        True if the solver instances were stopped (now or in some earlier call), otherwise False
+    """
+    if my_settings.early_termination_reason is not None:
+        return True
+    reason = get_early_termination_reason(my_settings, tmux_monitor_list + tmux_finished_list)
+    if reason is None:
+        return False
+    my_settings.early_termination_reason = reason
+    g_logger.info(f'EARLY_TERMINATION: {reason}')
+    MonitorAndStopper.mas_all(tmux_monitor_list, tmux_finished_list, 'EARLY_TERMINATION')
+    return True
+
+
 def main_busy_waiting(
         my_settings: AutoExecutorSettings,
         tmux_monitor_list: List[NetworkExecutionInformation],
@@ -1871,74 +2580,110 @@ def main_busy_waiting(
     #         2. Some error occur in the execution of a one of
     #            `g_settings.solver_model_combinations[:g_settings.MAX_PARALLEL_SOLVERS]`
     #            way before `g_settings.EXECUTION_TIME_LIMIT`
+    start_time = time.time()
+    if my_settings.r_plateau_time is not None:
+        my_settings.plateau = IncumbentPlateau(
+            my_settings.r_plateau_tolerance, my_settings.r_plateau_time, my_settings.r_plateau_min_time, start_time
+        )
     execution_time_left = my_settings.r_execution_time_limit
-    while execution_time_left >= 5:
+    while execution_time_left > 0:
         g_logger.debug(f'Time Finished = '
                        f'{str(datetime.timedelta(seconds=my_settings.r_execution_time_limit - execution_time_left))}'
                        f', Time Left = {str(datetime.timedelta(seconds=execution_time_left))}')
-        g_logger.debug(
-            "Tmux session count = " +
-            run_command_get_output(f'tmux ls 2> /dev/null | grep "{my_settings.TMUX_UNIQUE_PREFIX}" | wc -l')
-        )
-        if run_command(f'tmux ls 2> /dev/null | grep "{my_settings.TMUX_UNIQUE_PREFIX}" | wc -l', '0')[1] == '0':
+        solver_instances_running = my_settings.count_running_solver_instances()
+        g_logger.debug(f'Solver instance count = {solver_instances_running}')
+        if solver_instances_running == 0:
             g_logger.info(f'{execution_time_left=}')
-            g_logger.info('CHECKME: Skipping the sleep/wait operation as no tmux session is '
+            g_logger.info('CHECKME: Skipping the sleep/wait operation as no solver instance is '
                           'running, probably some error or the solver(s) exited early')
             tmux_finished_list.extend(tmux_monitor_list)
             tmux_monitor_list.clear()
             break
-        time.sleep(5)
-        execution_time_left -= 5
+        if main_check_early_termination(my_settings, tmux_monitor_list, tmux_finished_list):
+            break
+        main_update_memory_usage(tmux_monitor_list)
+        # Wake up as soon as any solver instance exits, else every 5 seconds to log the progress
+        my_settings.completion_notifier.wait(min(5, execution_time_left))
+        execution_time_left = max(0, my_settings.r_execution_time_limit - int(time.time() - start_time))
         if my_settings.debug and g_STD_OUT_ERR_TO_TERMINAL:
             delete_last_lines(2)
-    if execution_time_left <= 5:
-        time.sleep(execution_time_left)
+    if execution_time_left <= 0:
         g_logger.info(f'Initial time limit over '
                       f'(i.e. {str(datetime.timedelta(seconds=my_settings.r_execution_time_limit))})')
-        g_logger.debug(
-            "Tmux session count = " +
-            run_command_get_output(f'tmux ls 2> /dev/null | grep "{my_settings.TMUX_UNIQUE_PREFIX}" | wc -l')
-        )
+        g_logger.debug(f'Solver instance count = {my_settings.count_running_solver_instances()}')
+    elif my_settings.early_termination_reason is not None:
+        g_logger.info(f'while loop forcefully stopped using `break`: {my_settings.early_termination_reason}')
     else:
-        g_logger.info('while loop forcefully stopped using `break` as no `tmux` session were running')
-    del execution_time_left
+        g_logger.info('while loop forcefully stopped using `break` as no solver instance was running')
+    del start_time, execution_time_left
+
+
+def main_update_memory_usage(tmux_monitor_list: List[NetworkExecutionInformation]) -> None:
+    """Update the peak RAM used by the solver instances, see `NetworkExecutionInformation.update_memory_usage()`"""
+    snapshot = ProcessTreeSnapshot([exec_info.tmux_bash_pid for exec_info in tmux_monitor_list])
+    for exec_info in tmux_monitor_list:
+        exec_info.update_memory_usage(snapshot)
 
 
 def main_error_checking_round_2(tmux_original_list: List[NetworkExecutionInformation]) -> None:
     # This is done primarily for logging purpose
     g_logger.info('START: Error checking - Round 2')
-    for exec_info in tmux_original_list:
-        ok, err_msg = exec_info.solver_info.check_errors(exec_info)
+    errors = map_solver_instances(lambda exec_info: exec_info.solver_info.check_errors(exec_info), tmux_original_list)
+    for exec_info, (ok, err_msg) in zip(tmux_original_list, errors):
         if not ok:
             g_logger.warning(str(exec_info))
             g_logger.error(err_msg)
-    del exec_info, ok, err_msg
     g_logger.info('FINISHED: Error checking - Round 2')
 
 
-def main_give_extra_time_if_no_solution_found(tmux_monitor_list: List[NetworkExecutionInformation]) -> None:
-    # - Check if any feasible solution has been found by the first batch of tmux sessions or not.
-    # - If no feasible solution has been found by any of the session of the first batch, then give them
-    #   limited amount of extra time to find a feasible solution.
-    # - If "a feasible solution is found" or "extra time has been consumed", then proceed with the second batch.
-    # NOTE: `at_least_one_solution_found` variable is unused as of now. However, it may be needed in future.
-    at_least_one_solution_found = False
-    extra_time_given = 0
+# Extra time is given in steps of this many seconds, see `main_give_extra_time_if_no_solution_found()`
+EXTRA_TIME_STEP = 30
+
+
+def is_improving_bounds(info: NetworkExecutionInformation, window: float) -> bool:
+    """
+    Returns:
+        True if the solver instance improved its bounds in the last `window` seconds. While no feasible solution is
+        known, only the lower bound can improve, and it is reported only by the solvers which print a progress table
+        (see `SolverLogFollower.has_progress_table`). The progress of the other solvers (Knitro, AlphaECP) can not be
+        told from their output, so True is returned for them
+    """
+    follower = info.log_follower.update()
+    if not follower.has_progress_table:
+        return True
+    return time.time() - follower.last_update_time < window
+
+
+def main_give_extra_time_if_no_solution_found(
+        my_settings: AutoExecutorSettings,
+        tmux_monitor_list: List[NetworkExecutionInformation]
+) -> None:
+    """
+    If no feasible solution has been found by the first batch of solver instances, then keep them running for some
+    extra time (at most `my_settings.r_max_extra_time` seconds) to find one. The extra time is extended in steps of
+    `EXTRA_TIME_STEP` seconds only while some running instance is still improving its bounds, i.e. it is getting
+    closer to a feasible solution, or its progress can not be told (see `is_improving_bounds()`). If "a feasible
+    solution is found" or "the solvers stopped improving" or "extra time has been consumed", then proceed with the
+    second batch.
+    """
+    extra_time_start = time.time()
     while len(tmux_monitor_list) > 0 and (not check_solution_status(tmux_monitor_list)):
-        extra_time_given += 30
-        g_logger.info(f'Extra time given = {extra_time_given} of 300 seconds')
-        time.sleep(30)  # Give 30 more seconds to the running solvers
-        # TODO: NOTE: In future, this too can be taken as a command line parameter
-        # Maximum 5 minutes extra time is given
-        if extra_time_given >= 300:
+        extra_time_given = time.time() - extra_time_start
+        if extra_time_given >= my_settings.r_max_extra_time:
             g_logger.info('"Extra time" limit reached')
             break
-    # NOTE: The below statement will work in most cases. However, there can be corner cases where a solution
-    #       is found by one of the session of first batch but still `at_least_one_solution_found` is False.
-    #       This case can occur when a solver finds the solution at the time between "checking of solution status
-    #       in the above loop" and "stopping of that session in the below `for` loop of second batch"
-    at_least_one_solution_found = (extra_time_given < 300)
-    del extra_time_given, at_least_one_solution_found
+        running = [info for info in tmux_monitor_list if info.is_running()]
+        if len(running) == 0:
+            g_logger.info('No extra time given as no solver instance is running')
+            break
+        if extra_time_given >= EXTRA_TIME_STEP and \
+                not any(is_improving_bounds(info, EXTRA_TIME_STEP) for info in running):
+            g_logger.info(f'No more extra time given as no solver instance improved its bounds in the last '
+                          f'{EXTRA_TIME_STEP} seconds')
+            break
+        g_logger.info(f'Extra time given = {int(extra_time_given)} of {my_settings.r_max_extra_time} seconds')
+        # Wake up as soon as any solver instance exits, it may have found a feasible solution
+        my_settings.completion_notifier.wait(min(EXTRA_TIME_STEP, my_settings.r_max_extra_time - extra_time_given))
 
 
 def main_start_second_batch(
@@ -1950,29 +2695,45 @@ def main_start_second_batch(
 ) -> None:
     g_logger.info('START: Execution of the remaining solver-model combinations')
     for i in range(min_combination_parallel_solvers, len(my_settings.solver_model_combinations)):
-        g_logger.debug(run_command_get_output(f'tmux ls | grep "{my_settings.TMUX_UNIQUE_PREFIX}"', debug_print=True))
-
-        while True:
-            tmux_sessions_running = int(run_command_get_output(
-                f'tmux ls 2> /dev/null | grep "{my_settings.TMUX_UNIQUE_PREFIX}" | wc -l'
+        if my_settings.launcher == 'tmux':
+            g_logger.debug(run_command_get_output(
+                f'tmux ls | grep "{my_settings.TMUX_UNIQUE_PREFIX}"', debug_print=True
             ))
-            g_logger.debug(tmux_sessions_running)
 
-            if tmux_sessions_running < my_settings.r_max_parallel_solvers:
-                break
+        scheduler_slots, scheduler_ram = 0, 0.0
+        while True:
+            if main_check_early_termination(my_settings, tmux_monitor_list, tmux_finished_list):
+                g_logger.info('FINISHED: Execution of the remaining solver-model combinations (skipped)')
+                return
+            release_finished_solver_slots(my_settings, tmux_original_list)
+            solver_instances_running = my_settings.count_running_solver_instances()
+            g_logger.debug(solver_instances_running)
+
+            if solver_instances_running < my_settings.r_max_parallel_solvers:
+                scheduler_slots, scheduler_ram = acquire_solver_slots(my_settings, i, timeout=5)
+                if scheduler_slots > 0:
+                    break
+                if len(tmux_monitor_list) == 0:
+                    # All the slots (or the RAM) are being used by the solver instances of other requests
+                    continue
             g_logger.debug("----------")
             g_logger.debug(f'{tmux_monitor_list=}')
             g_logger.debug(f'{len(tmux_finished_list)=}')
-            MonitorAndStopper.mas_time(tmux_monitor_list, tmux_finished_list, my_settings.r_execution_time_limit, True)
+            # NOTE: Not blocking here, so that `main_check_early_termination` is done every few seconds
+            MonitorAndStopper.mas_time(tmux_monitor_list, tmux_finished_list, my_settings.r_execution_time_limit, False)
             g_logger.debug(f'{tmux_monitor_list=}')
             g_logger.debug(f'{len(tmux_finished_list)=}')
+            my_settings.completion_notifier.wait(2)
 
         exec_info = my_settings.start_solver(i)
+        exec_info.scheduler_slots, exec_info.scheduler_ram = scheduler_slots, scheduler_ram
+        exec_info.expected_ram = scheduler_ram
         tmux_original_list.append(exec_info)
         tmux_monitor_list.append(exec_info)
-        g_logger.info(f'tmux session "{exec_info.short_uniq_combination}" -> {exec_info.tmux_bash_pid}')
-        time.sleep(0.2)
-        del tmux_sessions_running, exec_info
+        g_logger.info(f'solver instance "{exec_info.short_uniq_combination}" -> {exec_info.tmux_bash_pid}')
+        if my_settings.launcher == 'tmux':
+            time.sleep(0.2)
+        del solver_instances_running, exec_info, scheduler_slots, scheduler_ram
     g_logger.info('FINISHED: Execution of the remaining solver-model combinations')
 
 
@@ -1986,23 +2747,27 @@ def main_terminate_all_instances_post_timeout(
     #          execution time limit, or get forcefully stopped if execution time limit is exceeded)
     #       2. move finished tmux session from monitor list to finished list
     while len(tmux_monitor_list):
+        if main_check_early_termination(my_settings, tmux_monitor_list, tmux_finished_list):
+            break
         g_logger.debug("----------")
         g_logger.debug(f'{tmux_monitor_list=}')
         g_logger.debug(f'{len(tmux_finished_list)=}')
-        MonitorAndStopper.mas_time(tmux_monitor_list, tmux_finished_list, my_settings.r_execution_time_limit, True)
+        # NOTE: Not blocking here, so that `main_check_early_termination` is done every few seconds
+        MonitorAndStopper.mas_time(tmux_monitor_list, tmux_finished_list, my_settings.r_execution_time_limit, False)
         g_logger.debug(f'{tmux_monitor_list=}')
         g_logger.debug(f'{len(tmux_finished_list)=}')
+        if len(tmux_monitor_list):
+            my_settings.completion_notifier.wait(2)
 
 
 def main_error_checking_round_3(tmux_original_list: List[NetworkExecutionInformation]) -> None:
     # This is done primarily for logging purpose
     g_logger.info('START: Error checking - Round 3 (last round)')
-    for exec_info in tmux_original_list:
-        ok, err_msg = exec_info.solver_info.check_errors(exec_info)
+    errors = map_solver_instances(lambda exec_info: exec_info.solver_info.check_errors(exec_info), tmux_original_list)
+    for exec_info, (ok, err_msg) in zip(tmux_original_list, errors):
         if not ok:
             g_logger.warning(str(exec_info))
             g_logger.error(err_msg)
-    del exec_info, ok, err_msg
     g_logger.info('FINISHED: Error checking - Round 3 (last round)')
 
 
@@ -2023,9 +2788,9 @@ def main_wait_for_solvers_to_end(my_settings: AutoExecutorSettings) -> None:
     # - If this loop is not there, then there is a possibility that we think that the solver-model combination
     #   failed even if solver had found a "feasible or global" solution, because the solver had not returned the
     #   final value of the variables that were to be calculated/found to AMPL for printing (here, to std_out_err.txt)
-    while run_command(f'tmux ls 2> /dev/null | grep "{my_settings.TMUX_UNIQUE_PREFIX}" | wc -l', '0', True)[1] != '0':
-        g_logger.info('WAITING for the tmux instances to stop (probably AMPL or some solver has not terminated)')
-        time.sleep(10)
+    while my_settings.count_running_solver_instances() != 0:
+        g_logger.info('WAITING for the solver instances to stop (probably AMPL or some solver has not terminated)')
+        my_settings.completion_notifier.wait(10)
 
 
 def main_extract_best_solution_among_all(
@@ -2087,7 +2852,11 @@ def main_solvers_finished_unsuccessfully(
     run_command(f"echo 'finished:Either some unknown error, or NO feasible solution found'"
                 f" > {my_settings.output_dir_level_1_network_specific}/0_status")
     for exec_info in tmux_finished_list:
-        ok, msg = exec_info.solver_info.check_errors(exec_info)
+        # NOTE: The errors of all the solver instances were already checked by `extract_best_solution()`
+        if exec_info.analysis is not None:
+            ok, msg = exec_info.analysis.no_errors, exec_info.analysis.error_message
+        else:
+            ok, msg = exec_info.solver_info.check_errors(exec_info)
         if ok:
             continue
         msg = msg.replace("'", "'\"'\"'")
@@ -2103,38 +2872,136 @@ def main_write_final_solution(
         best_cost: float,
         best_cost_instance_exec_info: NetworkExecutionInformation
 ) -> None:
-    run_command(f"echo 'success' > {my_settings.output_dir_level_1_network_specific}/0_status")
     # status, file_to_parse, objective_value, solution_vector = \
     #     best_cost_instance_exec_info.solver_info.extract_solution_vector(best_cost_instance_exec_info)
     g_logger.info(f'{best_cost=}')
     g_logger.info(f'Instance={best_cost_instance_exec_info}')
-    g_logger.info(f'Solver={best_cost_instance_exec_info.solver_name}, '
-                  f'Model={best_cost_instance_exec_info.short_uniq_model_name}')
+    write_result_file(
+        my_settings, best_cost, best_cost_instance_exec_info.solver_name,
+        best_cost_instance_exec_info.short_uniq_model_name, best_cost_instance_exec_info.uniq_std_out_err_file_path
+    )
+
+    # Finally update the database regarding the best solution
+    # NOTE: If the solvers were stopped early because of `--target-cost`, `--target-gap` or `--plateau-time`, then
+    #       the result is only as good as what was asked for (it is not proved to be optimal). So, it is not stored,
+    #       otherwise `main_use_cached_result()` would return it for the requests which do not ask for any of them.
+    #       The result of the solvers stopped because the optimal solution is known is stored
+    reason = my_settings.early_termination_reason
+    if reason is not None and reason.kind in (EarlyTermination.TARGET, EarlyTermination.PLATEAU):
+        g_logger.info(f'Not updating the best_solves table as the solvers were stopped early due to the '
+                      f'{reason.kind}: {reason}')
+        return
+    update_best_solves_table(my_settings, best_cost, best_cost_instance_exec_info)
+
+
+def write_result_file(
+        my_settings: AutoExecutorSettings,
+        best_cost: float,
+        solver_name: str,
+        short_uniq_model_name: str,
+        std_out_err_file_path: str
+) -> None:
+    """Write `my_settings.output_network_specific_result` and set the status to success"""
+    run_command(f"echo 'success' > {my_settings.output_dir_level_1_network_specific}/0_status")
+    g_logger.info(f'Solver={solver_name}, Model={short_uniq_model_name}')
     # Line 1 = Status (success => True, failure => False)
     run_command(f"echo '{True}' > '{my_settings.output_network_specific_result}'")
     # Line 2 = Solver Name
-    run_command(f"echo '{best_cost_instance_exec_info.solver_name}' >> '{my_settings.output_network_specific_result}'")
+    run_command(f"echo '{solver_name}' >> '{my_settings.output_network_specific_result}'")
     # Line 3 = Model Name (unique short form)
-    run_command(f"echo '{best_cost_instance_exec_info.short_uniq_model_name}'"
-                f" >> '{my_settings.output_network_specific_result}'")
+    run_command(f"echo '{short_uniq_model_name}' >> '{my_settings.output_network_specific_result}'")
     # Line 4 = std_out_err file path of Solver-Model combination
-    run_command(f"echo '{best_cost_instance_exec_info.uniq_std_out_err_file_path}'"
-                f" >> '{my_settings.output_network_specific_result}'")
+    run_command(f"echo '{std_out_err_file_path}' >> '{my_settings.output_network_specific_result}'")
     # Line 5 = Best value of the objective function that was found by the Solver
     run_command(f"echo '{best_cost}' >> '{my_settings.output_network_specific_result}'")
     # Line 6+ = Solution data extracted from std_out_err file of the best Solver-Model combination
-    #           using `CalculateNetworkCost_ExtractResultFromAmplOutput.py` program
-    run_command(f"'{sys.executable}' 'CalculateNetworkCost_ExtractResultFromAmplOutput.py' "
-                f"'{best_cost_instance_exec_info.uniq_std_out_err_file_path}' "
-                f"'{(pathlib.Path(my_settings.output_dir_level_1_network_specific) / '0_graph_network_data_testcase.R').resolve()}' "
-                f"1"
-                f" >> '{my_settings.output_network_specific_result}'")
+    #           using `CalculateNetworkCost_ExtractResultFromAmplOutput.extract_result()`
+    network_file_path = pathlib.Path(my_settings.output_dir_level_1_network_specific, '0_graph_network_data_testcase.R')
+    try:
+        result = extract_result(std_out_err_file_path, str(network_file_path.resolve()),
+                                my_settings.r_verification_tolerance, AutoExecutorSettings.NETWORK_CACHE_DIR)
+    except ExtractionError as e:
+        g_logger.error(f"Unable to extract the solution from '{std_out_err_file_path}': {e}")
+        return
+    with open(my_settings.output_network_specific_result, 'a') as f:
+        f.write(result.to_text())
     # run_command(f"echo '{file_to_parse}' >> '{my_settings.output_network_specific_result}'")  # Line 6
     # run_command(f"echo '{objective_value}' >> '{my_settings.output_network_specific_result}'")  # Line 7
     # run_command(f"echo '{solution_vector}' >> '{my_settings.output_network_specific_result}'")  # Line 8+
 
-    # Finally update the database regarding the best solution
-    update_best_solves_table(my_settings, best_cost, best_cost_instance_exec_info)
+
+def main_use_cached_result(my_settings: AutoExecutorSettings) -> bool:
+    """
+    If the same network was already solved with an equal or longer time limit, then write its result (regenerated
+    from the archived `std_out_err.txt` of the best solver-model combination) without launching any solver
+
+    Returns:
+        True if the cached result was used, otherwise False
+    """
+    for solve_time, best_cost, best_solver, best_model in get_cached_best_solves(my_settings):
+        std_out_err_file_path = find_archived_std_out_err_file(my_settings, solve_time, best_solver, best_model,
+                                                               best_cost)
+        if std_out_err_file_path is None:
+            g_logger.warning(f'CACHE: std_out_err.txt not found for the stored result {solve_time=}, {best_cost=}, '
+                             f'{best_solver=}, {best_model=}')
+            continue
+        g_logger.info(f"CACHE HIT: using the result of the earlier run with {solve_time=}: "
+                      f"'{std_out_err_file_path}'")
+        main_initialize_directories(my_settings)
+        main_handle_result_file_exists(my_settings)
+        write_result_file(my_settings, best_cost, best_solver, best_model, std_out_err_file_path)
+        return True
+    return False
+
+
+def get_cached_best_solves(my_settings: AutoExecutorSettings) -> List[Tuple[int, float, str, str]]:
+    """
+    Returns:
+        (solve_time, best_cost, best_solver, best_model) of the earlier runs on `my_settings.data_file_hash` with
+        time limit >= `my_settings.r_execution_time_limit`, best cost first. Only the results found by one of
+        `my_settings.solver_model_combinations` (i.e. `--solver-models`) are returned
+    """
+    with g_db_lock:
+        rows = cursor.execute(
+            "SELECT solve_time, best_cost, best_solver, best_model FROM best_solves "
+            "WHERE hash_id = ? AND solve_time >= ? ORDER BY best_cost ASC, solve_time DESC",
+            (my_settings.data_file_hash, my_settings.r_execution_time_limit)
+        ).fetchall()
+    # NOTE: `best_solves` has the unique model names (e.g. 'm1'), while the combinations have the model file names
+    combinations = {(solver_name, model_name.split('_')[0])
+                    for solver_name, model_name in my_settings.solver_model_combinations}
+    return [row for row in rows if (row[2], row[3]) in combinations]
+
+
+def find_archived_std_out_err_file(
+        my_settings: AutoExecutorSettings,
+        solve_time: int,
+        solver_name: str,
+        short_uniq_model_name: str,
+        best_cost: float
+) -> Optional[str]:
+    """
+    Returns:
+        Path of `std_out_err.txt` of the solver-model combination written by the earlier run (any `--prefix`) with
+        time limit `solve_time`, whose final total cost is `best_cost`. None if it does not exist
+    """
+    combination = f'{solver_name}_{short_uniq_model_name}_{my_settings.data_file_hash}'
+    for output_dir in sorted(glob.glob(f'{glob.escape(AutoExecutorSettings.OUTPUT_DIR_LEVEL_0)}/'
+                                       f'{my_settings.data_file_hash}*')):
+        std_out_err_file_path = f'{pathlib.Path(output_dir).resolve()}/{combination}/std_out_err.txt'
+        if not os.path.isfile(std_out_err_file_path):
+            continue
+        try:
+            with open(f'{output_dir}/0_metadata', 'r') as metadata_file:
+                metadata = json.load(metadata_file)
+        except (OSError, ValueError):
+            continue
+        if metadata.get('solver_execution_time_limit_in_seconds') != solve_time:
+            continue
+        ok, cost = SolverLogFollower(std_out_err_file_path, solver_name).update().best_solution()
+        if ok and abs(cost - float(best_cost)) <= 1e-6 * max(1.0, abs(cost)):
+            return std_out_err_file_path
+    return None
 
 
 # ---
@@ -2148,33 +3015,25 @@ def update_best_solves_table(
     best_solver = best_cost_instance_exec_info.solver_name
     best_model = best_cost_instance_exec_info.short_uniq_model_name
     # Insert values into the solves table
-    cursor.execute(
-        "INSERT OR REPLACE INTO best_solves (hash_id, solve_time, best_cost, best_solver, best_model ) "
-        "VALUES (?, ?, ?, ?, ?)",
-        (hash_id, time_limit, best_cost, best_solver, best_model))
-    # Commit the changes
-    cursor.connection.commit()
-    cursor.connection.close()
+    # NOTE: The connection is not closed here because it is shared by all the requests handled by this process
+    with g_db_lock:
+        cursor.execute(
+            "INSERT OR REPLACE INTO best_solves (hash_id, solve_time, best_cost, best_solver, best_model ) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (hash_id, time_limit, best_cost, best_solver, best_model))
+        # Commit the changes
+        cursor.connection.commit()
 
 
-def update_settings(args: argparse.Namespace) -> AutoExecutorSettings:
-    """
-    Store the settings in my_settings object and return it
-
-    Args:
-        args: command line arguments parsed by `argparse`
-    """
+def setup_logging(debug: bool) -> None:
     global g_logger
 
-    my_settings = AutoExecutorSettings()
-    my_settings.debug = args.debug
-
     # REFER: https://github.com/alttch/neotermcolor/blob/master/neotermcolor/__init__.py#L120
     # If STDOUT and STDERR are connected to a terminal, then use `rich` logging, otherwise simple logging
     if (os.getenv('ANSI_COLORS_DISABLED') is None) and (sys.stdout.isatty() and sys.stderr.isatty()):
         # noinspection PyArgumentList
         logging.basicConfig(
-            level=(logging.DEBUG if args.debug else logging.WARNING),
+            level=(logging.DEBUG if debug else logging.WARNING),
             format='%(funcName)s :: %(message)s',
             datefmt="[%X]",
             handlers=[rich_RichHandler()]
@@ -2182,7 +3041,7 @@ def update_settings(args: argparse.Namespace) -> AutoExecutorSettings:
         g_logger = logging.getLogger('CNC')
     else:
         g_logger = logging.getLogger('CNC')
-        if args.debug:
+        if debug:
             g_logger.setLevel(logging.DEBUG)
         else:
             g_logger.setLevel(logging.WARNING)
@@ -2192,14 +3051,67 @@ def update_settings(args: argparse.Namespace) -> AutoExecutorSettings:
         g_logger.addHandler(logger_file_handler)
         del logger_file_handler, logger_formatter
 
+
+def expand_data_file_paths(paths: List[str]) -> List[str]:
+    """
+    Args:
+        paths: Values given using `-p`, each one is a file, a directory or a glob
+
+    Returns:
+        Paths of all the files, in the order in which they were given (files of a directory or a glob are sorted by
+        name). A file which is given multiple times is returned only once
+    """
+    res: List[str] = list()
+    for path in paths:
+        if os.path.isdir(path):
+            matches = sorted(i.path for i in os.scandir(path) if i.is_file())
+        elif os.path.exists(path):
+            matches = [path]
+        else:
+            matches = sorted(i for i in glob.glob(path) if os.path.isfile(i))
+            if len(matches) == 0:
+                g_logger.error(f"Cannot access '{path}': No such file or directory")
+        for i in matches:
+            if i not in res:
+                res.append(i)
+    return res
+
+
+def update_settings(args: argparse.Namespace, data_file_path: str) -> AutoExecutorSettings:
+    """
+    Store the settings in my_settings object and return it
+
+    NOTE: `setup_logging()` should be called before this
+
+    Args:
+        args: command line arguments parsed by `argparse`
+        data_file_path: Graph/network (i.e. data/testcase file) to be solved, see `expand_data_file_paths()`
+    """
+    my_settings = AutoExecutorSettings()
+    my_settings.debug = args.debug
+    my_settings.launcher = args.launcher
+    my_settings.r_race = not args.no_race
+    my_settings.r_race_tolerance = args.race_tolerance
+    my_settings.r_target_cost = args.target_cost
+    my_settings.r_target_gap = args.target_gap
+    my_settings.r_plateau_time = args.plateau_time
+    my_settings.r_plateau_tolerance = args.plateau_tolerance
+    my_settings.r_plateau_min_time = args.plateau_min_time
+    my_settings.r_max_extra_time = args.max_extra_time
+    my_settings.r_use_cache = not args.no_cache
+    my_settings.r_warm_start = not args.no_warm_start
+    my_settings.r_use_nl_stub = not args.no_stub_cache
+    my_settings.r_portfolio = args.portfolio
+    my_settings.r_portfolio_size = args.portfolio_size
+
     g_logger.debug(args)
 
     # Check if the network file exists or not
-    if not os.path.exists(args.path):
-        g_logger.error(f"Cannot access '{args.path}': No such file or directory")
+    if not os.path.exists(data_file_path):
+        g_logger.error(f"Cannot access '{data_file_path}': No such file or directory")
         exit(2)
     g_logger.info(f"Current working directory = '{os.getcwd()}'")
-    my_settings.set_data_file_path(args.path, args.prefix)
+    my_settings.set_data_file_path(data_file_path, args.prefix)
     g_logger.info(f"Graph/Network (i.e. Data/Testcase file) = '{my_settings.data_file_path}'")
     g_logger.info(f"Input file hash = '{my_settings.data_file_hash}'")
 
@@ -2225,7 +3137,7 @@ def update_settings(args: argparse.Namespace) -> AutoExecutorSettings:
     if args.jobs == 0:
         my_settings.r_max_parallel_solvers = len(my_settings.solver_model_combinations)
     elif args.jobs == -1:
-        my_settings.r_max_parallel_solvers = run_command_get_output('nproc')
+        my_settings.r_max_parallel_solvers = int(run_command_get_output('nproc'))
     else:
         my_settings.r_max_parallel_solvers = args.jobs
     g_logger.info(f'r_max_parallel_solvers = {my_settings.r_max_parallel_solvers}')
@@ -2236,6 +3148,13 @@ def update_settings(args: argparse.Namespace) -> AutoExecutorSettings:
         g_logger.warning('There is a possibility of more time being spent on execution'
                          'as all solver model combinations will not be running in parallel.'
                          f'\nSolver Model Combinations = {len(my_settings.solver_model_combinations)}')
+    my_settings.r_min_free_ram = args.min_free_ram
+    my_settings.r_min_free_swap = args.min_free_swap
+    my_settings.scheduler = SolverSlotScheduler(
+        my_settings.r_max_parallel_solvers * my_settings.r_cpu_cores_per_solver,
+        my_settings.r_min_free_ram,
+        my_settings.r_min_free_swap
+    )
     return my_settings
 
 
@@ -2354,7 +3273,26 @@ def parser_check_jobs_int_range(c: str) -> int:
     return val
 
 
-def parse_args() -> argparse.Namespace:
+def parser_check_non_negative_float(c: str) -> float:
+    """
+    Validate that `c` can be converted to a `float`, and ensure that `float(c) >= 0`
+
+    Args:
+        c: the value passed as commandline parameter
+
+    Returns:
+        `c` converted to `float`
+    """
+    try:
+        val = float(c)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid float value: '{c}'")
+    if not (val >= 0):
+        raise argparse.ArgumentTypeError('minimum value is 0')
+    return val
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     # Create the parser
     # REFER: https://realpython.com/command-line-interfaces-python-argparse/
     # REFER: https://stackoverflow.com/questions/19124304/what-does-metavar-and-action-mean-in-argparse-in-python
@@ -2386,17 +3324,22 @@ def parse_args() -> argparse.Namespace:
                            '--path',
                            metavar='PATH',
                            action='store',
+                           nargs='+',
                            type=str,
-                           required=True,
-                           help='Path to graph/network (i.e. data/testcase file')
+                           help='Path to graph/network (i.e. data/testcase file). Multiple files, directories'
+                                '\n(all the files directly inside it) and quoted globs can be given. All of them are'
+                                '\nsolved by this one process, and a single scheduler shared by all the networks'
+                                '\nensures that at most `--jobs` solver instances run in parallel'
+                                '\nRequirement: required unless `--daemon` is used'
+                                "\nExample: -p Files/Data/m1_m2/d1_Sample_input_cycle_twoloop.dat 'Files/Data/m3_m4/*'")
 
     my_parser.add_argument('--solver-models',
                            metavar='VAL',
                            action='append',
                            nargs='+',
                            type=parser_check_solver_models,
-                           required=True,
                            help='Space separated `SOLVER_NAME MODEL_NUMBER [MODEL_NUMBER ...]`'
+                                '\nRequirement: required unless `--daemon` is used'
                                 '\nNote:'
                                 f'\n  • AVAILABLE SOLVERS = {AutoExecutorSettings.AVAILABLE_SOLVERS}'
                                 f'\n  • AVAILABLE MODELS = {list(AutoExecutorSettings.AVAILABLE_MODELS.keys())}'
@@ -2439,23 +3382,179 @@ def parse_args() -> argparse.Namespace:
                                 '\nRequirement: N >= -1'
                                 '\nNote:'
                                 '\n  • N=0 -> Number of solver model combinations due to `--solver-models` parameter'
-                                '\n  • N=-1 -> `nproc` or `len(os.sched_getaffinity(0))`')
+                                '\n  • N=-1 -> `nproc` or `len(os.sched_getaffinity(0))`'
+                                '\n  • If `-p` has multiple networks, then N is for all of them put together, and'
+                                '\n    N=0 is same as N=-1')
+
+    my_parser.add_argument('--min-free-ram',
+                           metavar='GiB',
+                           action='store',
+                           type=parser_check_non_negative_float,
+                           default=2,
+                           help='A solver instance is launched only if this much RAM remains available after'
+                                '\nsubtracting the RAM it is expected to use (peak RAM used by the same solver and'
+                                '\nmodel on a network of similar size in the earlier runs) [default: %(default)s]')
+
+    my_parser.add_argument('--min-free-swap',
+                           metavar='GiB',
+                           action='store',
+                           type=parser_check_non_negative_float,
+                           default=8,
+                           help='A solver instance is launched only if this much Swap is free. Not checked if the'
+                                '\nsystem has less Swap than this [default: %(default)s]')
+
+    my_parser.add_argument('--no-race',
+                           action='store_true',
+                           help='Do not stop the solvers early. By default, all the solvers are stopped as soon as'
+                                '\nthe optimal solution is known, i.e. a solver reports the solution found to be'
+                                '\nglobally optimal, or the best feasible solution meets the best lower bound'
+                                '\nreported by Baron/Octeract for the same model (within `--race-tolerance`).')
+
+    my_parser.add_argument('--race-tolerance',
+                           metavar='GAP',
+                           action='store',
+                           type=parser_check_non_negative_float,
+                           default=1e-4,
+                           help='Relative gap between the best feasible solution and the best lower bound at which'
+                                '\nthe solution is considered to be optimal [default: 1e-4]')
+
+    my_parser.add_argument('--target-cost',
+                           metavar='COST',
+                           action='store',
+                           type=parser_check_non_negative_float,
+                           default=None,
+                           help='Stop all the solvers as soon as any of them finds a feasible solution with'
+                                '\ntotal cost <= COST [default: disabled]')
+
+    my_parser.add_argument('--target-gap',
+                           metavar='GAP',
+                           action='store',
+                           type=parser_check_non_negative_float,
+                           default=None,
+                           help='Stop all the solvers as soon as the relative gap between the best feasible solution'
+                                '\nand the best lower bound reported by Baron/Octeract for the same model is <= GAP'
+                                '\n[default: disabled]'
+                                '\nExample: `--target-gap 0.01` -> within 1%% of optimal')
+
+    my_parser.add_argument('--plateau-time',
+                           metavar='SECONDS',
+                           action='store',
+                           type=parser_check_non_negative_float,
+                           default=None,
+                           help='Stop all the solvers once the best feasible solution found by any of them has not'
+                                '\nimproved by more than `--plateau-tolerance` for SECONDS seconds [default: disabled]'
+                                '\nExample: `--time 0:5:0 --plateau-time 30` -> returns after 1 minute if the best'
+                                '\nsolution was found in the first 30 seconds')
+
+    my_parser.add_argument('--plateau-tolerance',
+                           metavar='GAP',
+                           action='store',
+                           type=parser_check_non_negative_float,
+                           default=1e-3,
+                           help='Relative improvement of the best feasible solution smaller than this is ignored by'
+                                '\n`--plateau-time` [default: 1e-3]')
+
+    my_parser.add_argument('--plateau-min-time',
+                           metavar='SECONDS',
+                           action='store',
+                           type=parser_check_non_negative_float,
+                           default=60,
+                           help='The solvers are never stopped by `--plateau-time` before SECONDS seconds'
+                                ' [default: %(default)s]')
+
+    my_parser.add_argument('--max-extra-time',
+                           metavar='SECONDS',
+                           action='store',
+                           type=parser_check_non_negative_float,
+                           default=300,
+                           help='If no solver found a feasible solution within `--time`, then keep them running for'
+                                '\nat most SECONDS more seconds while any of them is still improving its bounds'
+                                '\n(checked every 30 seconds) [default: %(default)s]')
+
+    my_parser.add_argument('--no-cache',
+                           action='store_true',
+                           help='Always launch the solvers. By default, if the same network (i.e. same file hash) was'
+                                '\nalready solved with an equal or longer `--time`, and its best result was found by'
+                                '\none of the `--solver-models` combinations, then the stored result is returned'
+                                '\nwithout launching any solver.')
+
+    my_parser.add_argument('--no-warm-start',
+                           action='store_true',
+                           help='Do not set the initial values of the variables of model m1 and m2 using the best'
+                                '\nsolution found by the earlier runs on the same network (and do not pass the'
+                                '\nobjective cutoff to Baron)')
+
+    my_parser.add_argument('--no-stub-cache',
+                           action='store_true',
+                           help='Start a separate AMPL session for every solver instance. By default, AMPL writes the'
+                                '\n`.nl` stub of every model once (it is cached in `NetworkResults/NlStubCache`), and'
+                                '\nthe solvers are run directly on it')
+
+    my_parser.add_argument('--portfolio',
+                           action='store',
+                           choices=['all', 'auto'],
+                           default='all',
+                           help='Which solver-model combinations of `--solver-models` are launched [default: all]'
+                                '\n  • all -> all of them'
+                                '\n  • auto -> only the `--portfolio-size` combinations which most often found the'
+                                '\n            best cost (and found it fastest) on the earlier runs of networks'
+                                '\n            with similar size, number of loops and demand spread. All of them'
+                                '\n            are launched if there are no such runs')
+
+    my_parser.add_argument('--portfolio-size',
+                           metavar='N',
+                           action='store',
+                           type=parser_check_threads_int_range,
+                           default=2,
+                           help='Number of solver-model combinations launched with `--portfolio auto`'
+                                ' [default: %(default)s]')
+
+    my_parser.add_argument('--launcher',
+                           action='store',
+                           choices=['direct', 'tmux'],
+                           default='direct',
+                           help='How the AMPL/GAMS instances are started [default: direct]'
+                                '\n  • direct -> child process in its own process group, output written to'
+                                '\n              `std_out_err.txt` of the instance'
+                                '\n  • tmux -> inside a tmux session which can be attached to for debugging'
+                                '\n            (`tmux ls` shows the sessions), requires `tmux`')
 
     my_parser.add_argument('--debug',
                            action='store_true',
                            help='Print debug information.')
 
-    return my_parser.parse_args()
+    my_parser.add_argument('--daemon',
+                           action='store_true',
+                           help='Do not solve anything, instead keep running and accept solve requests over the Unix'
+                                '\nsocket `--socket`. All the requests share one database connection and one'
+                                '\nscheduler which ensures that at most `--jobs` CPU cores are used by the solvers'
+                                '\n(`--jobs` 0 or -1 means all the CPU cores).'
+                                '\nRefer `CalculateNetworkCost_DaemonClient.py` for the protocol.')
+
+    my_parser.add_argument('--socket',
+                           metavar='PATH',
+                           action='store',
+                           type=str,
+                           default=g_DEFAULT_DAEMON_SOCKET_PATH,
+                           help=f'Path of the Unix socket used by `--daemon` [default: {g_DEFAULT_DAEMON_SOCKET_PATH}]')
+
+    args = my_parser.parse_args(argv)
+    if not args.daemon:
+        if args.path is None:
+            my_parser.error('the following arguments are required: -p/--path')
+        if args.solver_models is None:
+            my_parser.error('the following arguments are required: --solver-models')
+    return args
 
 
 # ---
 
-def check_requirements():
+def check_requirements(args: argparse.Namespace):
     """
     Check if the basic requirements for this code/program/script to properly execute are satisfied or not
     """
     ok, res = run_command('which tmux')
-    if not ok:
+    if args.launcher == 'tmux' and not ok:
         print('`tmux` not installed')
         exit(1)
     ok, res = run_command('which bash')
@@ -2467,15 +3566,340 @@ def check_requirements():
 
 # ---
 
-if __name__ == '__main__':
-    check_requirements()
+class DaemonJob:
+    def __init__(self, job_id: str, args: argparse.Namespace):
+        """One solve request accepted by `SolverOrchestrationDaemon`"""
+        self.job_id: str = job_id
+        self.args: argparse.Namespace = args
+        self.state: str = 'queued'  # queued -> running -> finished/failed
+        self.error: str = ''
+        self.output_dir: str = ''
+        self.submit_time: float = time.time()
+        self.finish_time: Optional[float] = None
+        # Set once the job is finished or failed, see the "wait" command of `SolverOrchestrationDaemon`
+        self.done = threading.Event()
+
+    def to_dict(self) -> Dict:
+        status = ''
+        status_file_path = f'{self.output_dir}/0_status'
+        if self.output_dir != '' and os.path.isfile(status_file_path):
+            with open(status_file_path, 'r') as status_file:
+                status = status_file.read().strip()
+        return dict(
+            job_id=self.job_id,
+            state=self.state,
+            error=self.error,
+            path=self.args.path[0],
+            output_dir=self.output_dir,
+            result_file=(f'{self.output_dir}/0_result.txt' if self.output_dir != '' else ''),
+            status=status,
+            submit_time=self.submit_time,
+            finish_time=self.finish_time,
+        )
+
 
+class SolverOrchestrationDaemon:
+    # Finished jobs are forgotten (i.e. "status" reports an unknown job_id) after these many seconds
+    JOB_TTL = 24 * 60 * 60
+
+    def __init__(
+            self,
+            socket_path: str,
+            max_parallel_solvers: int,
+            launcher: str,
+            debug: bool,
+            min_free_ram: float = 0.0,
+            min_free_swap: float = 0.0
+    ):
+        """
+        Long-running mode of this program (see `--daemon`). This avoids paying the startup cost of this program for
+        every network submitted by Jaltantra, and makes all the requests share one view of the server.
+
+        Protocol: each request and each response is one JSON object on a single line
+            {"cmd": "ping"}
+            {"cmd": "solve", "path": "...", "solver_models": ["baron 1 2", ...], "time": "0:5:0", "prefix": "5min"}
+                -> {"ok": true, "job_id": "..."}
+            {"cmd": "status", "job_id": "..."}
+                -> {"ok": true, "job": {"state": "queued|running|finished|failed", "status": "...", ...}}
+            {"cmd": "wait", "job_id": "...", "timeout": 60}
+                -> same as "status", sent once the job is finished/failed or "timeout" (optional) seconds passed
+        A relative "path" is resolved against the working directory of the daemon, so the clients should send absolute
+        paths. The jobs of the same network (same file hash) are executed one after the other. The finished jobs are
+        forgotten after `SolverOrchestrationDaemon.JOB_TTL` seconds.
+
+        Args:
+            socket_path: Path of the Unix socket to listen on
+            max_parallel_solvers: Maximum number of CPU cores which can be used by the solvers of all the requests
+            launcher: Value of `--launcher` for all the requests
+            debug: Value of `--debug` for all the requests
+            min_free_ram: Value of `--min-free-ram` for all the requests, see `SolverSlotScheduler`
+            min_free_swap: Value of `--min-free-swap` for all the requests, see `SolverSlotScheduler`
+        """
+        self.socket_path = socket_path
+        self.launcher = launcher
+        self.debug = debug
+        self.scheduler = SolverSlotScheduler(max_parallel_solvers, min_free_ram, min_free_swap)
+        self.jobs: Dict[str, DaemonJob] = dict()
+        self.__jobs_lock = threading.Lock()
+        # Hash of the network file -> lock held by the job solving it. The output directory and the database rows
+        # are identified by the hash of the file, so the jobs of the same network are executed one after the other
+        self.__network_locks: Dict[str, threading.Lock] = dict()
+        # Hash of the network file -> number of jobs holding or waiting for its lock, the lock is removed at 0
+        self.__network_lock_users: Dict[str, int] = dict()
+        self.__job_counter = itertools.count(1)
+
+    def handle_request(self, request: Dict) -> Dict:
+        cmd = request.get('cmd')
+        if cmd == 'ping':
+            return dict(ok=True, pid=os.getpid(), max_slots=self.scheduler.max_slots,
+                        used_slots=self.scheduler.used_slots)
+        if cmd == 'solve':
+            return self.submit(request)
+        if cmd in ('status', 'wait'):
+            with self.__jobs_lock:
+                job = self.jobs.get(str(request.get('job_id')))
+            if job is None:
+                return dict(ok=False, error=f"unknown job_id: '{request.get('job_id')}'")
+            if cmd == 'wait':
+                # NOTE: Every connection is handled by its own thread, so blocking here does not block other requests
+                timeout = request.get('timeout')
+                job.done.wait(None if timeout is None else float(timeout))
+            return dict(ok=True, job=job.to_dict())
+        return dict(ok=False, error=f"unknown cmd: '{cmd}'")
+
+    def prune_jobs(self) -> None:
+        """Forget the jobs which finished more than `SolverOrchestrationDaemon.JOB_TTL` seconds ago"""
+        now = time.time()
+        with self.__jobs_lock:
+            expired = [job_id for job_id, job in self.jobs.items()
+                       if job.finish_time is not None and now - job.finish_time > self.JOB_TTL]
+            for job_id in expired:
+                del self.jobs[job_id]
+        if len(expired) > 0:
+            g_logger.debug(f'Forgot {len(expired)} finished jobs')
+
+    def submit(self, request: Dict) -> Dict:
+        argv = ['--time', str(request.get('time', '0:5:0')), '--prefix', str(request.get('prefix', '5min'))]
+        if 'path' in request:
+            argv += ['-p', str(request['path'])]
+        for solver_models in request.get('solver_models', list()):
+            argv += ['--solver-models', str(solver_models)]
+        if 'threads_per_solver_instance' in request:
+            argv += ['--threads-per-solver-instance', str(request['threads_per_solver_instance'])]
+        if 'jobs' in request:
+            argv += ['--jobs', str(request['jobs'])]
+        if request.get('no_race', False):
+            argv.append('--no-race')
+        if request.get('no_cache', False):
+            argv.append('--no-cache')
+        if request.get('no_warm_start', False):
+            argv.append('--no-warm-start')
+        if request.get('no_stub_cache', False):
+            argv.append('--no-stub-cache')
+        if 'race_tolerance' in request:
+            argv += ['--race-tolerance', str(request['race_tolerance'])]
+        if 'target_cost' in request:
+            argv += ['--target-cost', str(request['target_cost'])]
+        if 'target_gap' in request:
+            argv += ['--target-gap', str(request['target_gap'])]
+        if 'plateau_time' in request:
+            argv += ['--plateau-time', str(request['plateau_time'])]
+        if 'plateau_tolerance' in request:
+            argv += ['--plateau-tolerance', str(request['plateau_tolerance'])]
+        if 'plateau_min_time' in request:
+            argv += ['--plateau-min-time', str(request['plateau_min_time'])]
+        if 'max_extra_time' in request:
+            argv += ['--max-extra-time', str(request['max_extra_time'])]
+        if 'portfolio' in request:
+            argv += ['--portfolio', str(request['portfolio'])]
+        if 'portfolio_size' in request:
+            argv += ['--portfolio-size', str(request['portfolio_size'])]
+        argv += ['--launcher', self.launcher]
+        if self.debug:
+            argv.append('--debug')
+        try:
+            args = parse_args(argv)
+        except SystemExit:
+            # `argparse` has already printed the reason to stderr
+            return dict(ok=False, error=f'invalid request: {argv}')
+        if not os.path.isfile(args.path[0]):
+            return dict(ok=False, error=f"Cannot access '{args.path[0]}': No such file")
+
+        self.prune_jobs()
+        job = DaemonJob(f'{int(time.time())}_{next(self.__job_counter)}', args)
+        with self.__jobs_lock:
+            self.jobs[job.job_id] = job
+        threading.Thread(target=self.run_job, args=(job,), name=f'job_{job.job_id}', daemon=True).start()
+        g_logger.info(f'Accepted job={job.job_id}, {argv=}')
+        return dict(ok=True, job_id=job.job_id)
+
+    def acquire_network_lock(self, data_file_hash: str) -> threading.Lock:
+        """Returns: the lock of the network, which must be released with `self.release_network_lock()`"""
+        with self.__jobs_lock:
+            network_lock = self.__network_locks.setdefault(data_file_hash, threading.Lock())
+            self.__network_lock_users[data_file_hash] = self.__network_lock_users.get(data_file_hash, 0) + 1
+        network_lock.acquire()
+        return network_lock
+
+    def release_network_lock(self, data_file_hash: str) -> None:
+        with self.__jobs_lock:
+            self.__network_locks[data_file_hash].release()
+            self.__network_lock_users[data_file_hash] -= 1
+            if self.__network_lock_users[data_file_hash] == 0:
+                del self.__network_lock_users[data_file_hash]
+                del self.__network_locks[data_file_hash]
+
+    def run_job(self, job: DaemonJob) -> None:
+        try:
+            my_settings = update_settings(job.args, job.args.path[0])
+            my_settings.set_job_id(job.job_id)
+            my_settings.scheduler = self.scheduler
+            with self.__jobs_lock:
+                is_queued = my_settings.data_file_hash in self.__network_locks
+            if is_queued:
+                g_logger.info(f'job={job.job_id} is queued as another job is solving the same network '
+                              f'{my_settings.data_file_hash}')
+            self.acquire_network_lock(my_settings.data_file_hash)
+            try:
+                job.state = 'running'
+                job.output_dir = my_settings.output_dir_level_1_network_specific
+                main(my_settings)
+            finally:
+                self.release_network_lock(my_settings.data_file_hash)
+            job.state = 'finished'
+        except SystemExit as e:
+            # `main` calls `exit()` for errors which should end the request, not the daemon
+            job.state = 'failed'
+            job.error = f'exit code {e.code}'
+        except Exception as e:
+            job.state = 'failed'
+            job.error = f'{type(e)}: {e}'
+            g_logger.error(f'FIXME: job={job.job_id}, {type(e)},\n\nException e:\n{e}\n\n'
+                           f'trace:\n{traceback.format_exc()}')
+        job.finish_time = time.time()
+        job.done.set()
+        g_logger.info(f'Finished job={job.job_id}, state={job.state}')
+
+    def serve_forever(self) -> None:
+        daemon = self
+
+        class RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    if line.strip() == b'':
+                        continue
+                    try:
+                        response = daemon.handle_request(json.loads(line))
+                    except Exception as e:
+                        response = dict(ok=False, error=f'{type(e)}: {e}')
+                    self.wfile.write((json.dumps(response) + '\n').encode())
+                    self.wfile.flush()
+
+        # Remove the socket left behind by a previous daemon which did not stop properly
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        with socketserver.ThreadingUnixStreamServer(self.socket_path, RequestHandler) as server:
+            os.chmod(self.socket_path, 0o600)
+            g_logger.warning(f"Daemon listening on '{self.socket_path}', {self.scheduler.max_slots=}")
+            try:
+                server.serve_forever()
+            finally:
+                os.remove(self.socket_path)
+
+
+def main_daemon(args: argparse.Namespace) -> None:
+    if args.jobs == 0 or args.jobs == -1:
+        max_parallel_solvers = len(os.sched_getaffinity(0))
+    else:
+        max_parallel_solvers = args.jobs
+    SolverOrchestrationDaemon(
+        args.socket, max_parallel_solvers, args.launcher, args.debug, args.min_free_ram, args.min_free_swap
+    ).serve_forever()
+
+
+def main_batch(args: argparse.Namespace, data_file_paths: List[str]) -> None:
+    """
+    Solve all the networks in `data_file_paths` in parallel. Every network is handled by `main()` in its own thread,
+    and all of them share one `SolverSlotScheduler`, so at most `--jobs` solver instances run in parallel.
+    """
+    if args.jobs == 0 or args.jobs == -1:
+        max_parallel_solvers = len(os.sched_getaffinity(0))
+    else:
+        max_parallel_solvers = args.jobs
+    scheduler = SolverSlotScheduler(
+        max_parallel_solvers * args.threads_per_solver_instance, args.min_free_ram, args.min_free_swap
+    )
+    g_logger.info(f'Networks = {len(data_file_paths)}, {scheduler.max_slots=}')
+
+    # `--jobs` applies to all the networks put together (i.e. `scheduler`), every network can use all of its slots
+    network_args = argparse.Namespace(**vars(args))
+    network_args.jobs = 0
+
+    network_threads: List[threading.Thread] = list()
+    data_file_hashes = set()
+    for data_file_path in data_file_paths:
+        my_settings = update_settings(network_args, data_file_path)
+        # NOTE: The output directory and the database rows are identified by the hash of the file
+        if my_settings.data_file_hash in data_file_hashes:
+            g_logger.warning(f"Skipping '{data_file_path}' as a network with the same content is already being solved")
+            continue
+        data_file_hashes.add(my_settings.data_file_hash)
+        # The tmux sessions of every network are counted and stopped using `TMUX_UNIQUE_PREFIX`
+        my_settings.set_job_id(my_settings.data_file_hash[:8])
+        my_settings.scheduler = scheduler
+        network_threads.append(threading.Thread(
+            target=main_batch_network, args=(my_settings,), name=f'network_{my_settings.data_file_hash[:8]}'
+        ))
+        network_threads[-1].start()
+    for network_thread in network_threads:
+        network_thread.join()
+
+
+def main_batch_network(my_settings: AutoExecutorSettings) -> None:
+    g_logger.info(f"START network '{my_settings.data_file_path}'")
+    try:
+        main(my_settings)
+    except SystemExit as e:
+        # `main` calls `exit()` for errors which should end the solving of this network, not of the others
+        g_logger.error(f"Network '{my_settings.data_file_path}' failed, exit code {e.code}")
+    except Exception as e:
+        g_logger.error(f"FIXME: network '{my_settings.data_file_path}', {type(e)},\n\nException e:\n{e}\n\n"
+                       f'trace:\n{traceback.format_exc()}')
+    g_logger.info(f"FINISHED network '{my_settings.data_file_path}'")
+
+
+# ---
+
+if __name__ == '__main__':
     args: argparse.Namespace = parse_args()
-    my_settings: AutoExecutorSettings = update_settings(args)
+    check_requirements(args)
+    setup_logging(args.debug)
     setup_database()
+    if args.daemon:
+        g_logger.info('START daemon')
+        try:
+            main_daemon(args)
+        except KeyboardInterrupt:
+            pass
+        cursor.connection.close()
+        g_logger.info('FINISHED daemon')
+        exit(0)
+
+    data_file_paths: List[str] = expand_data_file_paths(args.path)
+    if len(data_file_paths) == 0:
+        g_logger.error(f'No graph/network (i.e. data/testcase file) found in {args.path}')
+        exit(2)
     g_logger.info('START main program')
+    if len(data_file_paths) > 1:
+        main_batch(args, data_file_paths)
+        cursor.connection.close()
+        g_logger.info('FINISHED main program')
+        exit(0)
+
+    my_settings: AutoExecutorSettings = update_settings(args, data_file_paths[0])
     try:
         main(my_settings)
     except Exception as e:
         g_logger.error(f'FIXME: {type(e)},\n\nException e:\n{e}\n\ntrace:\n{traceback.format_exc()}')
+    cursor.connection.close()
     g_logger.info('FINISHED main program')
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import socket
+import sys
+from typing import Dict
+
+# NOTE: Only the Python standard library should be used in this file, because the whole point of
+#       `CalculateNetworkCost.py --daemon` is to avoid paying the startup cost for every request
+
+
+def send_request(socket_path: str, request: Dict) -> Dict:
+    """Send one request to `CalculateNetworkCost.py --daemon` and return its response"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall((json.dumps(request) + '\n').encode())
+        sock.shutdown(socket.SHUT_WR)
+        response = b''
+        while not response.endswith(b'\n'):
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            response += chunk
+    return json.loads(response)
+
+
+def parse_args() -> argparse.Namespace:
+    my_parser = argparse.ArgumentParser(
+        prog='CalculateNetworkCost_DaemonClient.py',
+        description='Submit solve requests to `CalculateNetworkCost.py --daemon` and query their status'
+    )
+    my_parser.add_argument('--socket', metavar='PATH', type=str, default='./CalculateNetworkCost_daemon.sock',
+                           help='Path of the Unix socket of the daemon')
+    sub_parsers = my_parser.add_subparsers(dest='cmd', required=True)
+
+    sub_parsers.add_parser('ping', help='Check if the daemon is running')
+
+    solve_parser = sub_parsers.add_parser('solve', help='Submit a network, prints the job id')
+    solve_parser.add_argument('-p', '--path', metavar='PATH', type=str, required=True)
+    solve_parser.add_argument('--solver-models', metavar='VAL', action='append', nargs='+', required=True)
+    solve_parser.add_argument('--time', metavar='HH:MM:SS', type=str, default='0:5:0')
+    solve_parser.add_argument('--prefix', metavar='Xmin', type=str, default='5min')
+    solve_parser.add_argument('--wait', action='store_true',
+                              help='Block until the job finishes (same behaviour as `CalculateNetworkCost.py`)')
+
+    status_parser = sub_parsers.add_parser('status', help='Print the status of a job')
+    status_parser.add_argument('job_id', type=str)
+
+    wait_parser = sub_parsers.add_parser('wait', help='Block until the job finishes, and print its status')
+    wait_parser.add_argument('job_id', type=str)
+
+    return my_parser.parse_args()
+
+
+def main(args: argparse.Namespace) -> Dict:
+    if args.cmd == 'ping':
+        return send_request(args.socket, dict(cmd='ping'))
+    if args.cmd in ('status', 'wait'):
+        return send_request(args.socket, dict(cmd=args.cmd, job_id=args.job_id))
+    response = send_request(args.socket, dict(
+        cmd='solve',
+        # NOTE: The daemon may be running in some other working directory
+        path=os.path.abspath(args.path),
+        solver_models=[j for i in args.solver_models for j in i],
+        time=args.time,
+        prefix=args.prefix,
+    ))
+    if response['ok'] and args.wait:
+        print(json.dumps(response), flush=True)
+        # The daemon responds as soon as the job finishes
+        response = send_request(args.socket, dict(cmd='wait', job_id=response['job_id']))
+    return response
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    try:
+        response = main(args)
+    except (OSError, ValueError) as e:
+        # e.g. the daemon was killed and its socket file was left behind (ConnectionRefusedError), or it stopped
+        # while handling the request (empty response)
+        response = dict(ok=False, error=f'unable to communicate with the daemon, {type(e)}: {e}')
+    print(json.dumps(response, indent=2))
+    if not response['ok'] or response.get('job', dict()).get('state') == 'failed':
+        sys.exit(1)
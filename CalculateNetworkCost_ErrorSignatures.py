@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Error signatures of AMPL and the solvers, used by `SolverOutputAnalyzer*.check_errors()` of `CalculateNetworkCost.py`
+to find out why a solver instance failed from its `std_out_err.txt`.
+
+Every solver has a table (list) of `ErrorSignature` in the order in which they are checked. `ErrorScanner` searches
+every distinct pattern of a table only once in the file content (a pattern may be used by many signatures), and the
+result is reused until the size or modification time of the file changes (see `ErrorScanner.check_file()`).
+"""
+import logging
+import os
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from CalculateNetworkCost_SolverLogs import OCTERACT_TABLE_HEADER
+
+g_logger = logging.getLogger('CNC')
+
+# (file content, start index of the match) -> error message, None if the signature does not apply
+MessageFunction = Callable[[str, int], Optional[str]]
+
+
+def whole_file(file_txt: str, start: int) -> str:
+    return file_txt.strip()
+
+
+def from_match(file_txt: str, start: int) -> str:
+    return file_txt[start:]
+
+
+def till(end_marker: str, end_required: bool = False) -> MessageFunction:
+    """
+    Returns:
+        Message from the match till `end_marker` as a single line. If `end_marker` is absent, then the message is
+        till the end of the file, or None if `end_required` is True
+    """
+    def message(file_txt: str, start: int) -> Optional[str]:
+        end = file_txt.find(end_marker, start)
+        if end == -1:
+            return None if end_required else file_txt[start:]
+        return file_txt[start:end].replace('\n', ' ').strip()
+    return message
+
+
+def constant(msg: str) -> MessageFunction:
+    return lambda file_txt, start: msg
+
+
+class ErrorSignature:
+    def __init__(
+            self,
+            pattern: str,
+            message: MessageFunction,
+            requires: Iterable[str] = (),
+            excludes: Iterable[str] = (),
+            is_error: bool = True
+    ):
+        """
+        Args:
+            pattern: Regex searched in the file (use `re.escape()` for plain text)
+            message: Gives the error message if the signature matches
+            requires: Regexes which must also be present anywhere in the file for this signature to match
+            excludes: Regexes which must not be present anywhere in the file for this signature to match
+            is_error: False for the signatures which tell that the output is fine, e.g. the solver started the
+                iterations, so the signatures after it need not be checked
+        """
+        self.pattern = pattern
+        self.message = message
+        self.requires = tuple(requires)
+        self.excludes = tuple(excludes)
+        self.is_error = is_error
+
+
+class ErrorScanner:
+    def __init__(self, signatures: List[ErrorSignature]):
+        self.signatures = signatures
+        self.patterns: List[str] = list()
+        for signature in signatures:
+            for pattern in (signature.pattern, *signature.requires, *signature.excludes):
+                if pattern not in self.patterns:
+                    self.patterns.append(pattern)
+        self.pattern_regexes = [re.compile(pattern) for pattern in self.patterns]
+
+    def scan(self, file_txt: str) -> Dict[str, int]:
+        """Returns: pattern -> start index of its first match, for all the patterns present in `file_txt`"""
+        # NOTE: One `search()` per pattern is much faster than one combined regex of all the patterns, because the
+        #       regex engine finds the literal prefix of a single pattern using a fast substring search, instead of
+        #       trying every alternative at every position of the file
+        first_match: Dict[str, int] = dict()
+        for pattern, regex in zip(self.patterns, self.pattern_regexes):
+            match = regex.search(file_txt)
+            if match:
+                first_match[pattern] = match.start()
+        return first_match
+
+    def check(self, file_txt: str) -> Tuple[bool, str]:
+        """
+        Returns:
+            A boolean value telling whether everything is ok (True) or not (False)
+            A string value containing the error message
+        """
+        first_match = self.scan(file_txt)
+        for signature in self.signatures:
+            if signature.pattern not in first_match \
+                    or any(i not in first_match for i in signature.requires) \
+                    or any(i in first_match for i in signature.excludes):
+                continue
+            msg = signature.message(file_txt, first_match[signature.pattern])
+            if msg is None:
+                continue
+            g_logger.debug(msg)
+            return not signature.is_error, msg
+        return True, 'No Errors'
+
+    def check_file(
+            self,
+            file_path: str,
+            cache: Optional[Dict[str, Tuple[Tuple[int, int], Tuple[bool, str]]]] = None
+    ) -> Tuple[bool, str]:
+        """
+        Same as `check()` for the content of `file_path`
+
+        Args:
+            file_path: std_out_err.txt of the solver instance
+            cache: (size, modification time) of the file and the result are stored here with `file_path` as the key,
+                and the file is scanned again only if its size or modification time changed
+
+        Raises:
+            OSError: if the file could not be read
+        """
+        stat = os.stat(file_path)
+        file_version = (stat.st_size, stat.st_mtime_ns)
+        if cache is not None and file_path in cache and cache[file_path][0] == file_version:
+            return cache[file_path][1]
+        with open(file_path, 'r') as f:
+            result = self.check(f.read())
+        if cache is not None:
+            cache[file_path] = (file_version, result)
+        return result
+
+
+# ---
+
+CANT_FIND_FILE_REGEX = r'''Can't\s+find\s+file\s+['"]?.+['"]?'''
+
+# Errors due to AMPL, checked before the errors of every solver run using AMPL
+AMPL_ERROR_SIGNATURES = [
+    # AMPL binary does not exist
+    ErrorSignature(re.escape('no such file or directory: ./ampl.linux-intel64/ampl'), whole_file),
+    # Execute permission not available for AMPL
+    ErrorSignature(re.escape('permission denied: ./ampl.linux-intel64/ampl'), whole_file),
+    # Execute permission not available for Solver
+    ErrorSignature(
+        re.escape('Permission denied'),
+        lambda file_txt, start: file_txt[:start + len('Permission denied') + 1].strip(),
+        requires=[re.escape('Cannot invoke')]
+    ),
+    # AMPL demo licence limitation
+    ErrorSignature(re.escape('Sorry, a demo license for AMPL is limited to'), till('ampl:')),
+    # Probable explanation: some error occurred before the presolve phase
+    ErrorSignature(re.escape('Error executing "solve" command:'), till('<BREAK>')),
+    # Solver did not proceed due to some impossible situations, e.g. X should be <= 3 and >= 7
+    ErrorSignature(
+        re.escape('_total_solve_time = 0'),
+        lambda file_txt, start: file_txt[file_txt.index('presolve:'):file_txt.index('_total_solve_time')],
+        requires=[re.escape('presolve:')]
+    ),
+]
+
+BARON_ERROR_SIGNATURES = AMPL_ERROR_SIGNATURES + [
+    ErrorSignature(re.escape('Sorry, a demo license is limited to 10 variables'), till('exit value 1', True)),
+    ErrorSignature(CANT_FIND_FILE_REGEX, from_match),
+    ErrorSignature(re.escape('No feasible solution was found'), constant('No feasible solution was found')),
+]
+
+KNITRO_ERROR_SIGNATURES = AMPL_ERROR_SIGNATURES + [
+    ErrorSignature(re.escape('Sorry, a demo license is limited to 10 variables'), till('exit value 1', True)),
+    ErrorSignature(CANT_FIND_FILE_REGEX, from_match),
+    # Knitro bug, it reports 1.8e+308 as the objective value
+    ErrorSignature(r'1\.8(?:0?)e\+308', from_match),
+    ErrorSignature(re.escape('No feasible solution was found'), constant('No feasible solution was found')),
+    ErrorSignature('infeasible', constant('No feasible solution was found')),
+]
+
+
+def octeract_presolve_message(file_txt: str, start: int) -> str:
+    if '_total_solve_time' in file_txt:
+        return file_txt[:file_txt.index('_total_solve_time')].strip()
+    return file_txt[:start + len('presolve messages suppressed') + 1].strip()
+
+
+OCTERACT_CONNECTION_ERROR = re.escape('Error: Failed to establish connection to server.')
+
+OCTERACT_ERROR_SIGNATURES = [
+    ErrorSignature(re.escape('Found solution during preprocessing'),
+                   constant('Solution found during preprocessing'), is_error=False),
+    ErrorSignature(re.escape(OCTERACT_TABLE_HEADER), constant('Probably No Errors'), is_error=False),
+    *AMPL_ERROR_SIGNATURES,
+    ErrorSignature(CANT_FIND_FILE_REGEX, from_match),
+    ErrorSignature(re.escape('Request_Error'), till('exit value 1')),
+    # Octeract solver failed to establish connection to their server. Hence, it does not proceed with the solving.
+    # If the solver output (i.e. its table) is present, then the connection error did not stop it
+    ErrorSignature(OCTERACT_CONNECTION_ERROR, till('ampl:'), excludes=['-' * 96]),
+    ErrorSignature(OCTERACT_CONNECTION_ERROR, till('ampl:'), requires=[re.escape("can't open /tmp/at")]),
+    ErrorSignature(re.escape('presolve messages suppressed'), octeract_presolve_message),
+    ErrorSignature(
+        re.escape('all variables eliminated, but lower bound'),
+        lambda file_txt, start: file_txt[:file_txt.index('_total_solve_time')],
+        requires=[re.escape('_total_solve_time')]
+    ),
+]
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+GAMS runs of model m1/m2 (e.g. alphaecp), and the conversion of their result to the output printed by the AMPL
+`display` commands of `AutoExecutorSettings.start_solver()` of `CalculateNetworkCost.py`, so that the result of the
+solvers run using GAMS is processed in the same way as the result of the solvers run using AMPL.
+
+`network_to_gms()` generates the `.gms` file of model m1/m2 for a parsed network, and `GmsCache` writes it once per
+network, so that any network can be solved using GAMS without an external conversion step.
+
+`solution_export_program()` wraps the `.gms` file of a network so that GAMS does not write the compilation echo and
+the solution listing to the listing file (`.lst`), and instead writes the values of `h`, `q`/`q1`/`q2` and `l`, the
+objective value, the model/solver status and the solve time to a CSV file (see `read_solution_csv()`).
+
+For the runs without this CSV file (e.g. the `.gms` file was run directly), the listing file is read line by line
+only once. `GamsListingParser` is a state machine over the solution blocks (`---- VAR h`, `---- VAR q`,
+`---- VAR q1`, `---- VAR q2` and `---- VAR l`), it keeps only the values of these variables, the objective value and
+the execution time, and not the listing itself.
+"""
+import csv
+import logging
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from CalculateNetworkCost_NetworkParser import NetworkData
+
+g_logger = logging.getLogger('CNC')
+
+# Files written to the output directory of the solver instance
+EXPORT_PROGRAM_FILE_NAME = 'gams_export.gms'
+SOLUTION_CSV_FILE_NAME = 'gams_solution.csv'
+
+# First line of the solution block of a variable, e.g. '---- VAR h  '. The variables without an index set (e.g.
+# `z`) have their values on the same line, and are not needed
+VAR_HEADER_REGEX = re.compile(r'^---- VAR (\w+)\s*$')
+OBJECTIVE_VALUE_REGEX = re.compile(r'\*\*\*\* OBJECTIVE VALUE\s+([0-9]+\.[0-9]+)')
+EXECUTION_TIME_REGEX = re.compile(r'EXECUTION TIME\s+=\s+(\d+\.\d+) SECONDS')
+
+# Variables of model m1 and m2 whose values are converted
+SOLUTION_VARIABLES = ('h', 'q', 'q1', 'q2', 'l')
+
+# States of `GamsListingParser`
+OUTSIDE_BLOCK, BEFORE_COLUMN_HEADER, BEFORE_ROWS, INSIDE_ROWS = range(4)
+
+
+def level_value(level: str) -> str:
+    """Returns: the LEVEL column of a row, GAMS prints '.' for 0 and 'EPS' for a value which is almost 0"""
+    return '0' if level in ('.', 'EPS') else level
+
+
+def is_zero(level: str) -> bool:
+    return float(level_value(level)) == 0.0
+
+
+# Models for which `network_to_gms()` can generate the GAMS source
+GMS_MODELS = ('m1', 'm2')
+
+# Same for all the networks, `network_to_gms()` writes the sets and parameters of the network before it
+GMS_SCALARS = '''Scalar omega  /10.68/;
+Scalar bnd ;
+Scalar qm;
+Scalar q_M;
+
+bnd = sum(src,D(src));
+q_M=-bnd;
+'''
+
+GMS_MODEL_EQUATIONS = {
+    'm1': '''qm=bnd;
+
+Variable l(nodes,j,pipes);
+l.lo(nodes,j,pipes)= 0;
+
+Variable q(nodes,j);
+q.lo(nodes,j)=qm;
+q.up(nodes,j)=q_M;
+
+Variables z;
+
+Variable h(nodes);
+
+Equations cost "objective function",bound1(nodes,j,pipes),cons1(nodes),cons2(nodes),cons3(nodes,j),cons5(src), cons4(nodes,j) ;
+cost..  z=e=sum(arcs(nodes,j),sum(pipes,l(arcs,pipes)*c(pipes)));
+bound1(nodes,j,pipes)$arcs(nodes,j).. l(nodes,j,pipes) =l= Len(nodes,j);
+cons1(nodes).. sum(arcs(j,nodes),q(arcs)) =e= sum(arcs(nodes,j),q(arcs)) + D(nodes);
+cons2(nodes).. h(nodes) =g= E(nodes) + P(nodes);
+cons3(arcs(nodes,j)).. h(nodes)-h(j)=e=sum(pipes,((q(arcs)*(abs(q(arcs))**0.852))*(0.001**1.852)*omega*l(arcs,pipes)/((R(pipes)**1.852)*(dis(pipes)/1000)**4.87)));
+cons4(arcs(nodes,j)).. sum(pipes,l(arcs,pipes)) =e=Len(arcs);
+cons5(src)..  h(src)=e= sum(srcs,E(srcs));
+
+model m1  /all/  ;
+solve m1 using minlp minimizing z ;
+''',
+    'm2': '''qm=0;
+
+Variable l(nodes,j,pipes); 
+l.lo(nodes,j,pipes)= 0;
+
+Variable q1(nodes,j);
+q1.lo(nodes,j)=qm;
+q1.up(nodes,j)=q_M;
+
+Variable q2(nodes,j);
+q2.lo(nodes,j)=qm;
+q2.up(nodes,j)=q_M;
+
+Variables z;
+
+Variable h(nodes);
+
+Equations cost "objective function",bound1(nodes,j,pipes),cons1(nodes),cons2(nodes),cons3(nodes,j),cons5(src), cons4(nodes,j), cons6(nodes,j) ;
+cost..  z=e=sum(arcs(nodes,j),sum(pipes,l(arcs,pipes)*c(pipes)));
+bound1(nodes,j,pipes)$arcs(nodes,j).. l(nodes,j,pipes) =l= Len(nodes,j);
+cons1(nodes).. sum(arcs(j,nodes),(q1(arcs)-q2(arcs))) =e= sum(arcs(nodes,j),(q1(arcs)-q2(arcs))) + D(nodes);
+cons2(nodes).. h(nodes) =g= E(nodes) + P(nodes);
+cons3(arcs(nodes,j)).. h(nodes)-h(j)=e=sum(pipes,(((q1(arcs)*0.001)**1.852 - (q2(arcs)*0.001)**1.852)*omega*l(arcs,pipes))/((R(pipes)**1.852)*(dis(pipes)/1000)**4.87));
+cons4(arcs(nodes,j)).. sum(pipes,l(arcs,pipes)) =e=Len(arcs);
+cons5(src)..  h(src)=e= sum(srcs,E(srcs));
+cons6(arcs(nodes,j)).. q1(arcs)*q2(arcs) =l= q_M*qm;
+
+model m2  /all/  ;
+solve m2 using minlp minimizing z ;
+''',
+}
+
+
+def gms_parameter(ids: List[str], values: Iterable[float]) -> str:
+    """Returns: list of "ID VALUE" in the format of the `.gms` files in `DataNetworkGraphInput_hashed`"""
+    items = [f'{i} {value}' for i, value in zip(ids, values)]
+    return ' ' + ', '.join([',  '.join(items[:-1]), items[-1]]) if len(items) > 1 else ''.join(items)
+
+
+def network_to_gms(network: NetworkData, model_name: str) -> str:
+    """
+    Returns:
+        GAMS source of model `model_name` ('m1' or 'm2') for `network`, same as the `.gms` files in
+        `DataNetworkGraphInput_hashed`. The model is named `model_name`, see `solution_export_program()`
+    """
+    arcs = network.arc_ids()
+    arc_lengths = ', '.join(f'{i}    .{j}    {length}' for (i, j), length in zip(arcs, network.arc_length))
+    return f'''Sets
+\tnodes /{', '.join(network.node_ids)}/
+\tpipes /{', '.join(network.pipe_ids)}/
+\tsrc(nodes) /{network.source_id}/;
+alias (src,srcs);
+alias (nodes,j) ;
+Set arcs(nodes,j) /{', '.join(f'{i}.{j}' for i, j in arcs)}/
+
+Parameters
+\tLen(nodes,j) /{arc_lengths}/
+\tE(nodes) /{gms_parameter(network.node_ids, network.elevation)}/
+\tP(nodes) /{gms_parameter(network.node_ids, network.pressure)}/
+\tD(nodes) /{gms_parameter(network.node_ids, network.demand)}/
+\tdis(pipes) /{gms_parameter(network.pipe_ids, network.pipe_diameter)}/
+\tC(pipes) /{gms_parameter(network.pipe_ids, network.pipe_cost)}/
+\tR(pipes) /{gms_parameter(network.pipe_ids, network.pipe_roughness)}/
+
+{GMS_SCALARS}{GMS_MODEL_EQUATIONS[model_name]}'''
+
+
+class GmsCache:
+    def __init__(self, cache_dir: str):
+        """
+        Args:
+            cache_dir: Directory in which the `.gms` files are stored, it is created when the first file is written
+        """
+        self.cache_dir = cache_dir
+        # NOTE: One file may be requested by multiple threads at the same time (see `--daemon` and batch mode), it
+        #       should be written only once. Different processes are handled by writing to a temporary file first.
+        self.__lock = threading.Lock()
+        self.__key_locks: Dict[str, threading.Lock] = dict()
+
+    def get(self, network: NetworkData, model_name: str) -> Optional[str]:
+        """
+        Returns:
+            Path of `<cache_dir>/<data file hash><model_name>.gms` (see `network_to_gms()`), None if the model is not
+            supported or the file could not be written
+        """
+        if model_name not in GMS_MODELS:
+            g_logger.error(f'GMS: GAMS source can not be generated for model {model_name}, supported = {GMS_MODELS}')
+            return None
+        key = f'{network.data_file_hash}{model_name}'
+        gms_file_path = f'{self.cache_dir}/{key}.gms'
+        with self.__lock:
+            key_lock = self.__key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if os.path.isfile(gms_file_path):
+                g_logger.debug(f'GMS: reusing {gms_file_path}')
+                return gms_file_path
+            tmp_file_path = f'{gms_file_path}.tmp{os.getpid()}_{threading.get_ident()}'
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with open(tmp_file_path, 'w') as f:
+                    f.write(network_to_gms(network, model_name))
+                os.replace(tmp_file_path, gms_file_path)
+            except OSError as e:
+                g_logger.warning(f"GMS: unable to write '{gms_file_path}', {type(e)}: {e}")
+                return None
+        g_logger.info(f'GMS: wrote {gms_file_path}')
+        return gms_file_path
+
+
+def solution_export_program(gms_file_path: str, model_name: str, solution_file_path: str) -> str:
+    """
+    Args:
+        gms_file_path: `.gms` file of the network (absolute path), it declares the model `model_name` and solves it
+        model_name: 'm1' or 'm2'
+        solution_file_path: CSV file to be written by GAMS (absolute path), see `read_solution_csv()`
+
+    Returns:
+        GAMS program which includes `gms_file_path` without listing it, and writes its solution to
+        `solution_file_path` in the format "NAME,INDEX...,VALUE"
+    """
+    flow_variables = ('q',) if model_name == 'm1' else ('q1', 'q2')
+    flow_puts = '\n'.join(
+        f"loop(arcs(nodes,j), put '{q}', nodes.tl, j.tl, {q}.l(nodes,j) /;);" for q in flow_variables
+    )
+    # NOTE: `option` statements are executed before the `solve` statement of the included file
+    return f'''$offlisting
+option solprint = off, limrow = 0, limcol = 0;
+$include "{gms_file_path}"
+file solution / "{solution_file_path}" /;
+solution.pc = 5;
+solution.nd = 10;
+put solution;
+put 'model_status', {model_name}.modelstat /;
+put 'solver_status', {model_name}.solvestat /;
+put 'solve_time', {model_name}.resusd /;
+put 'objective', z.l /;
+loop(nodes, put 'h', nodes.tl, h.l(nodes) /;);
+{flow_puts}
+loop((arcs(nodes,j), pipes), put 'l', nodes.tl, j.tl, pipes.tl, l.l(nodes,j,pipes) /;);
+putclose solution;
+'''
+
+
+class GamsSolution:
+    def __init__(self):
+        # Variable name -> (index, LEVEL column) of every row of its solution block, in the order of the listing
+        self.rows: Dict[str, List[Tuple[List[str], str]]] = {name: list() for name in SOLUTION_VARIABLES}
+        self.objective_value: Optional[str] = None
+        self.execution_time: Optional[str] = None
+        # `modelstat` and `solvestat` of GAMS, None if not known
+        self.model_status: Optional[int] = None
+        self.solver_status: Optional[int] = None
+
+    def ampl_output_lines(self, model_name: str) -> List[str]:
+        """
+        Returns:
+            Lines (with new line characters) in the format of the AMPL `display` commands, i.e. the sections
+            `_total_solve_time`, `h`, `q` (or `q1` and `q2` for model m2), `l`, `_total_solve_time` and `total_cost`
+
+        Raises:
+            ValueError: if the execution time or objective value is not known
+        """
+        if self.execution_time is None or self.objective_value is None:
+            raise ValueError(f'incomplete GAMS solution, execution_time={self.execution_time}, '
+                             f'objective_value={self.objective_value}')
+        out = [f'_total_solve_time = {self.execution_time}\n\n']
+
+        out.append('h[i] [*] :=\n')
+        for index, level in self.rows['h']:
+            out.append(f'{index[0]}  {float(level_value(level))}\n')
+        out.append(';\n\n')
+
+        if model_name == 'm1':
+            out.append('q[i,j] :=\n')
+            for index, level in self.rows['q']:
+                out.append(f'{index[0]} {index[1]}\t{level_value(level)}\n')
+        else:
+            # Only one of q1[i,j] and q2[i,j] is non-zero
+            out.append(':         q1[i,j]       q2[i,j]      :=\n')
+            q1 = {tuple(index): level for index, level in self.rows['q1'] if not is_zero(level)}
+            for index, level in self.rows['q2']:
+                if tuple(index) in q1:
+                    out.append(f'{index[0]} {index[1]}\t\t{q1[tuple(index)]}\t\t0\n')
+                else:
+                    out.append(f'{index[0]} {index[1]}\t\t0\t\t{level_value(level)}\n')
+        out.append(';\n\n')
+
+        out.append('l[i,j,k] :=\n')
+        for index, level in self.rows['l']:
+            if is_zero(level):
+                continue
+            out.append(f'{index[0]}  {index[1]}  {index[2]}\t{float(level)}\n')
+        out.append(';\n\n')
+
+        out.append(f'_total_solve_time = {self.execution_time}\n\n')
+        out.append(f'total_cost = {self.objective_value}')
+        return out
+
+    def write_ampl_output(self, output_file_path: str, model_name: str) -> None:
+        """
+        Raises:
+            OSError: if the file could not be written
+            ValueError: see `self.ampl_output_lines()`
+        """
+        lines = self.ampl_output_lines(model_name)
+        with open(output_file_path, 'w') as f:
+            f.writelines(lines)
+
+
+class GamsListingParser(GamsSolution):
+    def __init__(self):
+        super().__init__()
+        self.__state = OUTSIDE_BLOCK
+        self.__variable: Optional[str] = None
+
+    def parse_line(self, line: str) -> None:
+        if self.__state == OUTSIDE_BLOCK:
+            match = VAR_HEADER_REGEX.match(line)
+            if match and match.group(1) in self.rows:
+                self.__state, self.__variable = BEFORE_COLUMN_HEADER, match.group(1)
+                return
+            match = OBJECTIVE_VALUE_REGEX.search(line)
+            if match:
+                self.objective_value = match.group(1)
+                return
+            match = EXECUTION_TIME_REGEX.search(line)
+            if match:
+                self.execution_time = match.group(1)
+            return
+        if self.__state == BEFORE_COLUMN_HEADER:
+            # Format: "LOWER LEVEL UPPER MARGINAL"
+            if 'LEVEL' in line:
+                self.__state = BEFORE_ROWS
+            return
+        if line.strip() == '':
+            if self.__state == INSIDE_ROWS:
+                self.__state, self.__variable = OUTSIDE_BLOCK, None
+            return
+        self.__state = INSIDE_ROWS
+        # Format: "INDEX LOWER LEVEL UPPER MARGINAL", e.g. "1 .30.1   .   174.3000   +INF   ." for l['1','30','1'].
+        # The index may have spaces before the dots, so all the tokens before the last 4 columns are joined
+        tokens = line.split()
+        if len(tokens) < 5:
+            g_logger.warning(f'GAMS: ignoring the row of VAR {self.__variable}: {line!r}')
+            return
+        self.rows[self.__variable].append((''.join(tokens[:-4]).split('.'), tokens[-3]))
+
+    def parse(self, lines: Iterable[str]) -> 'GamsListingParser':
+        for line in lines:
+            self.parse_line(line)
+        return self
+
+
+def read_solution_csv(solution_file_path: str) -> GamsSolution:
+    """
+    Read the CSV file written by the program of `solution_export_program()`
+
+    Raises:
+        OSError: if the file could not be read
+        ValueError: if a row is not valid
+    """
+    solution = GamsSolution()
+    with open(solution_file_path, 'r', newline='') as f:
+        for row in csv.reader(f):
+            row = [i.strip() for i in row]
+            if len(row) < 2:
+                continue
+            name, value = row[0], row[-1]
+            if name in solution.rows:
+                solution.rows[name].append((row[1:-1], value))
+            elif name == 'model_status':
+                solution.model_status = int(float(value))
+            elif name == 'solver_status':
+                solution.solver_status = int(float(value))
+            elif name == 'solve_time':
+                solution.execution_time = value
+            elif name == 'objective':
+                solution.objective_value = value
+            else:
+                raise ValueError(f'unknown row in the GAMS solution file: {row}')
+    return solution
+
+
+def gams_listing_to_ampl_output(gams_file_path: str, output_file_path: str, model_name: str) -> None:
+    """
+    Convert the listing file of model m1/m2 (see `GamsSolution.ampl_output_lines()`)
+
+    Raises:
+        OSError: if a file could not be read/written
+        ValueError: if the listing does not have the solution
+    """
+    with open(gams_file_path, 'r', errors='replace') as f:
+        parser = GamsListingParser().parse(f)
+    parser.write_ampl_output(output_file_path, model_name)
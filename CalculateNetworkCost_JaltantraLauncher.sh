@@ -32,7 +32,16 @@ dirname "${0}" >> "${LOG_FILE}"
 echo "$(dirname '$0')" >> "${LOG_FILE}"
 echo "${FILE_PATH}" >> "${LOG_FILE}"
 
-if [[ -f "${1}" ]]; then
+# If `python3 CalculateNetworkCost.py --daemon` is running, then hand over the request to it. This avoids
+# the conda activation and the startup of `CalculateNetworkCost.py` for every request.
+# NOTE: The socket file is left behind if the daemon is killed (e.g. SIGKILL, OOM killer), so the daemon is pinged
+#       instead of only checking that the socket file exists
+DAEMON_SOCKET='./CalculateNetworkCost_daemon.sock'
+
+if [[ -f "${1}" && -S "${DAEMON_SOCKET}" ]] && python3 CalculateNetworkCost_DaemonClient.py --socket "${DAEMON_SOCKET}" ping >> "${LOG_FILE}" 2>&1; then
+    echo "daemon  = '${DAEMON_SOCKET}'" >> "${LOG_FILE}"
+    python3 CalculateNetworkCost_DaemonClient.py --socket "${DAEMON_SOCKET}" solve -p "${1}" --solver-models 'alphaecp 1 2' --solver-models 'octeract 1 2' --solver-models 'baron 1 2' --solver-models 'knitro 1 2' --time "${2}" --prefix "${3}" --wait > "${1}${3}.log" 2>&1
+elif [[ -f "${1}" ]]; then
     # >>> conda initialize >>>
     # !! Contents within this block are managed by 'conda init' !!
     __conda_setup="$(\"${MINICONDA_HOME}/bin/conda\" 'shell.bash' 'hook' 2> /dev/null)"
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Read-only access to large log files (e.g. `std_out_err.txt`, and `res.lst` of Baron which grows to many MB on long
+runs) through a memory map.
+
+The final values of a solver run (solution displayed by AMPL, objective value, solution file path) are printed at
+the end of the log. So, `MappedFile` searches backwards for the last occurrence of a marker and decodes only the
+section after it, which costs time and memory proportional to the tail of the file instead of the whole file.
+"""
+import mmap
+import re
+from typing import Optional, Union
+
+
+class MappedFile:
+    def __init__(self, file_path: str):
+        """
+        Use as a context manager, e.g. `with MappedFile(path) as log: idx = log.rfind_line(b'h[i]')`
+
+        Raises:
+            OSError: (on entering the context) if the file could not be opened
+        """
+        self.file_path = file_path
+        self.__file = None
+        # NOTE: An empty file can not be memory mapped, `bytes` supports the same `find`/`rfind`/slicing API
+        self.data: Union[mmap.mmap, bytes] = b''
+
+    def __enter__(self) -> 'MappedFile':
+        self.__file = open(self.file_path, 'rb')
+        try:
+            self.data = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.data = b''
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.data = b''
+        self.__file.close()
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def rfind(self, marker: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        """Returns: index of the last occurrence of `marker` in `[start, end)`, -1 if not found"""
+        return self.data.rfind(marker, start, len(self.data) if end is None else end)
+
+    def find(self, marker: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        """Returns: index of the first occurrence of `marker` in `[start, end)`, -1 if not found"""
+        return self.data.find(marker, start, len(self.data) if end is None else end)
+
+    def line_start(self, idx: int) -> int:
+        return self.data.rfind(b'\n', 0, idx) + 1
+
+    def line_end(self, idx: int) -> int:
+        """Returns: index of the new line character of the line having `idx`, or the file size for the last line"""
+        end = self.data.find(b'\n', idx)
+        return len(self.data) if end == -1 else end
+
+    def text(self, start: int, end: Optional[int] = None) -> str:
+        return self.data[start:end].decode(errors='replace')
+
+    def line(self, idx: int) -> str:
+        """Returns: the line having the byte at `idx`, without the new line character"""
+        return self.text(self.line_start(idx), self.line_end(idx))
+
+    def rfind_line(self, prefix: bytes, regex: Optional[re.Pattern] = None, end: Optional[int] = None) -> int:
+        """
+        Returns:
+            Index of the last line before `end` which starts with `prefix` (and matches `regex`, if given), -1 if no
+            such line exists
+        """
+        end = len(self.data) if end is None else end
+        while True:
+            idx = self.data.rfind(prefix, 0, end)
+            if idx == -1:
+                return -1
+            if (idx == 0 or self.data[idx - 1] == ord('\n')) and (regex is None or regex.match(self.line(idx))):
+                return idx
+            end = idx
+
+    def find_line(self, prefix: bytes, start: int = 0) -> int:
+        """Returns: index of the first line at or after `start` which starts with `prefix`, -1 if not found"""
+        while True:
+            idx = self.data.find(prefix, start)
+            if idx == -1 or idx == 0 or self.data[idx - 1] == ord('\n'):
+                return idx
+            start = idx + 1
+
+    def last_line_containing(self, marker: bytes) -> Optional[str]:
+        """Returns: the last line having `marker`, None if not found"""
+        idx = self.rfind(marker)
+        return None if idx == -1 else self.line(idx)
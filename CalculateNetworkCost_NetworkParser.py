@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Parser of the graph/network (i.e. data/testcase) files of model m1 and m2, i.e. the AMPL data files in
+`Files/Data/m1_m2` and `DataNetworkGraphInput_hashed`.
+
+`parse_network_file()` reads the file in a single pass into a `NetworkData`, which stores every column (node
+parameters, arcs, pipes) in an `array.array`. `load_network()` additionally keeps the parsed network in a binary
+cache named after the SHA256 of the file, so that every program which needs the same network only parses it once.
+The cache file has a JSON header line followed by the raw bytes of the arrays (see `write_network_cache()`), so
+reading it never executes any code, unlike a pickle.
+"""
+import array
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+g_logger = logging.getLogger('CNC')
+
+# Same as `AutoExecutorSettings.OUTPUT_DIR_LEVEL_0` of `CalculateNetworkCost.py`
+DEFAULT_CACHE_DIR = './NetworkResults/NetworkCache'
+
+# Incremented whenever `NetworkData` is changed, so that the networks cached by older versions are parsed again
+CACHE_FORMAT_VERSION = 2
+
+# Array attributes of `NetworkData` stored in the cache file, in this order
+CACHED_ARRAYS = ('elevation', 'pressure', 'demand', 'arc_tail', 'arc_head', 'arc_length', 'pipe_diameter',
+                 'pipe_cost', 'pipe_roughness')
+
+
+class NetworkData:
+    def __init__(self):
+        """
+        Parameters of the graph/network. Nodes, arcs and pipes are identified by their index in the arrays below,
+        `self.node_ids` and `self.pipe_ids` have the IDs used in the data file
+        """
+        self.data_file_hash: str = ''
+        # set nodes, and param E, P, D
+        self.node_ids: List[str] = list()
+        self.elevation = array.array('d')
+        self.pressure = array.array('d')
+        self.demand = array.array('d')
+        # param : arcs : L, arc k is from node `self.arc_tail[k]` to node `self.arc_head[k]`
+        self.arc_tail = array.array('l')
+        self.arc_head = array.array('l')
+        self.arc_length = array.array('d')
+        # set pipes, and param d, C, R
+        self.pipe_ids: List[str] = list()
+        self.pipe_diameter = array.array('d')
+        self.pipe_cost = array.array('d')
+        self.pipe_roughness = array.array('d')
+        # param Source, index of the source node
+        self.source: int = -1
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_arcs(self) -> int:
+        return len(self.arc_length)
+
+    @property
+    def num_pipes(self) -> int:
+        return len(self.pipe_ids)
+
+    @property
+    def source_id(self) -> str:
+        return self.node_ids[self.source]
+
+    def arc_ids(self) -> List[Tuple[str, str]]:
+        """Returns: (i, j) node IDs of every arc"""
+        return [(self.node_ids[i], self.node_ids[j]) for i, j in zip(self.arc_tail, self.arc_head)]
+
+    def by_node_id(self, values: Iterable[float]) -> Dict[str, float]:
+        """Returns: node ID -> value, e.g. `network.by_node_id(network.elevation)`"""
+        return dict(zip(self.node_ids, values))
+
+    def by_arc_id(self, values: Iterable[float]) -> Dict[Tuple[str, str], float]:
+        """Returns: (i, j) -> value, e.g. `network.by_arc_id(network.arc_length)`"""
+        return dict(zip(self.arc_ids(), values))
+
+    def by_pipe_id(self, values: Iterable[float]) -> Dict[str, float]:
+        """Returns: pipe ID -> value, e.g. `network.by_pipe_id(network.pipe_cost)`"""
+        return dict(zip(self.pipe_ids, values))
+
+
+def iter_ampl_data_statements(lines: Iterable[str]) -> Iterator[List[str]]:
+    """
+    Returns:
+        Tokens of every statement of an AMPL data file, e.g. "param Source:= 1 ;" gives ['param', 'Source', ':=', '1']
+    """
+    tokens: List[str] = list()
+    for line in lines:
+        line = line.partition('#')[0]
+        if ':' in line:
+            # NOTE: '\0' is used as a placeholder so that ':=' is not split by the second `replace`
+            line = line.replace(':=', ' \0 ').replace(':', ' : ').replace('\0', ':=')
+        parts = line.split(';')
+        for idx, part in enumerate(parts):
+            tokens.extend(i.strip('\'"') for i in part.split())
+            if idx != len(parts) - 1 and len(tokens) > 0:
+                yield tokens
+                tokens = list()
+    if len(tokens) > 0:
+        yield tokens
+
+
+def parse_network_file(data_file_path: str) -> NetworkData:
+    """
+    Raises:
+        OSError: if the file could not be read
+        ValueError: if it is not a valid data file of model m1/m2 (e.g. data files of model m3/m4 do not have
+            `param : arcs : L`)
+    """
+    node_ids: List[str] = list()
+    pipe_ids: List[str] = list()
+    arcs: List[Tuple[str, str]] = list()
+    arc_length = array.array('d')
+    params: Dict[str, Dict[str, float]] = dict()
+    source: Optional[str] = None
+    with open(data_file_path, 'r') as f:
+        for tokens in iter_ampl_data_statements(f):
+            if tokens[0] == 'set' and len(tokens) >= 3 and tokens[2] == ':=':
+                if tokens[1] == 'nodes':
+                    node_ids = tokens[3:]
+                elif tokens[1] == 'pipes':
+                    pipe_ids = tokens[3:]
+            elif tokens[:4] == ['param', ':', 'arcs', ':'] and ':=' in tokens:
+                # Format: "param : arcs : L := i j L[i,j] ..."
+                values = tokens[tokens.index(':=') + 1:]
+                if tokens[4:tokens.index(':=')] != ['L'] or len(values) % 3 != 0:
+                    raise ValueError(f"unsupported arcs table in '{data_file_path}'")
+                for idx in range(0, len(values), 3):
+                    arcs.append((values[idx], values[idx + 1]))
+                    arc_length.append(float(values[idx + 2]))
+            elif tokens[0] == 'param' and len(tokens) >= 4 and tokens[2] == ':=':
+                if tokens[1] == 'Source':
+                    source = tokens[3]
+                    continue
+                values = tokens[3:]
+                if len(values) % 2 != 0:
+                    raise ValueError(f"odd number of values for param {tokens[1]} in '{data_file_path}'")
+                params[tokens[1]] = {values[idx]: float(values[idx + 1]) for idx in range(0, len(values), 2)}
+
+    missing = [i for i in ('E', 'P', 'D', 'd', 'C', 'R') if i not in params]
+    if len(node_ids) == 0 or len(arcs) == 0 or source is None or len(missing) > 0:
+        raise ValueError(f"'{data_file_path}' is not a data file of model m1/m2, {missing=}")
+
+    network = NetworkData()
+    network.node_ids = node_ids
+    node_index = {node_id: idx for idx, node_id in enumerate(node_ids)}
+    try:
+        network.elevation = array.array('d', (params['E'][i] for i in node_ids))
+        network.pressure = array.array('d', (params['P'][i] for i in node_ids))
+        network.demand = array.array('d', (params['D'][i] for i in node_ids))
+        network.arc_tail = array.array('l', (node_index[i] for i, _ in arcs))
+        network.arc_head = array.array('l', (node_index[j] for _, j in arcs))
+        network.pipe_ids = pipe_ids
+        network.pipe_diameter = array.array('d', (params['d'][k] for k in pipe_ids))
+        network.pipe_cost = array.array('d', (params['C'][k] for k in pipe_ids))
+        network.pipe_roughness = array.array('d', (params['R'][k] for k in pipe_ids))
+        network.source = node_index[source]
+    except KeyError as e:
+        raise ValueError(f"undefined node/pipe {e} in '{data_file_path}'")
+    network.arc_length = arc_length
+    return network
+
+
+def file_hash_sha256(file_path: str) -> str:
+    h = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def write_network_cache(network: NetworkData, cache_file_path: str) -> None:
+    """
+    Format: one JSON line (version, hash, node IDs, pipe IDs, source, and the type code and length of every array of
+    `CACHED_ARRAYS`), followed by the bytes of the arrays in the native byte order
+
+    Raises:
+        OSError: if the file could not be written
+    """
+    header = dict(
+        version=CACHE_FORMAT_VERSION,
+        data_file_hash=network.data_file_hash,
+        node_ids=network.node_ids,
+        pipe_ids=network.pipe_ids,
+        source=network.source,
+        arrays=[(getattr(network, name).typecode, len(getattr(network, name))) for name in CACHED_ARRAYS],
+    )
+    with open(cache_file_path, 'wb') as f:
+        f.write(json.dumps(header).encode() + b'\n')
+        for name in CACHED_ARRAYS:
+            getattr(network, name).tofile(f)
+
+
+def read_network_cache(cache_file_path: str) -> Optional[NetworkData]:
+    """
+    Returns:
+        The network written by `write_network_cache()`, None if it was written by another version
+
+    Raises:
+        OSError: if the file could not be read
+        ValueError: if the file is not a valid cache file
+    """
+    with open(cache_file_path, 'rb') as f:
+        header = json.loads(f.readline())
+        if not isinstance(header, dict) or header.get('version') != CACHE_FORMAT_VERSION:
+            return None
+        network = NetworkData()
+        try:
+            network.data_file_hash = str(header['data_file_hash'])
+            network.node_ids = [str(i) for i in header['node_ids']]
+            network.pipe_ids = [str(i) for i in header['pipe_ids']]
+            network.source = int(header['source'])
+            if len(header['arrays']) != len(CACHED_ARRAYS):
+                raise ValueError(f"{len(header['arrays'])} arrays instead of {len(CACHED_ARRAYS)}")
+            for name, (typecode, length) in zip(CACHED_ARRAYS, header['arrays']):
+                values = array.array(typecode)
+                # `array.fromfile()` raises EOFError if the file has fewer items
+                values.fromfile(f, length)
+                setattr(network, name, values)
+        except (KeyError, TypeError, EOFError) as e:
+            raise ValueError(f'{type(e)}: {e}')
+        if f.read(1) != b'':
+            raise ValueError('unexpected data after the arrays')
+    if len(network.elevation) != network.num_nodes or len(network.arc_tail) != network.num_arcs \
+            or len(network.pipe_cost) != network.num_pipes or not (0 <= network.source < network.num_nodes):
+        raise ValueError('inconsistent number of nodes, arcs or pipes')
+    return network
+
+
+def load_network(
+        data_file_path: str,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        data_file_hash: Optional[str] = None
+) -> Optional[NetworkData]:
+    """
+    Parse the network using `parse_network_file()`, or load it from `<cache_dir>/<data_file_hash>.bin` (see
+    `read_network_cache()`) if it was already parsed
+
+    Args:
+        data_file_path: Data file of model m1/m2
+        cache_dir: Directory of the binary cache, None to always parse the file
+        data_file_hash: SHA256 of the file, it is computed if not given
+
+    Returns:
+        None if the file could not be read or is not a valid data file of model m1/m2
+    """
+    try:
+        if data_file_hash is None:
+            data_file_hash = file_hash_sha256(data_file_path)
+    except OSError as e:
+        g_logger.warning(f"NETWORK_PARSER: unable to read '{data_file_path}', {type(e)}: {e}")
+        return None
+    cache_file_path = None if cache_dir is None else f'{cache_dir}/{data_file_hash}.bin'
+
+    if cache_file_path is not None and os.path.isfile(cache_file_path):
+        try:
+            network = read_network_cache(cache_file_path)
+            if network is not None:
+                return network
+        except (OSError, ValueError) as e:
+            g_logger.warning(f"NETWORK_PARSER: ignoring invalid cache file '{cache_file_path}', {type(e)}: {e}")
+
+    try:
+        network = parse_network_file(data_file_path)
+    except (OSError, ValueError) as e:
+        g_logger.debug(f'NETWORK_PARSER: {type(e)}: {e}')
+        return None
+    network.data_file_hash = data_file_hash
+
+    if cache_file_path is not None:
+        # NOTE: The file is written with a unique temporary name and then renamed, so that a concurrent reader (e.g.
+        #       another request handled by `--daemon`) never reads a partially written cache file
+        tmp_file_path = f'{cache_file_path}.tmp{os.getpid()}_{threading.get_ident()}'
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            write_network_cache(network, tmp_file_path)
+            os.replace(tmp_file_path, cache_file_path)
+        except OSError as e:
+            g_logger.warning(f"NETWORK_PARSER: unable to write the cache file '{cache_file_path}', {type(e)}: {e}")
+    return network
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Detection of near-duplicate graphs/networks (i.e. data/testcase files of model m1 and m2), so that a network which
+is an incremental edit of an already solved network can reuse its solution as the warm start.
+
+Every network is summarised by a `NetworkSignature`:
+    1. Topology hash: nodes, arcs and the source node
+    2. Pipe table hash: diameter, cost and roughness of every commercial pipe
+    3. Parameters: elevation, minimum pressure and demand of every node, and length of every arc
+
+Two networks are comparable only if both hashes are equal, in that case the solution (h, q, l) of one network
+refers to the same variables of the other network. `parameter_distance()` tells how much their parameters differ,
+and `estimate_infeasibility()` tells how far the solution of one network is from being feasible for the other one.
+"""
+import hashlib
+import json
+import math
+from typing import Dict, Tuple
+
+from CalculateNetworkCost_NetworkParser import NetworkData
+from CalculateNetworkCost_Verifier import NetworkVerifier, VerificationResult
+from CalculateNetworkCost_WarmStart import AmplSolution
+
+# Networks whose parameters differ more than this (see `parameter_distance()`) are not used for warm start
+MAX_PARAMETER_DISTANCE = 0.5
+
+
+class NetworkSignature:
+    def __init__(
+            self,
+            topology_hash: str,
+            pipes_hash: str,
+            elevation: Dict[str, float],
+            pressure: Dict[str, float],
+            demand: Dict[str, float],
+            arc_length: Dict[Tuple[str, str], float],
+            pipes: Dict[str, Tuple[float, float, float]]
+    ):
+        """
+        Args:
+            topology_hash: SHA256 of the nodes, arcs and source node
+            pipes_hash: SHA256 of `pipes`
+            elevation: E[i]
+            pressure: P[i]
+            demand: D[i]
+            arc_length: L[i,j]
+            pipes: (d[k], C[k], R[k]) for every commercial pipe k
+        """
+        self.topology_hash = topology_hash
+        self.pipes_hash = pipes_hash
+        self.elevation = elevation
+        self.pressure = pressure
+        self.demand = demand
+        self.arc_length = arc_length
+        self.pipes = pipes
+
+    def parameters_json(self) -> str:
+        """Returns: parameters of the network as JSON, used for the `network_signatures` table of `networks.db`"""
+        return json.dumps({
+            'E': self.elevation,
+            'P': self.pressure,
+            'D': self.demand,
+            'L': {f'{i} {j}': val for (i, j), val in self.arc_length.items()},
+            'pipes': self.pipes,
+        })
+
+    @staticmethod
+    def from_json(topology_hash: str, pipes_hash: str, parameters_json: str) -> 'NetworkSignature':
+        """Inverse of `parameters_json()`"""
+        parameters = json.loads(parameters_json)
+        return NetworkSignature(
+            topology_hash,
+            pipes_hash,
+            parameters['E'],
+            parameters['P'],
+            parameters['D'],
+            {tuple(key.split(' ')): val for key, val in parameters['L'].items()},
+            {key: tuple(val) for key, val in parameters['pipes'].items()}
+        )
+
+
+def network_signature(network: NetworkData) -> NetworkSignature:
+    """Returns: signature of the network parsed by `CalculateNetworkCost_NetworkParser.load_network()`"""
+    arc_ids = network.arc_ids()
+    pipes = {
+        k: (d, c, r)
+        for k, d, c, r in zip(network.pipe_ids, network.pipe_diameter, network.pipe_cost, network.pipe_roughness)
+    }
+    topology = {'nodes': sorted(network.node_ids), 'arcs': sorted(arc_ids), 'source': network.source_id}
+    return NetworkSignature(
+        hashlib.sha256(json.dumps(topology).encode()).hexdigest(),
+        hashlib.sha256(json.dumps(sorted(pipes.items())).encode()).hexdigest(),
+        network.by_node_id(network.elevation),
+        network.by_node_id(network.pressure),
+        network.by_node_id(network.demand),
+        dict(zip(arc_ids, network.arc_length)),
+        pipes
+    )
+
+
+def relative_difference(new: Dict, old: Dict) -> float:
+    """Returns: sum of absolute differences of the common keys, relative to the larger of the two totals"""
+    total = max(sum(abs(i) for i in new.values()), sum(abs(i) for i in old.values()))
+    if total == 0:
+        return 0.0
+    return sum(abs(new[key] - old[key]) for key in new.keys() & old.keys()) / total
+
+
+def parameter_distance(new: NetworkSignature, old: NetworkSignature) -> float:
+    """
+    Returns:
+        The largest relative change among elevation, minimum pressure, demand and arc length (0.0 means the
+        networks are identical), `math.inf` if the topology or pipe table of the networks differ
+    """
+    if new.topology_hash != old.topology_hash or new.pipes_hash != old.pipes_hash:
+        return math.inf
+    return max(
+        relative_difference(new.elevation, old.elevation),
+        relative_difference(new.pressure, old.pressure),
+        relative_difference(new.demand, old.demand),
+        relative_difference(new.arc_length, old.arc_length)
+    )
+
+
+def adapt_solution(solution: AmplSolution, new: NetworkSignature, old: NetworkSignature) -> AmplSolution:
+    """
+    Convert the solution of network `old` to a starting point for network `new`. The pipe lengths of every arc are
+    scaled so that they add up to the new arc length, the heads and flows are used as it is.
+
+    Returns:
+        Solution whose `total_cost` is the cost of the scaled pipe lengths and `is_feasible` is False
+    """
+    lengths: Dict[Tuple[str, str, str], float] = dict()
+    for (i, j, k), val in solution.lengths.items():
+        old_length = old.arc_length.get((i, j), 0.0)
+        lengths[(i, j, k)] = val * (new.arc_length.get((i, j), 0.0) / old_length if old_length > 0 else 1.0)
+    total_cost = sum(val * new.pipes[k][1] for (i, j, k), val in lengths.items() if k in new.pipes)
+    return AmplSolution(total_cost, dict(solution.heads), dict(solution.flows), lengths, is_feasible=False)
+
+
+def estimate_infeasibility(solution: AmplSolution, network: NetworkData) -> VerificationResult:
+    """
+    Measure how much `solution` (e.g. the result of `adapt_solution()`) violates the constraints of model m1 for
+    `network`, using `CalculateNetworkCost_Verifier.NetworkVerifier`
+
+    Returns:
+        Largest violation of every constraint family of the model
+    """
+    return NetworkVerifier(network).verify(solution)
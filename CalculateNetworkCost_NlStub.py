@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Cache of the AMPL `.nl` stub files used by `CalculateNetworkCost.py`.
+
+AMPL translates a model and data file into a `.nl` stub (`write g<stub>;`), and this is what every solver actually
+reads. Without the cache, each solver instance starts its own AMPL session which parses and translates the same
+model/data pair again. With it, the stub is written once per (model file, data file, warm start values) and every
+solver instance is run directly on a hard link of it (`<solver> <stub> -AMPL`). The `.sol` file written by the
+solver is read back by a short AMPL session (`solution <stub>.sol;`) only to display the values of the variables.
+"""
+import hashlib
+import logging
+import os
+import re
+import shutil
+import subprocess
+import threading
+from typing import Dict, Optional, Tuple
+
+from CalculateNetworkCost_NetworkParser import file_hash_sha256
+
+g_logger = logging.getLogger('CNC')
+
+# Format of `engine_options` of `AutoExecutorSettings.solvers`, e.g. 'option baron_options "threads=1 maxtime=10";'
+SOLVER_OPTIONS_REGEX = re.compile(r'^\s*options?\s+(\w+_options)\s+"([^"]*)"\s*;\s*$')
+
+
+def solver_options_environment(engine_options: str) -> Optional[Tuple[str, str]]:
+    """
+    Solvers run by AMPL read their options from the environment variable having the same name as the AMPL option
+
+    Returns:
+        Name and value of the environment variable, None if `engine_options` is not a single AMPL `option` command
+    """
+    match = SOLVER_OPTIONS_REGEX.match(engine_options)
+    if match is None:
+        return None
+    return match.group(1), match.group(2)
+
+
+def link_stub(stub_path: str, link_stub_path: str) -> None:
+    """Make `<link_stub_path>.nl` point to `<stub_path>.nl`, it is copied if hard links are not supported"""
+    if os.path.exists(link_stub_path + '.nl'):
+        os.remove(link_stub_path + '.nl')
+    try:
+        os.link(stub_path + '.nl', link_stub_path + '.nl')
+    except OSError:
+        shutil.copyfile(stub_path + '.nl', link_stub_path + '.nl')
+
+
+class NlStubCache:
+    def __init__(self, cache_dir: str, ampl_path: str):
+        """
+        Args:
+            cache_dir: Directory in which the stubs are stored, it is created when the first stub is written
+            ampl_path: AMPL binary used to write the stubs
+        """
+        self.cache_dir = cache_dir
+        self.ampl_path = ampl_path
+        # NOTE: One stub may be requested by multiple threads at the same time (see `--daemon` and batch mode), it
+        #       should be written only once. Different processes are handled by writing to a temporary file first.
+        self.__lock = threading.Lock()
+        self.__key_locks: Dict[str, threading.Lock] = dict()
+
+    def get(
+            self,
+            model_file_path: str,
+            data_file_path: str,
+            setup_commands: str = '',
+            timeout: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Args:
+            model_file_path: AMPL model file
+            data_file_path: AMPL data file
+            setup_commands: AMPL commands executed after reading the model and data, e.g. `let` statements to set the
+                initial values of the variables. They are part of the cache key
+            timeout: Maximum seconds for which AMPL may run to write the stub
+
+        Returns:
+            Path of the stub without the `.nl` extension, None if AMPL failed to write it
+        """
+        try:
+            key = hashlib.sha256(
+                f'{file_hash_sha256(model_file_path)}\n{file_hash_sha256(data_file_path)}\n{setup_commands}'.encode()
+            ).hexdigest()
+        except OSError as e:
+            g_logger.warning(f'NL_STUB: unable to read the model/data file, {type(e)}: {e}')
+            return None
+        stub_path = f'{self.cache_dir}/{key}'
+        with self.__lock:
+            key_lock = self.__key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if os.path.isfile(stub_path + '.nl'):
+                g_logger.debug(f'NL_STUB: reusing {stub_path}.nl')
+                return stub_path
+            if self.__write_stub(stub_path, model_file_path, data_file_path, setup_commands, timeout):
+                return stub_path
+        return None
+
+    def __write_stub(
+            self,
+            stub_path: str,
+            model_file_path: str,
+            data_file_path: str,
+            setup_commands: str,
+            timeout: Optional[float]
+    ) -> bool:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_stub_path = f'{stub_path}.tmp{os.getpid()}_{threading.get_ident()}'
+        ampl_commands = f'''
+    reset;
+    model "{model_file_path}";
+    data "{data_file_path}";
+    option presolve_eps 1e-9;
+{setup_commands}
+    write "g{tmp_stub_path}";
+'''
+        try:
+            proc = subprocess.run(
+                [self.ampl_path], input=ampl_commands.encode(), stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                timeout=timeout
+            )
+            output = proc.stdout.decode(errors='replace').strip()
+        except (OSError, subprocess.TimeoutExpired) as e:
+            output = f'{type(e)}: {e}'
+        if not os.path.isfile(tmp_stub_path + '.nl'):
+            g_logger.warning(f"NL_STUB: AMPL did not write the stub for '{model_file_path}' and "
+                             f"'{data_file_path}', output:\n{output}")
+            return False
+        os.replace(tmp_stub_path + '.nl', stub_path + '.nl')
+        g_logger.info(f"NL_STUB: wrote {stub_path}.nl for '{model_file_path}' and '{data_file_path}'")
+        return True
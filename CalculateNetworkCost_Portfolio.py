@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+History driven selection of the solver-model combinations to launch for a graph/network (`--portfolio auto` of
+`CalculateNetworkCost.py`).
+
+Every network is summarised by a few cheap `NetworkFeatures` (sizes, number of loops and spread of the demands). The
+results of the earlier runs (`SolveRecord`) on the networks with the closest features are used to compute the win
+rate (how often a combination found the best cost of a run) and the typical time to reach that cost of every
+solver-model combination (`combination_statistics()`). The combinations are then ordered by `rank_combinations()`,
+and only the first few of them are launched (`select_portfolio()`). One of them is the least tried combination, so
+that the history of every combination keeps growing, and a combination which never got a chance is not left out
+forever.
+"""
+import math
+import statistics
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from CalculateNetworkCost_NetworkParser import NetworkData
+from CalculateNetworkCost_SolverLogs import ProgressRow
+
+# Number of most similar networks (see `feature_distance()`) whose results are used
+NEIGHBOUR_NETWORKS = 10
+
+# Networks whose features differ more than this are never used, even if there are fewer than `NEIGHBOUR_NETWORKS`
+MAX_FEATURE_DISTANCE = 2.0
+
+# A combination wins a run if its cost is within this relative tolerance of the best cost of the run
+WIN_TOLERANCE = 1e-4
+
+
+class NetworkFeatures(NamedTuple):
+    num_nodes: int
+    num_arcs: int
+    num_pipes: int
+    # Number of independent loops (cycles) of the network, i.e. arcs - nodes + 1 for a connected network
+    num_loops: int
+    # Coefficient of variation (standard deviation / mean) of the demand of the nodes other than the source
+    demand_spread: float
+
+
+class SolveRecord(NamedTuple):
+    hash_id: str
+    # Identifies the run, i.e. the records with the same `hash_id` and `run_id` are the results of one run
+    run_id: str
+    solver: str
+    # Unique model name, e.g. 'm1'
+    model: str
+    # Best cost found, `math.inf` if no feasible solution was found
+    cost: float
+    # Solver reported time (in seconds) when `cost` was first found, None if it is not known
+    time_to_best: Optional[float] = None
+
+
+class CombinationStatistics(NamedTuple):
+    runs: int
+    wins: int
+    # Median of `SolveRecord.time_to_best` of the wins, `math.inf` if not known
+    time_to_best: float
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.runs if self.runs > 0 else 0.0
+
+
+def network_features(network: NetworkData) -> NetworkFeatures:
+    demands = [abs(d) for idx, d in enumerate(network.demand) if idx != network.source]
+    mean = statistics.fmean(demands) if len(demands) > 0 else 0.0
+    spread = statistics.pstdev(demands) / mean if mean > 0 else 0.0
+    return NetworkFeatures(
+        network.num_nodes,
+        network.num_arcs,
+        network.num_pipes,
+        max(0, network.num_arcs - network.num_nodes + 1),
+        spread
+    )
+
+
+def feature_distance(a: NetworkFeatures, b: NetworkFeatures) -> float:
+    """
+    Returns:
+        Sum of the absolute log-ratios of the counts (so that 10 vs 20 nodes is as far as 100 vs 200 nodes) and the
+        absolute difference of the demand spreads, 0.0 for equal features
+    """
+    res = abs(a.demand_spread - b.demand_spread)
+    for x, y in zip(a[:4], b[:4]):
+        res += abs(math.log((x + 1) / (y + 1)))
+    return res
+
+
+def time_to_best(trajectory: List[ProgressRow], best_cost: float) -> Optional[float]:
+    """
+    Args:
+        trajectory: `CalculateNetworkCost_SolverLogs.SolverLogFollower.trajectory` of the solver instance
+        best_cost: Best cost found by the solver instance
+
+    Returns:
+        Solver reported time of the first row whose upper bound is at most `best_cost`, None if there is no such row
+    """
+    for row in trajectory:
+        if row.time is not None and row.upper_bound is not None \
+                and row.upper_bound <= best_cost * (1 + WIN_TOLERANCE):
+            return row.time
+    return None
+
+
+def combination_statistics(records: Iterable[SolveRecord]) -> Dict[Tuple[str, str], CombinationStatistics]:
+    """
+    Args:
+        records: Results of the earlier runs
+
+    Returns:
+        (solver, model) -> its statistics over all the runs in which it was launched
+    """
+    runs: Dict[Tuple[str, str], List[SolveRecord]] = dict()
+    for record in records:
+        runs.setdefault((record.hash_id, record.run_id), list()).append(record)
+    num_runs: Dict[Tuple[str, str], int] = dict()
+    win_times: Dict[Tuple[str, str], List[Optional[float]]] = dict()
+    for run in runs.values():
+        best_cost = min(record.cost for record in run)
+        for record in run:
+            key = (record.solver, record.model)
+            num_runs[key] = num_runs.get(key, 0) + 1
+            if math.isfinite(best_cost) and record.cost <= best_cost * (1 + WIN_TOLERANCE):
+                win_times.setdefault(key, list()).append(record.time_to_best)
+    res: Dict[Tuple[str, str], CombinationStatistics] = dict()
+    for key, count in num_runs.items():
+        times = [i for i in win_times.get(key, list()) if i is not None]
+        res[key] = CombinationStatistics(
+            count, len(win_times.get(key, list())), statistics.median(times) if len(times) > 0 else math.inf
+        )
+    return res
+
+
+def rank_combinations(
+        combinations: List[Tuple[str, str]],
+        stats: Dict[Tuple[str, str], CombinationStatistics]
+) -> List[Tuple[str, str]]:
+    """
+    Args:
+        combinations: (solver, unique model name) pairs, in the order given by the user
+        stats: See `combination_statistics()`
+
+    Returns:
+        `combinations` ordered by the highest win rate, then the lowest time to best. The combinations which never
+        won come after the ones which won at least once: first the untried ones (no history), and then the ones which
+        were launched but never won. The ties keep the order given by the user
+    """
+    def key(idx: int) -> Tuple[int, float, float, int]:
+        stat = stats.get(combinations[idx])
+        if stat is None:
+            return 1, 0.0, math.inf, idx
+        if stat.wins == 0:
+            return 2, 0.0, stat.time_to_best, idx
+        return 0, -stat.win_rate, stat.time_to_best, idx
+
+    return [combinations[idx] for idx in sorted(range(len(combinations)), key=key)]
+
+
+def select_portfolio(
+        combinations: List[Tuple[str, str]],
+        stats: Dict[Tuple[str, str], CombinationStatistics],
+        size: int
+) -> Tuple[List[Tuple[str, str]], Optional[Tuple[str, str]]]:
+    """
+    Args:
+        combinations: See `rank_combinations()`
+        stats: See `combination_statistics()`
+        size: Number of combinations to select
+
+    Returns:
+        The first `size - 1` combinations of `rank_combinations()` and the combination with the fewest runs among the
+        remaining ones (the best ranked of them if there is a tie), and the latter combination (None if no
+        combination was left out, or `size` is 1 and so there is no slot for exploration)
+    """
+    ranked = rank_combinations(combinations, stats)
+    if len(ranked) <= size:
+        return ranked, None
+    if size < 2:
+        return ranked[:size], None
+    rest = ranked[size - 1:]
+    explored = min(rest, key=lambda i: (stats[i].runs if i in stats else 0, rest.index(i)))
+    return ranked[:size - 1] + [explored], explored
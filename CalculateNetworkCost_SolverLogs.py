@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Incremental parsing of the `std_out_err.txt` file written by each solver instance launched by
+`CalculateNetworkCost.py`.
+
+`SolverLogFollower` remembers how much of the file it has already parsed, so every call to `update()` only reads
+the bytes appended since the previous call. The best feasible objective value (upper bound), the best lower bound
+and the time at which they last changed are kept in memory, so status checks do not need to re-read the file.
+
+The progress lines of every solver are parsed by a `ProgressParser` (see `new_progress_parser()`), which turns each
+line into a `ProgressRow`. These replace `output_table_extractor_baron.sh` and `output_table_extractor_octeract.sh`
+for `CalculateNetworkCost.py`.
+"""
+import logging
+import math
+import os
+import re
+import time
+from typing import Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Type
+
+g_logger = logging.getLogger('CNC')
+
+# Values larger than this are printed by the solvers when no feasible solution has been found (e.g. 1e51, 1.8e308)
+INFEASIBLE_OBJECTIVE_THRESHOLD = 1e40
+
+NUMBER_REGEX = r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?'
+
+# Value printed by the AMPL commands `option display_precision 0; display total_cost;`
+TOTAL_COST_REGEX = re.compile(rf'^total_cost\s*=\s*({NUMBER_REGEX})\s*$')
+
+BARON_TABLE_HEADER = '  Iteration    Open nodes         Time (s)    Lower bound      Upper bound'
+BARON_PREPROCESSING_REGEX = re.compile(rf'Preprocessing found feasible solution with value\s+({NUMBER_REGEX})')
+# Printed by Baron (console and AMPL solve message) only when the solution is globally optimal within tolerances
+BARON_GLOBAL_OPTIMUM_LINES = ['*** Normal completion ***', 'optimal within tolerances']
+
+OCTERACT_TABLE_HEADER = 'Iteration            GAP               LLB          BUB            Pool       Time       Mem'
+OCTERACT_GLOBAL_SOLUTION_REGEX = re.compile(rf'Objective value at global solution:\s*({NUMBER_REGEX})')
+
+# Knitro does not print a table which can be parsed reliably, so only the lines having the objective value are used
+KNITRO_OBJECTIVE_REGEXES = [
+    re.compile(rf'Final objective value\s*=\s*({NUMBER_REGEX})'),
+    re.compile(rf'best (?:feasible )?objective(?: value)?(?: found)?\s*[:=]?\s*({NUMBER_REGEX})', re.I),
+    # Solve message printed by AMPL, e.g. "Knitro 12.4.0: Locally optimal or satisfactory solution.\nobjective 1234;"
+    re.compile(rf'^objective\s+({NUMBER_REGEX});'),
+]
+# Exit status printed by Knitro (e.g. "EXIT: Infeasible stopping point.") and by AMPL for Knitro (e.g. "Knitro
+# 12.4.0: Time limit reached. Current point is infeasible."). It is printed before the final objective value, which
+# is printed even if the final point is not feasible
+KNITRO_EXIT_STATUS_REGEX = re.compile(r'^(?:EXIT:|Knitro [\d.]+:)')
+
+
+def to_float(val: str) -> Optional[float]:
+    try:
+        return float(val)
+    except ValueError:
+        return None
+
+
+# Flags of `ProgressRow`
+# The upper bound is not feasible, i.e. '(I)' of Octeract
+FLAG_INFEASIBLE = 'infeasible'
+# The solver reported that the best solution found is globally optimal (within its tolerances)
+FLAG_GLOBAL_OPTIMUM = 'global_optimum'
+
+
+class ProgressRow(NamedTuple):
+    # Solver reported time in seconds, None if the line does not have it
+    time: Optional[float]
+    # Best feasible objective value, None if the line does not have it
+    upper_bound: Optional[float]
+    # Best lower bound, None if the line does not have it
+    lower_bound: Optional[float]
+    flags: FrozenSet[str] = frozenset()
+
+
+class ProgressParser:
+    """
+    Parses the output of a solver one line at a time. This class is used for the solvers whose progress is not
+    parsed (i.e. AlphaECP, whose solution is read from the CSV file written by GAMS after it finishes), and it is the
+    interface of the solver specific subclasses
+    """
+    # The solver prints a progress table whose rows have the solver time and the bounds, so the time at which a
+    # value was found (see `SolverLogFollower.trajectory`) and the progress while no feasible solution is known
+    # (lower bound improvements) can be told from the output. Otherwise only the final objective value is known
+    HAS_PROGRESS_TABLE = False
+
+    def parse_line(self, line: str) -> Optional[ProgressRow]:
+        """Returns: the progress reported by `line`, None if it does not report any"""
+        return None
+
+
+class BaronProgressParser(ProgressParser):
+    # REFER: output_table_extractor_baron.sh
+    HAS_PROGRESS_TABLE = True
+
+    def __init__(self):
+        self.inside_table = False
+
+    def parse_line(self, line: str) -> Optional[ProgressRow]:
+        if BARON_TABLE_HEADER in line:
+            self.inside_table = True
+            return None
+        if self.inside_table:
+            if line.strip() == '':
+                self.inside_table = False
+                return None
+            # Row format: "[*] Iteration Open_nodes Time Lower_bound Upper_bound", '*' marks a new incumbent
+            tokens = line.split()
+            if len(tokens) < 5:
+                return None
+            solver_time, lower_bound, upper_bound = [to_float(i) for i in tokens[-3:]]
+            if None in (solver_time, lower_bound, upper_bound):
+                return None
+            return ProgressRow(solver_time, upper_bound, lower_bound)
+        match = BARON_PREPROCESSING_REGEX.search(line)
+        if match:
+            return ProgressRow(None, float(match.group(1)), None)
+        if any(i in line for i in BARON_GLOBAL_OPTIMUM_LINES):
+            return ProgressRow(None, None, None, frozenset([FLAG_GLOBAL_OPTIMUM]))
+        return None
+
+
+class OcteractProgressParser(ProgressParser):
+    # REFER: output_table_extractor_octeract.sh
+    HAS_PROGRESS_TABLE = True
+
+    def __init__(self):
+        self.inside_table = False
+
+    def parse_line(self, line: str) -> Optional[ProgressRow]:
+        if OCTERACT_TABLE_HEADER in line:
+            self.inside_table = True
+            return None
+        if self.inside_table:
+            if line.strip() == '' or 'mpiexec' in line or 'The best solution' in line:
+                self.inside_table = False
+                return None
+            if line.strip().startswith('---'):
+                return None
+            # Row format: "Iteration GAP % LLB BUB [(I)] Pool Time Mem", '(I)' marks an infeasible upper bound
+            flags = frozenset([FLAG_INFEASIBLE]) if '(I)' in line else frozenset()
+            tokens = line.replace('(I)', ' ').replace('%', ' ').split()
+            if len(tokens) < 6 or not tokens[0].isdigit():
+                return None
+            lower_bound, upper_bound = to_float(tokens[2]), to_float(tokens[3])
+            solver_time = to_float(tokens[5].rstrip('s'))
+            if None in (lower_bound, upper_bound, solver_time):
+                return None
+            return ProgressRow(solver_time, upper_bound, lower_bound, flags)
+        match = OCTERACT_GLOBAL_SOLUTION_REGEX.search(line)
+        if match:
+            return ProgressRow(None, float(match.group(1)), None, frozenset([FLAG_GLOBAL_OPTIMUM]))
+        return None
+
+
+class KnitroProgressParser(ProgressParser):
+    def __init__(self):
+        # The last exit status line said that the final point is infeasible
+        self.exit_infeasible = False
+
+    def parse_line(self, line: str) -> Optional[ProgressRow]:
+        if KNITRO_EXIT_STATUS_REGEX.match(line):
+            self.exit_infeasible = 'infeasible' in line.lower()
+            return None
+        for regex in KNITRO_OBJECTIVE_REGEXES:
+            match = regex.search(line)
+            if match:
+                flags = frozenset([FLAG_INFEASIBLE]) if self.exit_infeasible else frozenset()
+                return ProgressRow(None, float(match.group(1)), None, flags)
+        return None
+
+
+# Solver name (see `AutoExecutorSettings.AVAILABLE_SOLVERS`) -> parser of its output
+PROGRESS_PARSERS: Dict[str, Type[ProgressParser]] = {
+    'baron': BaronProgressParser,
+    'octeract': OcteractProgressParser,
+    'knitro': KnitroProgressParser,
+}
+
+
+def new_progress_parser(solver_name: str) -> ProgressParser:
+    return PROGRESS_PARSERS.get(solver_name, ProgressParser)()
+
+
+def iter_progress_rows(lines: Iterable[str], solver_name: str) -> Iterator[ProgressRow]:
+    """Returns: the progress reported by `lines` (e.g. an open `std_out_err.txt` file) of the solver"""
+    parser = new_progress_parser(solver_name)
+    for line in lines:
+        row = parser.parse_line(line.rstrip('\r\n'))
+        if row is not None:
+            yield row
+
+
+class SolverLogFollower:
+    def __init__(self, file_path: str, solver_name: str):
+        """
+        Args:
+            file_path: Path to `std_out_err.txt` of the solver instance (it may not exist yet)
+            solver_name: One of `AutoExecutorSettings.AVAILABLE_SOLVERS`, decides which progress lines are parsed
+        """
+        self.file_path = file_path
+        self.solver_name = solver_name
+        self.__reset()
+
+    @property
+    def has_progress_table(self) -> bool:
+        """See `ProgressParser.HAS_PROGRESS_TABLE`"""
+        return self.__progress_parser.HAS_PROGRESS_TABLE
+
+    def __reset(self) -> None:
+        self.offset: int = 0
+        self.inode: Optional[int] = None
+        self.__partial_line: bytes = b''
+        self.__progress_parser = new_progress_parser(self.solver_name)
+        # Best feasible objective value found till now
+        self.upper_bound: float = math.inf
+        # Best lower bound proved by the solver till now (only Baron and Octeract report it)
+        self.lower_bound: float = -math.inf
+        # Solver reported time (in seconds) of the last progress line parsed
+        self.solver_time: float = 0.0
+        # `time.time()` when `self.upper_bound` or `self.lower_bound` last changed
+        self.last_update_time: float = 0.0
+        # Value printed by `display total_cost;` after the solver finished, None if not printed yet
+        self.total_cost: Optional[float] = None
+        # The last progress line had the infeasibility flag, i.e. '(I)' of Octeract
+        self.infeasible_flag: bool = False
+        # The solver exited with an infeasible final point, i.e. the final objective value of Knitro is not feasible
+        self.final_point_infeasible: bool = False
+        # The solver itself reported that the best solution found is globally optimal (within its tolerances)
+        self.global_optimum_proved: bool = False
+        # The last row reported by the solver which has a bound
+        self.last_row: Optional[ProgressRow] = None
+        # The rows which improved the upper or lower bound, in the order in which they were reported
+        self.trajectory: List[ProgressRow] = list()
+
+    def update(self) -> 'SolverLogFollower':
+        """Parse the lines appended to the file since the last call. Returns: self"""
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return self
+        if (self.inode is not None and stat.st_ino != self.inode) or stat.st_size < self.offset:
+            # The file was replaced or truncated (e.g. `SolverOutputAnalyzerAlphaecp.check_errors` rewrites it)
+            self.__reset()
+        self.inode = stat.st_ino
+        if stat.st_size == self.offset:
+            return self
+        with open(self.file_path, 'rb') as f:
+            f.seek(self.offset)
+            data = f.read(stat.st_size - self.offset)
+        self.offset += len(data)
+        lines = (self.__partial_line + data).split(b'\n')
+        # The last element is an incomplete line (or b'' if the data ended with a new line)
+        self.__partial_line = lines.pop()
+        for line in lines:
+            self.__parse_line(line.decode(errors='replace').rstrip('\r'))
+        return self
+
+    def best_solution(self) -> Tuple[bool, float]:
+        """
+        Returns:
+            A boolean value telling whether the solver found any feasible solution or not
+            A float value which is the best solution found till that moment (0.0 if none was found)
+        """
+        if self.final_point_infeasible:
+            return False, 0.0 if self.total_cost is None else self.total_cost
+        if self.total_cost is not None:
+            ok = not (self.total_cost == 0 or self.total_cost > INFEASIBLE_OBJECTIVE_THRESHOLD)
+            return ok, self.total_cost
+        if self.infeasible_flag or self.upper_bound > INFEASIBLE_OBJECTIVE_THRESHOLD:
+            return False, 0.0
+        return True, self.upper_bound
+
+    def solution_found(self) -> bool:
+        return self.best_solution()[0]
+
+    def __set_bounds(self, upper_bound: Optional[float] = None, lower_bound: Optional[float] = None) -> bool:
+        """Returns: True if any bound improved"""
+        changed = False
+        if upper_bound is not None and upper_bound < self.upper_bound:
+            self.upper_bound, changed = upper_bound, True
+        if lower_bound is not None and lower_bound > self.lower_bound:
+            self.lower_bound, changed = lower_bound, True
+        if changed:
+            self.last_update_time = time.time()
+        return changed
+
+    def __parse_line(self, line: str) -> None:
+        match = TOTAL_COST_REGEX.match(line)
+        if match:
+            self.total_cost = float(match.group(1))
+            return
+        row = self.__progress_parser.parse_line(line)
+        if row is None:
+            return
+        if row.time is not None:
+            self.solver_time = row.time
+        if FLAG_GLOBAL_OPTIMUM in row.flags:
+            self.global_optimum_proved = True
+        if row.upper_bound is None and row.lower_bound is None:
+            return
+        self.last_row = row
+        infeasible = FLAG_INFEASIBLE in row.flags
+        if row.time is not None:
+            # Only the rows of the progress table tell whether the current upper bound is feasible
+            self.infeasible_flag = infeasible
+        elif infeasible:
+            # Final objective value printed along with an infeasible exit status (Knitro)
+            self.final_point_infeasible = True
+        if self.__set_bounds(None if infeasible else row.upper_bound, row.lower_bound):
+            self.trajectory.append(row)
+
+
+class IncumbentPlateau:
+    def __init__(self, tolerance: float, duration: float, min_time: float, start_time: Optional[float] = None):
+        """
+        Tells when the best feasible objective value of a run (over all its solver instances) has stopped improving
+
+        Args:
+            tolerance: An improvement smaller than this fraction of the best value is ignored, e.g. 0.001 = 0.1%
+            duration: Seconds without any improvement larger than `tolerance` after which the run has plateaued
+            min_time: Seconds since `start_time` before which the run is never considered to have plateaued
+            start_time: `time.time()` when the run started, now if None
+        """
+        self.tolerance = tolerance
+        self.duration = duration
+        self.min_time = min_time
+        self.start_time = time.time() if start_time is None else start_time
+        # Best value when it last improved by more than `tolerance`, and `time.time()` of that improvement
+        self.reference_value: float = math.inf
+        self.reference_time: float = self.start_time
+        # `self.update()` returned True at least once
+        self.reached = False
+
+    def update(self, best_value: float, now: Optional[float] = None) -> bool:
+        """
+        Args:
+            best_value: Best feasible objective value known now, `math.inf` if none is known
+            now: `time.time()`, used for testing
+
+        Returns:
+            True if a feasible solution is known and it has plateaued
+        """
+        now = time.time() if now is None else now
+        if best_value < self.reference_value and \
+                (math.isinf(self.reference_value) or
+                 self.reference_value - best_value > self.tolerance * abs(self.reference_value)):
+            self.reference_value, self.reference_time = best_value, now
+        if math.isfinite(self.reference_value) and now - self.reference_time >= self.duration \
+                and now - self.start_time >= self.min_time:
+            self.reached = True
+        return self.reached
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Verification of the solution (h, q, l) of model m1/m2 against the constraints of the model, using NumPy.
+
+The node-arc incidence matrix is kept in the coordinate format, i.e. arc k leaves node `arc_tail[k]` and enters node
+`arc_head[k]` (see `CalculateNetworkCost_NetworkParser.NetworkData`). So, the flow balance of all the nodes is two
+`np.bincount` calls, and the sum over the pipes of every arc is one more, no Python loop is run over the arcs.
+
+Constraints of model m1 (m2 is the same with q[i,j] = q1[i,j] - q2[i,j]):
+    con1: sum{i in nodes : (i,j) in arcs} q[i,j] = sum{i in nodes : (j,i) in arcs} q[j,i] + D[j]
+    con2: h[i] >= E[i] + P[i]
+    con3: h[i] - h[j] = (q[i,j] * abs(q[i,j])^0.852) * (0.001^1.852) * sum{k in pipes} omega * l[i,j,k] /
+                        ((R[k]^1.852) * (d[k]/1000)^4.87)
+    con4: sum{k in pipes} l[i,j,k] = L[i,j]
+    con5: h[Source] = E[Source]
+"""
+from typing import Dict
+
+import numpy as np
+
+from CalculateNetworkCost_NetworkParser import NetworkData
+from CalculateNetworkCost_WarmStart import AmplSolution
+
+# SI unit constant of the Hazen-Williams equation, same as `omega` of model m1 and m2
+HAZEN_WILLIAMS_OMEGA = 10.68
+
+
+class VerificationResult:
+    # Names of the constraint families, in the order of the model
+    CONSTRAINTS = ('flow', 'pressure', 'head_loss', 'length', 'source')
+
+    def __init__(self, max_violation: Dict[str, float]):
+        """
+        Args:
+            max_violation: Constraint family (one of `VerificationResult.CONSTRAINTS`) -> largest absolute violation
+                of any of its constraints. `inf` if some value required by the constraint is missing in the solution
+        """
+        self.max_violation = max_violation
+
+    def ok(self, tolerance: float) -> bool:
+        """Returns: True if no constraint is violated by more than `tolerance`"""
+        return all(i <= tolerance for i in self.max_violation.values())
+
+    def worst(self) -> float:
+        return max(self.max_violation.values())
+
+    def __str__(self):
+        return ', '.join(f'{name}={self.max_violation[name]:.6g}' for name in self.CONSTRAINTS)
+
+
+class NetworkVerifier:
+    def __init__(self, network: NetworkData):
+        """All the arrays which depend only on the network are built here, so that it can verify many solutions"""
+        self.network = network
+        self.node_index: Dict[str, int] = {node_id: idx for idx, node_id in enumerate(network.node_ids)}
+        self.arc_index: Dict[tuple, int] = {arc: idx for idx, arc in enumerate(network.arc_ids())}
+        self.pipe_index: Dict[str, int] = {pipe_id: idx for idx, pipe_id in enumerate(network.pipe_ids)}
+        self.tail = np.array(network.arc_tail, dtype=np.intp)
+        self.head = np.array(network.arc_head, dtype=np.intp)
+        self.arc_length = np.array(network.arc_length, dtype=np.float64)
+        self.elevation = np.array(network.elevation, dtype=np.float64)
+        self.min_head = self.elevation + np.array(network.pressure, dtype=np.float64)
+        self.demand = np.array(network.demand, dtype=np.float64)
+        # Head loss per unit length for unit flow, for every pipe
+        self.pipe_resistance = HAZEN_WILLIAMS_OMEGA / (
+                np.array(network.pipe_roughness, dtype=np.float64) ** 1.852
+                * (np.array(network.pipe_diameter, dtype=np.float64) / 1000) ** 4.87
+        )
+
+    def verify(self, solution: AmplSolution) -> VerificationResult:
+        """Returns: largest violation of every constraint family of model m1/m2 by `solution`"""
+        num_nodes, num_arcs = self.network.num_nodes, self.network.num_arcs
+
+        heads = np.full(num_nodes, np.nan)
+        for node_id, val in solution.heads.items():
+            if node_id in self.node_index:
+                heads[self.node_index[node_id]] = val
+        flows = np.full(num_arcs, np.nan)
+        for arc, val in solution.flows.items():
+            if arc in self.arc_index:
+                flows[self.arc_index[arc]] = val
+        length_arc = np.empty(len(solution.lengths), dtype=np.intp)
+        length_pipe = np.empty(len(solution.lengths), dtype=np.intp)
+        length_val = np.empty(len(solution.lengths), dtype=np.float64)
+        valid = 0
+        for (i, j, k), val in solution.lengths.items():
+            arc_idx, pipe_idx = self.arc_index.get((i, j)), self.pipe_index.get(k)
+            if arc_idx is None or pipe_idx is None:
+                continue
+            length_arc[valid], length_pipe[valid], length_val[valid] = arc_idx, pipe_idx, val
+            valid += 1
+        length_arc, length_pipe, length_val = length_arc[:valid], length_pipe[:valid], length_val[:valid]
+
+        # con1: inflow - outflow - demand, for every node
+        flow_balance = np.bincount(self.head, weights=flows, minlength=num_nodes) \
+            - np.bincount(self.tail, weights=flows, minlength=num_nodes) - self.demand
+        # con4: total pipe length, for every arc
+        total_length = np.bincount(length_arc, weights=length_val, minlength=num_arcs)
+        # con3: head loss, for every arc
+        resistance = np.bincount(
+            length_arc, weights=length_val * self.pipe_resistance[length_pipe], minlength=num_arcs
+        )
+        head_loss = flows * np.abs(flows) ** 0.852 * (0.001 ** 1.852) * resistance
+        source = self.network.source
+
+        return VerificationResult({
+            'flow': self.__max(np.abs(flow_balance)),
+            'pressure': self.__max(np.maximum(self.min_head - heads, 0.0)),
+            'head_loss': self.__max(np.abs(heads[self.tail] - heads[self.head] - head_loss)),
+            # Also `l[i,j,k] >= 0`
+            'length': max(self.__max(np.abs(total_length - self.arc_length)), self.__max(-length_val)),
+            'source': self.__max(np.abs(heads[[source]] - self.elevation[[source]])),
+        })
+
+    @staticmethod
+    def __max(violations: np.ndarray) -> float:
+        """Returns: largest value, `inf` if some value is NaN (i.e. missing in the solution)"""
+        if violations.size == 0:
+            return 0.0
+        if np.isnan(violations).any():
+            return float('inf')
+        return float(violations.max())
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Warm start of the solvers launched by `CalculateNetworkCost.py` using the best solution found by an earlier run.
+
+The values of the variables `h`, `q` (or `q1` and `q2`) and `l` displayed by the AMPL commands of
+`AutoExecutorSettings.start_solver()` are parsed from `std_out_err.txt` of the earlier run, and converted to AMPL
+`let` statements which are executed before `solve`. The solution of model m1 can be used for model m2 and vice versa,
+because both have the same variables except that m2 splits the flow `q[i,j]` into `q1[i,j] - q2[i,j]`.
+"""
+import glob
+import logging
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from CalculateNetworkCost_LogAccess import MappedFile
+from CalculateNetworkCost_SolverLogs import TOTAL_COST_REGEX
+
+g_logger = logging.getLogger('CNC')
+
+# Headers printed by the `display` commands of `AutoExecutorSettings.start_solver()`
+# NOTE: `display {i in nodes} h[i];` prints "h[i] [*] :="
+HEAD_HEADER_REGEX = re.compile(r'^h\[i\](?:\s*\[\*\])?\s*:=')
+FLOW_HEADER_REGEX = re.compile(r'^q\[i,j\]\s*:=')
+SPLIT_FLOW_HEADER_REGEX = re.compile(r'^:\s*q1\[i,j\]\s+q2\[i,j\]\s*:=')
+LENGTH_HEADER_REGEX = re.compile(r'^l\[i,j,k\]\s*:=')
+
+# Models which have the variables h{nodes}, l{arcs,pipes} and q{arcs} (or q1{arcs} and q2{arcs})
+SUPPORTED_MODELS = ('m1', 'm2')
+
+# Flows smaller than this are treated as 0
+FLOW_EPS = 1e-9
+
+
+class AmplSolution:
+    def __init__(
+            self,
+            total_cost: float,
+            heads: Dict[str, float],
+            flows: Dict[Tuple[str, str], float],
+            lengths: Dict[Tuple[str, str, str], float],
+            is_feasible: bool = True
+    ):
+        """
+        Values of the variables of model m1/m2. The keys are the node/pipe IDs as printed by AMPL.
+
+        Args:
+            total_cost: Objective value
+            heads: h[i]
+            flows: q[i,j] (for model m2, this is q1[i,j] - q2[i,j])
+            lengths: l[i,j,k], only the non-zero values
+            is_feasible: False if the values were adapted from the solution of a different network (see
+                `CalculateNetworkCost_NetworkSimilarity.adapt_solution()`), so `total_cost` is not an upper bound
+        """
+        self.total_cost = total_cost
+        self.heads = heads
+        self.flows = flows
+        self.lengths = lengths
+        self.is_feasible = is_feasible
+
+    def ampl_let_statements(self, short_uniq_model_name: str) -> str:
+        """
+        Returns:
+            AMPL commands which set the initial values of the variables of the model, empty string if the model is
+            not one of `SUPPORTED_MODELS`
+        """
+        if short_uniq_model_name not in SUPPORTED_MODELS:
+            return ''
+        lines: List[str] = list()
+        for i, val in self.heads.items():
+            lines.append(f'let h[{ampl_key(i)}] := {val!r};')
+        for (i, j), val in self.flows.items():
+            if short_uniq_model_name == 'm1':
+                lines.append(f'let q[{ampl_key(i)},{ampl_key(j)}] := {val!r};')
+            else:
+                lines.append(f'let q1[{ampl_key(i)},{ampl_key(j)}] := {max(val, 0.0)!r};')
+                lines.append(f'let q2[{ampl_key(i)},{ampl_key(j)}] := {max(-val, 0.0)!r};')
+        for (i, j, k), val in self.lengths.items():
+            lines.append(f'let l[{ampl_key(i)},{ampl_key(j)},{ampl_key(k)}] := {val!r};')
+        return '\n'.join(lines)
+
+
+def ampl_key(val: str) -> str:
+    """Returns: `val` quoted if it is not a number, so that it can be used as a subscript in AMPL"""
+    try:
+        float(val)
+        return val
+    except ValueError:
+        # NOTE: Double quotes are used because the AMPL commands are put inside single quotes when `--launcher tmux`
+        return '"' + val.replace('"', '""') + '"'
+
+
+def baron_cutoff(best_cost: float, relative_margin: float = 1e-4) -> float:
+    """
+    Returns:
+        Value of the Baron option `cutoff` which discards the nodes whose objective value is worse than `best_cost`.
+        A small margin is kept so that the known solution itself is not cut off due to the tolerances of the solver
+    """
+    return best_cost + relative_margin * max(1.0, abs(best_cost))
+
+
+def baron_cutoff_option(best_cost: float) -> str:
+    """Returns: AMPL command which appends `baron_cutoff()` to the Baron options"""
+    return f'option baron_options $baron_options " cutoff={baron_cutoff(best_cost)!r}";'
+
+
+def parse_ampl_solution(std_out_err_file_path: str) -> Optional[AmplSolution]:
+    """
+    Returns:
+        Solution displayed in `std_out_err.txt` written by AMPL, None if it is incomplete (e.g. the solver failed) or
+        the file could not be read
+    """
+    try:
+        return read_ampl_solution(std_out_err_file_path)
+    except OSError:
+        return None
+
+
+def read_ampl_solution(std_out_err_file_path: str) -> Optional[AmplSolution]:
+    """
+    Returns:
+        Solution displayed in `std_out_err.txt` written by AMPL, None if it is incomplete (e.g. the solver failed)
+
+    Raises:
+        OSError: if the file could not be read
+    """
+    # NOTE: The solution is displayed at the end of the file, so only the lines from the last `h[i]` table are read
+    with MappedFile(std_out_err_file_path) as log:
+        start = log.rfind_line(b'h[i]', HEAD_HEADER_REGEX)
+        if start == -1:
+            return None
+        lines = log.text(start).splitlines()
+
+    total_cost: Optional[float] = None
+    heads: Dict[str, float] = dict()
+    flows: Dict[Tuple[str, str], float] = dict()
+    lengths: Dict[Tuple[str, str, str], float] = dict()
+    # Name of the table being read, None if the line is not inside any table
+    table: Optional[str] = None
+    for line in lines:
+        line = line.strip()
+        if table is not None:
+            if line.startswith(';') or line == '':
+                table = None
+                continue
+            tokens = line.rstrip(';').split()
+            try:
+                if table == 'h' and len(tokens) == 2:
+                    heads[tokens[0]] = float(tokens[1])
+                elif table == 'q' and len(tokens) == 3:
+                    flows[(tokens[0], tokens[1])] = float(tokens[2])
+                elif table == 'q1q2' and len(tokens) == 4:
+                    q1, q2 = float(tokens[2]), float(tokens[3])
+                    if FLOW_EPS < q1 and FLOW_EPS < q2:
+                        g_logger.warning(f'Flow variable test depicts some issue, {tokens=}')
+                    flows[(tokens[0], tokens[1])] = (q1 if q1 > FLOW_EPS else 0.0) - (q2 if q2 > FLOW_EPS else 0.0)
+                elif table == 'l' and len(tokens) == 4:
+                    lengths[(tokens[0], tokens[1], tokens[2])] = float(tokens[3])
+            except ValueError:
+                table = None
+            if line.endswith(';'):
+                table = None
+            continue
+        match = TOTAL_COST_REGEX.match(line)
+        if match:
+            total_cost = float(match.group(1))
+        elif HEAD_HEADER_REGEX.match(line):
+            table, heads = 'h', dict()
+        elif FLOW_HEADER_REGEX.match(line):
+            table, flows = 'q', dict()
+        elif SPLIT_FLOW_HEADER_REGEX.match(line):
+            table, flows = 'q1q2', dict()
+        elif LENGTH_HEADER_REGEX.match(line):
+            table, lengths = 'l', dict()
+
+    if total_cost is None or len(heads) == 0 or len(flows) == 0 or len(lengths) == 0:
+        return None
+    return AmplSolution(total_cost, heads, flows, lengths)
+
+
+def find_best_prior_solution(output_dir_level_0: str, data_file_hash: str) -> Optional[AmplSolution]:
+    """
+    Search the result files (`0_result.txt`, and the ones renamed by `main_handle_result_file_exists()`) of all the
+    earlier runs on the network with hash `data_file_hash`, irrespective of their `--prefix` and time limit
+
+    Returns:
+        Solution with the least cost, None if no earlier run found a solution of model m1 or m2
+    """
+    best_cost, best_std_out_err_file_path = None, None
+    result_file_glob = f'{glob.escape(output_dir_level_0)}/{glob.escape(data_file_hash)}*/0_result*.txt'
+    for result_file_path in glob.glob(result_file_glob):
+        try:
+            with open(result_file_path, 'r') as f:
+                # Line 1 = Status, Line 2 = Solver, Line 3 = Model, Line 4 = std_out_err.txt path, Line 5 = Cost
+                lines = [f.readline().strip() for _ in range(5)]
+            cost = float(lines[4])
+        except (OSError, ValueError):
+            continue
+        if lines[0] != 'True' or lines[2] not in SUPPORTED_MODELS or not os.path.isfile(lines[3]):
+            continue
+        if best_cost is None or cost < best_cost:
+            best_cost, best_std_out_err_file_path = cost, lines[3]
+    if best_std_out_err_file_path is None:
+        return None
+    solution = parse_ampl_solution(best_std_out_err_file_path)
+    if solution is None:
+        g_logger.warning(f"WARM_START: unable to parse the solution in '{best_std_out_err_file_path}'")
+    return solution
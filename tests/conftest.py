@@ -0,0 +1,51 @@
+import os
+import sys
+
+import pytest
+
+# The `CalculateNetworkCost_*.py` modules are scripts in the repository root, not an installed package
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+DATA_DIR = os.path.join(REPO_DIR, 'Files', 'Data')
+# Small logs and listing files used by the tests
+TESTS_DATA_DIR = os.path.join(REPO_DIR, 'tests', 'data')
+
+
+@pytest.fixture
+def twoloop_path() -> str:
+    """Data file of model m1/m2 with 7 nodes, 8 arcs and 14 pipes"""
+    return os.path.join(DATA_DIR, 'm1_m2', 'd1_Sample_input_cycle_twoloop.dat')
+
+
+@pytest.fixture
+def hanoi_path() -> str:
+    """Data file of model m1/m2 with 32 nodes, 34 arcs and 6 pipes"""
+    return os.path.join(DATA_DIR, 'm1_m2', 'd2_Sample_input_cycle_hanoi.dat')
+
+
+@pytest.fixture
+def twoloop_std_out_err_path() -> str:
+    """stdout/stderr of AMPL + Baron for model m1 and `twoloop_path`, with the values displayed after the solve"""
+    return os.path.join(TESTS_DATA_DIR, 'twoloop_m1_std_out_err.txt')
+
+
+@pytest.fixture
+def baron_log_path() -> str:
+    """stdout/stderr of AMPL + Baron, without the displayed values"""
+    return os.path.join(TESTS_DATA_DIR, 'twoloop_m1_baron_std_out_err.txt')
+
+
+@pytest.fixture
+def octeract_log_path() -> str:
+    """stdout/stderr of AMPL + Octeract, without the displayed values"""
+    return os.path.join(TESTS_DATA_DIR, 'twoloop_m1_octeract_std_out_err.txt')
+
+# Network in `DataNetworkGraphInput_hashed` whose GAMS listing files (`<hash>m1.lst` and `<hash>m2.lst`) in the
+# repository root have a solution
+LISTED_NETWORK_HASH = '525c57589abb519b1dd8e3306fe8dbf5dd11779d1d007854a678db8d7e18171c'
+
+
+@pytest.fixture
+def listed_network_path() -> str:
+    return os.path.join(REPO_DIR, 'DataNetworkGraphInput_hashed', f'{LISTED_NETWORK_HASH}.R')
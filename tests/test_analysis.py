@@ -0,0 +1,51 @@
+import os
+import pathlib
+import shutil
+from types import SimpleNamespace
+
+from conftest import LISTED_NETWORK_HASH, REPO_DIR
+from CalculateNetworkCost import SolverOutputAnalyzerAlphaecp, map_solver_instances
+
+GAMS_TERMINAL_OUTPUT = '--- Job alphaecp Start\n--- Normal completion\n'
+
+
+def alphaecp_instance(output_dir: pathlib.Path, model_name: str, prefix: str) -> SimpleNamespace:
+    """Returns: the parts of `NetworkExecutionInformation` of a finished AlphaECP (GAMS) instance"""
+    output_dir.mkdir(parents=True)
+    exec_info = SimpleNamespace(
+        solver_info=SolverOutputAnalyzerAlphaecp('', '"reslim=10"', 1),
+        uniq_exec_output_dir=output_dir,
+        uniq_std_out_err_file_path=str(output_dir.resolve() / 'std_out_err.txt'),
+        short_uniq_model_name=model_name,
+        data_file_hash=LISTED_NETWORK_HASH,
+        prefix=prefix,
+        idx=0
+    )
+    shutil.copyfile(os.path.join(REPO_DIR, f'{LISTED_NETWORK_HASH}{model_name}.lst'),
+                    SolverOutputAnalyzerAlphaecp.listing_file_path(exec_info))
+    pathlib.Path(exec_info.uniq_std_out_err_file_path).write_text(GAMS_TERMINAL_OUTPUT)
+    return exec_info
+
+
+def test_parallel_alphaecp_check_errors(tmp_path, monkeypatch):
+    cwd = tmp_path / 'cwd'
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
+    exec_infos = [
+        alphaecp_instance(tmp_path / f'{prefix}_{model_name}', model_name, prefix)
+        for prefix in ('eA', 'eB', 'eC') for model_name in ('m1', 'm2')
+    ]
+    def check_errors(exec_info):
+        return exec_info.solver_info.check_errors(exec_info)
+
+    for _ in range(2):
+        # The second call for the same instances (e.g. error checking round 2) gives the same result
+        assert map_solver_instances(check_errors, exec_infos) == [(True, 'No errors')] * len(exec_infos)
+        for exec_info in exec_infos:
+            with open(exec_info.uniq_std_out_err_file_path) as f:
+                assert f.read().rstrip().endswith(
+                    '3556311.3801' if exec_info.short_uniq_model_name == 'm1' else '3595226.7474'
+                )
+            assert (exec_info.uniq_exec_output_dir / 'gams_terminal_output.txt').read_text() == GAMS_TERMINAL_OUTPUT
+    # Nothing is read from or written to the current working directory
+    assert os.listdir(cwd) == []
@@ -0,0 +1,88 @@
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+from conftest import REPO_DIR
+import CalculateNetworkCost as cnc
+
+
+def make_daemon(tmp_path) -> cnc.SolverOrchestrationDaemon:
+    return cnc.SolverOrchestrationDaemon(str(tmp_path / 'daemon.sock'), 4, 'bash', False)
+
+
+def add_job(daemon: cnc.SolverOrchestrationDaemon, job_id: str) -> cnc.DaemonJob:
+    job = cnc.DaemonJob(job_id, argparse.Namespace(path=['/tmp/network.dat']))
+    daemon.jobs[job_id] = job
+    return job
+
+
+def finish(job: cnc.DaemonJob, finish_time: float) -> None:
+    job.state = 'finished'
+    job.finish_time = finish_time
+    job.done.set()
+
+
+def test_wait_returns_when_the_job_finishes(tmp_path):
+    daemon = make_daemon(tmp_path)
+    job = add_job(daemon, 'job1')
+    assert daemon.handle_request(dict(cmd='wait', job_id='job1', timeout=0.01))['job']['state'] == 'queued'
+
+    timer = threading.Timer(0.2, finish, args=(job, time.time()))
+    timer.start()
+    start = time.time()
+    response = daemon.handle_request(dict(cmd='wait', job_id='job1'))
+    assert response['ok'] and response['job']['state'] == 'finished'
+    # Not polled
+    assert time.time() - start < 1.0
+    assert not daemon.handle_request(dict(cmd='wait', job_id='job2'))['ok']
+
+
+def test_prune_jobs(tmp_path):
+    daemon = make_daemon(tmp_path)
+    finish(add_job(daemon, 'old'), time.time() - cnc.SolverOrchestrationDaemon.JOB_TTL - 1)
+    finish(add_job(daemon, 'recent'), time.time())
+    add_job(daemon, 'running').state = 'running'
+    daemon.prune_jobs()
+    assert sorted(daemon.jobs.keys()) == ['recent', 'running']
+    assert not daemon.handle_request(dict(cmd='status', job_id='old'))['ok']
+
+
+def test_network_lock_is_removed_when_unused(tmp_path):
+    daemon = make_daemon(tmp_path)
+    locks = daemon._SolverOrchestrationDaemon__network_locks
+    daemon.acquire_network_lock('abc')
+    order = list()
+
+    def second_job():
+        daemon.acquire_network_lock('abc')
+        order.append('second')
+        daemon.release_network_lock('abc')
+
+    thread = threading.Thread(target=second_job)
+    thread.start()
+    time.sleep(0.1)
+    # The second job of the same network waits for the first one
+    assert order == []
+    order.append('first')
+    daemon.release_network_lock('abc')
+    thread.join(5)
+    assert order == ['first', 'second']
+    assert locks == dict()
+
+
+def test_client_with_stale_socket(tmp_path):
+    socket_path = str(tmp_path / 'daemon.sock')
+    # Socket file of a daemon which was killed
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(socket_path)
+    sock.close()
+    client_path = os.path.join(REPO_DIR, 'CalculateNetworkCost_DaemonClient.py')
+    res = subprocess.run(
+        [sys.executable, client_path, '--socket', socket_path, 'ping'], capture_output=True, text=True, timeout=30
+    )
+    assert res.returncode == 1
+    assert 'unable to communicate with the daemon' in res.stdout
@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+
+import pytest
+
+import CalculateNetworkCost as cnc
+from CalculateNetworkCost import AutoExecutorSettings, EarlyTermination, get_early_termination_reason
+
+
+class FakeFollower:
+    def __init__(self, upper_bound: float, lower_bound: float = float('-inf'), global_optimum_proved: bool = False):
+        self.upper_bound = upper_bound
+        self.lower_bound = lower_bound
+        self.global_optimum_proved = global_optimum_proved
+
+    def update(self) -> 'FakeFollower':
+        return self
+
+    def best_solution(self):
+        return self.upper_bound < float('inf'), self.upper_bound
+
+
+def instance(solver_name: str, model: str, *args, **kwargs) -> SimpleNamespace:
+    """Returns: the parts of `NetworkExecutionInformation` used by `get_early_termination_reason()`"""
+    return SimpleNamespace(
+        solver_name=solver_name, short_uniq_model_name=model, log_follower=FakeFollower(*args, **kwargs)
+    )
+
+
+def test_nothing_to_stop():
+    my_settings = AutoExecutorSettings()
+    assert get_early_termination_reason(my_settings, [instance('baron', 'm1', 1000.0, 900.0)]) is None
+    my_settings.r_race = False
+    assert get_early_termination_reason(my_settings, [instance('baron', 'm1', 1000.0, 1000.0)]) is None
+
+
+@pytest.mark.parametrize('follower_args', [
+    dict(upper_bound=1000.0, global_optimum_proved=True),
+    dict(upper_bound=1000.0, lower_bound=999.99),
+])
+def test_optimal(follower_args):
+    reason = get_early_termination_reason(AutoExecutorSettings(), [instance('baron', 'm1', **follower_args)])
+    assert reason.kind == EarlyTermination.OPTIMAL
+
+
+def test_target_cost_and_gap():
+    my_settings = AutoExecutorSettings()
+    my_settings.r_target_cost = 1100.0
+    reason = get_early_termination_reason(my_settings, [instance('baron', 'm1', 1000.0, global_optimum_proved=True)])
+    assert reason.kind == EarlyTermination.TARGET
+    assert 'target cost' in str(reason)
+
+    my_settings = AutoExecutorSettings()
+    my_settings.r_target_gap = 0.1
+    reason = get_early_termination_reason(my_settings, [instance('baron', 'm1', 1000.0, 950.0)])
+    assert reason.kind == EarlyTermination.TARGET
+    # Also within the racing tolerance, so the solution is optimal
+    reason = get_early_termination_reason(my_settings, [instance('baron', 'm1', 1000.0, 1000.0)])
+    assert reason.kind == EarlyTermination.OPTIMAL
+
+
+def test_bounds_of_different_models_are_not_compared():
+    instances = [instance('baron', 'm1', 1000.0, 900.0), instance('octeract', 'm2', float('inf'), 1000.0)]
+    assert get_early_termination_reason(AutoExecutorSettings(), instances) is None
+
+
+@pytest.mark.parametrize('kind,is_stored', [
+    (None, True),
+    (EarlyTermination.OPTIMAL, True),
+    (EarlyTermination.TARGET, False),
+    (EarlyTermination.PLATEAU, False),
+])
+def test_best_solves_update(kind, is_stored, monkeypatch):
+    stored = list()
+    monkeypatch.setattr(cnc, 'write_result_file', lambda *args: None)
+    monkeypatch.setattr(cnc, 'update_best_solves_table', lambda *args: stored.append(args))
+    my_settings = AutoExecutorSettings()
+    # `--target-cost` does not matter if the solvers were stopped because the optimal solution is known
+    my_settings.r_target_cost = 1100.0
+    if kind is not None:
+        my_settings.early_termination_reason = EarlyTermination(kind, 'test')
+    exec_info = SimpleNamespace(solver_name='baron', short_uniq_model_name='m1', uniq_std_out_err_file_path='x')
+    cnc.main_write_final_solution(my_settings, 1000.0, exec_info)
+    assert (len(stored) == 1) == is_stored
@@ -0,0 +1,94 @@
+import re
+import time
+
+from CalculateNetworkCost_ErrorSignatures import (
+    AMPL_ERROR_SIGNATURES, BARON_ERROR_SIGNATURES, KNITRO_ERROR_SIGNATURES, OCTERACT_ERROR_SIGNATURES, ErrorScanner,
+    ErrorSignature, constant
+)
+from CalculateNetworkCost_SolverLogs import OCTERACT_TABLE_HEADER
+
+BARON_ERROR_SCANNER = ErrorScanner(BARON_ERROR_SIGNATURES)
+
+
+def test_no_errors(twoloop_std_out_err_path):
+    with open(twoloop_std_out_err_path, 'r') as f:
+        assert BARON_ERROR_SCANNER.check(f.read()) == (True, 'No Errors')
+
+
+def test_demo_license():
+    file_txt = 'BARON 23.1.5\nSorry, a demo license is limited to 10 variables\nexit value 1\n<BREAK>\n'
+    assert BARON_ERROR_SCANNER.check(file_txt) == (False, 'Sorry, a demo license is limited to 10 variables')
+
+
+def test_demo_license_without_end_marker_is_ignored():
+    assert BARON_ERROR_SCANNER.check('Sorry, a demo license is limited to 10 variables\n') == (True, 'No Errors')
+
+
+def test_presolve_found_problem_infeasible():
+    file_txt = 'presolve: constraint con2[3] cannot hold:\n\tbody >= 190 cannot be >= 200\n_total_solve_time = 0\n'
+    ok, msg = BARON_ERROR_SCANNER.check(file_txt)
+    assert not ok
+    assert msg.startswith('presolve: constraint con2[3] cannot hold')
+
+
+def test_knitro_infinite_objective():
+    ok, msg = ErrorScanner(KNITRO_ERROR_SIGNATURES).check('Knitro 13.2.0: Locally optimal\nobjective 1.8e+308\n')
+    assert not ok
+    assert msg == '1.8e+308\n'
+
+
+def test_signatures_are_checked_in_table_order():
+    # The Octeract table is printed, so the connection error printed before it did not stop the solver
+    file_txt = 'Error: Failed to establish connection to server.\nampl: ok\n' + OCTERACT_TABLE_HEADER + '\n'
+    assert ErrorScanner(OCTERACT_ERROR_SIGNATURES).check(file_txt) == (True, 'Probably No Errors')
+
+
+def test_requires_and_excludes():
+    scanner = ErrorScanner([
+        ErrorSignature('fatal', constant('fatal, no output'), excludes=[re.escape('iterations')]),
+        ErrorSignature('fatal', constant('fatal after abort'), requires=['abort']),
+    ])
+    assert scanner.check('fatal') == (False, 'fatal, no output')
+    assert scanner.check('iterations: 10\nfatal') == (True, 'No Errors')
+    assert scanner.check('iterations: 10\nabort\nfatal') == (False, 'fatal after abort')
+
+
+def test_overlapping_patterns_are_all_found():
+    scanner = ErrorScanner([ErrorSignature('solve_time', constant('a')), ErrorSignature('_total', constant('b'))])
+    assert scanner.scan('x _total_solve_time = 0') == {'_total': 2, 'solve_time': 9}
+
+
+def test_check_file_cache(tmp_path):
+    file_path = tmp_path / 'std_out_err.txt'
+    file_path.write_text('BARON 23.1.5\n')
+    cache = dict()
+    assert BARON_ERROR_SCANNER.check_file(str(file_path), cache) == (True, 'No Errors')
+    assert str(file_path) in cache
+
+    # The result of an unchanged file is taken from the cache
+    cache[str(file_path)] = (cache[str(file_path)][0], (False, 'cached'))
+    assert BARON_ERROR_SCANNER.check_file(str(file_path), cache) == (False, 'cached')
+
+    with open(file_path, 'a') as f:
+        f.write('No feasible solution was found\n')
+    assert BARON_ERROR_SCANNER.check_file(str(file_path), cache) == (False, 'No feasible solution was found')
+
+
+def test_large_log(baron_log_path):
+    with open(baron_log_path, 'r') as f:
+        log = f.read()
+    # About 6 MB, i.e. a Baron table of a long run
+    end = log.index('\n\n Calculating duals')
+    row = '      12345          678          1234.56     400000.          419000.\n'
+    file_txt = log[:end] + '\n' + row * (6_000_000 // len(row)) + log[end:] + 'No feasible solution was found\n'
+    scanners = [ErrorScanner(i) for i in (
+        AMPL_ERROR_SIGNATURES, BARON_ERROR_SIGNATURES, KNITRO_ERROR_SIGNATURES, OCTERACT_ERROR_SIGNATURES
+    )]
+    start = time.perf_counter()
+    results = [scanner.check(file_txt) for scanner in scanners]
+    elapsed = time.perf_counter() - start
+    assert results[1] == (False, 'No feasible solution was found')
+    assert results[2] == (False, 'No feasible solution was found')
+    # One search per pattern takes about 0.05 seconds per scanner, a regex which tries every pattern at every
+    # position of the file takes more than 1 second per scanner
+    assert elapsed < 2.0
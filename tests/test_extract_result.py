@@ -0,0 +1,92 @@
+import pytest
+
+from CalculateNetworkCost_ExtractResultFromAmplOutput import ExtractionError, extract_result
+from CalculateNetworkCost_WarmStart import parse_ampl_solution
+
+
+def test_extract_twoloop(twoloop_std_out_err_path, twoloop_path):
+    result = extract_result(twoloop_std_out_err_path, twoloop_path, 1, None)
+    assert list(result.solution.heads) == ['1', '2', '3', '4', '5', '6', '7']
+    assert result.solution.heads['2'] == pytest.approx(203.244)
+    assert list(result.solution.flows)[-1] == ('7', '5')
+    assert result.solution.flows[('7', '5')] == pytest.approx(-55.4227)
+    arc_pipes = result.arc_pipes()
+    assert len(arc_pipes) == 8
+    assert arc_pipes[('4', '6')] == [('8', pytest.approx(591.257)), ('9', pytest.approx(408.743))]
+    # 40.0913 + 959.909 is fixed to be exactly the arc length
+    assert sum(length for _, length in arc_pipes[('7', '5')]) == 1000.0
+    assert result.verification.ok(1e-3)
+
+
+def test_same_solution_as_warm_start(twoloop_std_out_err_path, twoloop_path):
+    # The written result and `verify_solution()` both use the solution parsed by `parse_ampl_solution()`
+    solution = parse_ampl_solution(twoloop_std_out_err_path)
+    result = extract_result(twoloop_std_out_err_path, twoloop_path, 1, None)
+    assert result.solution.heads == solution.heads
+    assert result.solution.flows == solution.flows
+    assert result.solution.total_cost == solution.total_cost
+    assert result.solution.lengths.keys() == solution.lengths.keys()
+
+
+def test_to_text(twoloop_std_out_err_path, twoloop_path):
+    lines = extract_result(twoloop_std_out_err_path, twoloop_path, 1, None).to_text().splitlines()
+    assert lines[:2] == ['7', '1 210.0']
+    assert lines[8:10] == ['8', '1 2 311.109']
+    assert lines[17:20] == ['8', '1 2 1', '11 1000.0']
+    assert lines[-3:] == ['7 5 2', '7 40.0913', '8 959.9087']
+
+
+# Same flows as the log of model m1, displayed by model m2 as q1[i,j] - q2[i,j]
+M2_FLOWS = """: q1[i,j] q2[i,j] :=
+1 2   311.109     0
+2 3   158.043     0
+2 4   125.288     0
+3 5   130.266     0
+4 5     0.157062  0
+4 6    91.7983    0
+6 7     0.132273  0
+7 5     0        55.4227
+;"""
+
+
+def test_m2_split_flows(twoloop_std_out_err_path, twoloop_path, tmp_path):
+    with open(twoloop_std_out_err_path, 'r') as f:
+        content = f.read()
+    start = content.index('q[i,j] :=')
+    end = content.index(';', start) + 1
+    std_out_err_path = tmp_path / 'std_out_err.txt'
+    std_out_err_path.write_text(content[:start] + M2_FLOWS + content[end:])
+    result = extract_result(str(std_out_err_path), twoloop_path, 1, None)
+    assert result.solution.flows[('1', '2')] == pytest.approx(311.109)
+    assert result.solution.flows[('7', '5')] == pytest.approx(-55.4227)
+    assert result.verification.ok(1e-3)
+
+
+def test_tight_threshold_is_an_error(twoloop_std_out_err_path, twoloop_path):
+    # The displayed values are rounded to 6 significant digits, so the pipe lengths of arc (7, 5) add up to 1000.0003
+    with pytest.raises(ExtractionError, match='expected_arc_len'):
+        extract_result(twoloop_std_out_err_path, twoloop_path, 1e-6, None)
+
+
+def test_violated_constraint_is_an_error(twoloop_std_out_err_path, twoloop_path, tmp_path):
+    with open(twoloop_std_out_err_path, 'r') as f:
+        content = f.read()
+    std_out_err_path = tmp_path / 'std_out_err.txt'
+    # Minimum head of node 2 is 150 + 30
+    std_out_err_path.write_text(content.replace('2  203.244', '2  170'))
+    with pytest.raises(ExtractionError, match='Violation of constraints'):
+        extract_result(str(std_out_err_path), twoloop_path, 1, None)
+
+
+def test_wrong_network_is_an_error(twoloop_std_out_err_path, hanoi_path):
+    with pytest.raises(ExtractionError):
+        extract_result(twoloop_std_out_err_path, hanoi_path, 1, None)
+
+
+def test_missing_solution_is_an_error(twoloop_path, tmp_path):
+    std_out_err_path = tmp_path / 'std_out_err.txt'
+    std_out_err_path.write_text('Baron: infeasible problem\n_total_solve_time = 0.1\n')
+    with pytest.raises(ExtractionError, match='not found'):
+        extract_result(str(std_out_err_path), twoloop_path, 1, None)
+    with pytest.raises(ExtractionError, match='unable to read'):
+        extract_result(str(tmp_path / 'missing.txt'), twoloop_path, 1, None)
@@ -0,0 +1,153 @@
+import os
+
+import pytest
+
+from conftest import LISTED_NETWORK_HASH, REPO_DIR
+from CalculateNetworkCost_ExtractResultFromAmplOutput import extract_result
+from CalculateNetworkCost_Gams import (
+    GamsListingParser, GmsCache, gams_listing_to_ampl_output, level_value, network_to_gms, read_solution_csv,
+    solution_export_program
+)
+from CalculateNetworkCost_NetworkParser import load_network
+
+
+def listing_path(model_name: str) -> str:
+    return os.path.join(REPO_DIR, f'{LISTED_NETWORK_HASH}{model_name}.lst')
+
+
+def parse_listing(file_path: str) -> GamsListingParser:
+    with open(file_path, 'r', errors='replace') as f:
+        return GamsListingParser().parse(f)
+
+
+def test_listing_of_m1():
+    parser = parse_listing(listing_path('m1'))
+    assert parser.objective_value == '3556311.3801'
+    assert parser.execution_time == '270.160'
+    assert {name: len(rows) for name, rows in parser.rows.items()} == {'h': 78, 'q': 100, 'q1': 0, 'q2': 0, 'l': 1200}
+    assert parser.rows['h'][0] == (['1'], '45.0000')
+
+
+def test_listing_of_m2():
+    parser = parse_listing(listing_path('m2'))
+    assert parser.objective_value == '3595226.7474'
+    assert {name: len(rows) for name, rows in parser.rows.items()} == {'h': 78, 'q': 0, 'q1': 100, 'q2': 100, 'l': 1200}
+
+
+@pytest.mark.parametrize('model_name', ['m1', 'm2'])
+def test_listing_to_ampl_output(model_name, listed_network_path, tmp_path):
+    output_file_path = str(tmp_path / 'std_out_err.txt')
+    gams_listing_to_ampl_output(listing_path(model_name), output_file_path, model_name)
+    with open(output_file_path, 'r') as f:
+        content = f.read()
+    assert content.endswith(f'total_cost = {parse_listing(listing_path(model_name)).objective_value}')
+    # The AMPL output of the converted solution is read and verified like the output of the solvers run by AMPL
+    result = extract_result(output_file_path, listed_network_path, 1e-3, None)
+    assert len(result.solution.heads) == 78
+    assert result.verification.ok(1e-3)
+
+
+def test_listing_of_other_network():
+    parser = parse_listing(os.path.join(REPO_DIR, 'Files', 'Models', 'GAMS', 'm1', 'm1d6.lst'))
+    assert parser.objective_value == '3584717.4394'
+    assert parser.execution_time == '300.104'
+
+
+def test_listing_without_solution(tmp_path):
+    # GAMS stopped due to a licensing error before solving
+    file_path = os.path.join(REPO_DIR, '533dcc7447f2df920d2aa6d87a5183bbacd85c753695ef388b391346c73fe9efm1.lst')
+    assert all(len(rows) == 0 for rows in parse_listing(file_path).rows.values())
+    with pytest.raises(ValueError):
+        gams_listing_to_ampl_output(file_path, str(tmp_path / 'std_out_err.txt'), 'm1')
+
+
+
+def write_solution_csv(parser: GamsListingParser, solution_file_path: str) -> None:
+    """Write the solution of `parser` like the program of `solution_export_program()` (`put` with `.pc = 5`)"""
+    lines = [
+        '"model_status",2.0000000000',
+        '"solver_status",1.0000000000',
+        f'"solve_time",{float(parser.execution_time):.10f}',
+        f'"objective",{float(parser.objective_value):.10f}',
+    ]
+    for name, rows in parser.rows.items():
+        for index, level in rows:
+            quoted_index = ','.join(f'"{i}"' for i in index)
+            lines.append(f'"{name}",{quoted_index},{float(level_value(level)):.10f}')
+    with open(solution_file_path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+@pytest.mark.parametrize('model_name', ['m1', 'm2'])
+def test_solution_csv(model_name, listed_network_path, tmp_path):
+    parser = parse_listing(listing_path(model_name))
+    write_solution_csv(parser, str(tmp_path / 'gams_solution.csv'))
+    solution = read_solution_csv(str(tmp_path / 'gams_solution.csv'))
+    assert (solution.model_status, solution.solver_status) == (2, 1)
+    assert float(solution.objective_value) == float(parser.objective_value)
+    assert float(solution.execution_time) == float(parser.execution_time)
+    for name, rows in parser.rows.items():
+        assert [index for index, _ in solution.rows[name]] == [index for index, _ in rows]
+        assert [float(level) for _, level in solution.rows[name]] == \
+               pytest.approx([float(level_value(level)) for _, level in rows])
+
+    output_file_path = str(tmp_path / 'std_out_err.txt')
+    solution.write_ampl_output(output_file_path, model_name)
+    assert extract_result(output_file_path, listed_network_path, 1e-3, None).verification.ok(1e-3)
+
+
+def test_solution_csv_with_unknown_row(tmp_path):
+    file_path = tmp_path / 'gams_solution.csv'
+    file_path.write_text('"objective",419000.0000000000\n"z","1",2.0000000000\n')
+    with pytest.raises(ValueError):
+        read_solution_csv(str(file_path))
+
+
+def test_incomplete_solution_csv(tmp_path):
+    # The solver was killed before GAMS wrote the objective value
+    file_path = tmp_path / 'gams_solution.csv'
+    file_path.write_text('"model_status",14.0000000000\n"solver_status",3.0000000000\n')
+    solution = read_solution_csv(str(file_path))
+    assert (solution.model_status, solution.solver_status) == (14, 3)
+    with pytest.raises(ValueError):
+        solution.ampl_output_lines('m1')
+
+
+@pytest.mark.parametrize('model_name, flow_variables', [('m1', ['q']), ('m2', ['q1', 'q2'])])
+def test_solution_export_program(model_name, flow_variables):
+    program = solution_export_program('/tmp/net m1.gms', model_name, '/tmp/out/gams_solution.csv')
+    assert '$include "/tmp/net m1.gms"' in program
+    assert 'file solution / "/tmp/out/gams_solution.csv" /;' in program
+    assert f"put 'model_status', {model_name}.modelstat /;" in program
+    for q in ('q', 'q1', 'q2'):
+        assert (f"put '{q}', nodes.tl, j.tl, {q}.l(nodes,j) /;" in program) == (q in flow_variables)
+
+
+@pytest.mark.parametrize('model_name', ['m1', 'm2'])
+@pytest.mark.parametrize('network_hash', [
+    LISTED_NETWORK_HASH,
+    '533dcc7447f2df920d2aa6d87a5183bbacd85c753695ef388b391346c73fe9ef',
+])
+def test_network_to_gms(network_hash, model_name):
+    network = load_network(os.path.join(REPO_DIR, 'DataNetworkGraphInput_hashed', f'{network_hash}.R'), None)
+    # Same as the file written by the earlier conversion tool
+    with open(os.path.join(REPO_DIR, 'DataNetworkGraphInput_hashed', f'{network_hash}{model_name}.gms'), 'r') as f:
+        assert network_to_gms(network, model_name) == f.read()
+
+
+def test_gms_cache(listed_network_path, tmp_path):
+    network = load_network(listed_network_path, None)
+    cache = GmsCache(str(tmp_path / 'GmsCache'))
+    gms_file_path = cache.get(network, 'm2')
+    assert gms_file_path == str(tmp_path / 'GmsCache' / f'{LISTED_NETWORK_HASH}m2.gms')
+    with open(gms_file_path, 'r') as f:
+        assert f.read() == network_to_gms(network, 'm2')
+
+    # An existing file is not written again
+    with open(gms_file_path, 'w') as f:
+        f.write('cached')
+    assert cache.get(network, 'm2') == gms_file_path
+    with open(gms_file_path, 'r') as f:
+        assert f.read() == 'cached'
+
+    assert cache.get(network, 'm3') is None
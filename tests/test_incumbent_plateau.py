@@ -0,0 +1,53 @@
+import math
+
+from CalculateNetworkCost_SolverLogs import IncumbentPlateau
+
+
+def make_plateau():
+    return IncumbentPlateau(tolerance=1e-3, duration=30, min_time=60, start_time=0)
+
+
+def test_infinite_value_is_never_a_plateau():
+    plateau = make_plateau()
+    assert not plateau.update(math.inf, now=10)
+    assert not plateau.update(math.inf, now=1000)
+    assert not plateau.reached
+
+
+def test_no_plateau_before_min_time():
+    plateau = make_plateau()
+    assert not plateau.update(100, now=5)
+    # `duration` has passed since the last improvement, but `min_time` has not
+    assert not plateau.update(100, now=40)
+    assert plateau.update(100, now=60)
+
+
+def test_plateau_after_duration():
+    plateau = make_plateau()
+    assert not plateau.update(100, now=70)
+    assert not plateau.update(100, now=99)
+    assert plateau.update(100, now=100)
+    assert plateau.reached
+
+
+def test_improvement_within_tolerance_is_ignored():
+    plateau = make_plateau()
+    assert not plateau.update(100, now=70)
+    # Relative improvement of 0.05% < 0.1%, so the plateau started at 70 continues
+    assert plateau.update(99.95, now=100)
+
+
+def test_improvement_above_tolerance_restarts_the_plateau():
+    plateau = make_plateau()
+    assert not plateau.update(100, now=70)
+    assert not plateau.update(90, now=95)
+    assert not plateau.update(90, now=124)
+    assert plateau.update(90, now=125)
+
+
+def test_reached_is_sticky():
+    plateau = make_plateau()
+    assert not plateau.update(100, now=70)
+    assert plateau.update(100, now=100)
+    # The solvers are already being stopped, so a late improvement does not undo it
+    assert plateau.update(50, now=101)
@@ -0,0 +1,88 @@
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from CalculateNetworkCost import SolverOutputAnalyzerParent
+from CalculateNetworkCost_LogAccess import MappedFile
+
+
+def mapped(tmp_path, content: bytes) -> MappedFile:
+    file_path = tmp_path / 'std_out_err.txt'
+    file_path.write_bytes(content)
+    return MappedFile(str(file_path))
+
+
+def test_empty_file(tmp_path):
+    with mapped(tmp_path, b'') as log:
+        assert len(log) == 0
+        assert log.rfind_line(b'h[i]') == -1
+        assert log.find_line(b'h[i]') == -1
+        assert log.last_line_containing(b'h[i]') is None
+
+
+def test_marker_at_offset_zero(tmp_path):
+    with mapped(tmp_path, b'h[i] :=\n1 210\n;\n') as log:
+        assert log.rfind_line(b'h[i]') == 0
+        assert log.find_line(b'h[i]') == 0
+        assert log.line(0) == 'h[i] :='
+
+
+def test_marker_not_at_line_start(tmp_path):
+    content = b'display h[i];\nh[i] [*] :=\n1 210\n;\nx h[i]\n'
+    with mapped(tmp_path, content) as log:
+        # The occurrences inside the lines are skipped in both directions
+        assert log.rfind_line(b'h[i]') == content.index(b'h[i] [*]')
+        assert log.find_line(b'h[i]') == content.index(b'h[i] [*]')
+        assert log.find_line(b'h[i]', content.index(b'h[i] [*]') + 1) == -1
+    with mapped(tmp_path, b'display h[i];\n') as log:
+        assert log.rfind_line(b'h[i]') == -1
+        assert log.find_line(b'h[i]') == -1
+
+
+def test_rfind_line_with_regex_and_end(tmp_path):
+    content = b'h[i] [*] :=\n1 210\n;\nh[i] = 5\nh[i] :=\n'
+    with mapped(tmp_path, content) as log:
+        regex = re.compile(r'^h\[i\](?:\s*\[\*\])?\s*:=')
+        assert log.rfind_line(b'h[i]', regex) == content.index(b'h[i] :=')
+        assert log.rfind_line(b'h[i]', regex, content.index(b'h[i] =')) == 0
+        assert log.rfind_line(b'h[i]', re.compile(r'^h\[i\] =')) == content.index(b'h[i] =')
+
+
+def test_missing_file(tmp_path):
+    with pytest.raises(OSError):
+        with MappedFile(str(tmp_path / 'missing.txt')):
+            pass
+
+
+RES_LST = b'''
+ Doing local search
+  The best solution found is:
+
+  variable\t\txlo\t\t\txbest\t\t\txup
+  x1\t\t0.00000\t\t\t1000.00\t\t1000.00
+  x2\t\t0.00000\t\t\t0.00000\t\t1000.00
+
+ The above solution has an objective value of:     0.419000000000E+06
+'''
+
+
+def test_solution_vector_from_res_lst(tmp_path):
+    scratch_dir = tmp_path / 'SolutionData' / 'baron_tmp1'
+    scratch_dir.mkdir(parents=True)
+    (scratch_dir / 'res.lst').write_bytes(RES_LST)
+    std_out_err_path = tmp_path / 'std_out_err.txt'
+    std_out_err_path.write_text('BARON: Cntrl-C Abort\nRetaining scratch directory "/tmp/baron_tmp1".\n')
+    exec_info = SimpleNamespace(
+        uniq_std_out_err_file_path=str(std_out_err_path),
+        aes=SimpleNamespace(OUTPUT_DIR_LEVEL_1_DATA=str(tmp_path / 'SolutionData'))
+    )
+    ok, file_to_parse, objective_value, solution_vector = \
+        SolverOutputAnalyzerParent.extract_solution_vector_from_res_lst(exec_info)
+    assert ok
+    assert str(file_to_parse) == str((scratch_dir / 'res.lst').resolve())
+    assert objective_value == 419000.0
+    assert solution_vector == 'x1: 1000.00\nx2: 0.00000'
+
+    std_out_err_path.write_text('BARON: Cntrl-C Abort\n')
+    assert SolverOutputAnalyzerParent.extract_solution_vector_from_res_lst(exec_info)[0] is False
@@ -0,0 +1,65 @@
+import os
+
+import pytest
+
+from conftest import DATA_DIR
+from CalculateNetworkCost_NetworkParser import (
+    CACHED_ARRAYS, file_hash_sha256, load_network, parse_network_file, read_network_cache, write_network_cache
+)
+
+
+def test_parse_twoloop(twoloop_path):
+    network = parse_network_file(twoloop_path)
+    assert (network.num_nodes, network.num_arcs, network.num_pipes) == (7, 8, 14)
+    assert network.source_id == '1'
+    assert network.arc_ids()[:3] == [('1', '2'), ('2', '4'), ('2', '3')]
+    assert network.by_node_id(network.elevation)['1'] == 210
+    assert network.by_node_id(network.demand)['1'] == pytest.approx(-311.1087)
+    assert network.by_arc_id(network.arc_length)[('7', '5')] == 1000
+    assert network.by_pipe_id(network.pipe_diameter)['14'] == pytest.approx(609.6)
+    assert network.by_pipe_id(network.pipe_cost)['14'] == 550
+
+
+def test_parse_rejects_m3_m4_data_file():
+    with pytest.raises(ValueError):
+        parse_network_file(os.path.join(DATA_DIR, 'm3_m4', 'd1_Sample_input_cycle_twoloop.dat'))
+
+
+def test_cache_round_trip(hanoi_path, tmp_path):
+    network = parse_network_file(hanoi_path)
+    network.data_file_hash = file_hash_sha256(hanoi_path)
+    write_network_cache(network, str(tmp_path / 'hanoi.bin'))
+    cached = read_network_cache(str(tmp_path / 'hanoi.bin'))
+    assert cached.data_file_hash == network.data_file_hash
+    assert cached.node_ids == network.node_ids
+    assert cached.pipe_ids == network.pipe_ids
+    assert cached.source == network.source
+    for name in CACHED_ARRAYS:
+        assert getattr(cached, name) == getattr(network, name), name
+
+
+def test_cache_with_extra_data_is_rejected(twoloop_path, tmp_path):
+    cache_file_path = str(tmp_path / 'twoloop.bin')
+    write_network_cache(parse_network_file(twoloop_path), cache_file_path)
+    with open(cache_file_path, 'ab') as f:
+        f.write(b'\0')
+    with pytest.raises(ValueError):
+        read_network_cache(cache_file_path)
+
+
+def test_load_network_uses_and_repairs_the_cache(twoloop_path, tmp_path):
+    data_file_hash = file_hash_sha256(twoloop_path)
+    network = load_network(twoloop_path, str(tmp_path))
+    assert network.data_file_hash == data_file_hash
+    cache_file_path = tmp_path / f'{data_file_hash}.bin'
+    assert cache_file_path.is_file()
+    assert load_network(twoloop_path, str(tmp_path)).node_ids == network.node_ids
+
+    cache_file_path.write_bytes(cache_file_path.read_bytes()[:-8])
+    assert load_network(twoloop_path, str(tmp_path)).arc_length == network.arc_length
+    assert read_network_cache(str(cache_file_path)).arc_length == network.arc_length
+
+
+def test_load_network_of_invalid_file(tmp_path):
+    assert load_network(str(tmp_path / 'missing.dat'), None) is None
+    assert load_network(os.path.join(DATA_DIR, 'm3_m4', 'd1_Sample_input_cycle_twoloop.dat'), None) is None
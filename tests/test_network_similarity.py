@@ -0,0 +1,77 @@
+import math
+
+import pytest
+
+from CalculateNetworkCost_NetworkParser import parse_network_file
+from CalculateNetworkCost_NetworkSimilarity import (
+    NetworkSignature, adapt_solution, estimate_infeasibility, network_signature, parameter_distance
+)
+from CalculateNetworkCost_WarmStart import AmplSolution, parse_ampl_solution
+
+
+def edited_copy(data_file_path, tmp_path, old: str, new: str) -> str:
+    """Returns: path of a copy of the data file in which the first occurrence of `old` is replaced by `new`"""
+    with open(data_file_path, 'r') as f:
+        content = f.read()
+    assert old in content
+    res = tmp_path / 'edited.dat'
+    res.write_text(content.replace(old, new, 1))
+    return str(res)
+
+
+def test_same_network_has_zero_distance(twoloop_path):
+    a = network_signature(parse_network_file(twoloop_path))
+    b = network_signature(parse_network_file(twoloop_path))
+    assert (a.topology_hash, a.pipes_hash) == (b.topology_hash, b.pipes_hash)
+    assert parameter_distance(a, b) == 0.0
+
+
+def test_changed_demand_keeps_the_hashes(twoloop_path, tmp_path):
+    old = network_signature(parse_network_file(twoloop_path))
+    new = network_signature(parse_network_file(edited_copy(twoloop_path, tmp_path, '7   55.555 ;', '7   65.555 ;')))
+    assert (new.topology_hash, new.pipes_hash) == (old.topology_hash, old.pipes_hash)
+    # Change of 10 relative to the larger of the total absolute demands (622.2174 before, 632.2174 after)
+    assert parameter_distance(new, old) == pytest.approx(10 / 632.2174, rel=1e-3)
+
+
+def test_changed_topology_or_pipes_is_not_comparable(twoloop_path, hanoi_path, tmp_path):
+    old = network_signature(parse_network_file(twoloop_path))
+    assert parameter_distance(network_signature(parse_network_file(hanoi_path)), old) == math.inf
+    new = network_signature(parse_network_file(edited_copy(twoloop_path, tmp_path, '14   550 ;', '14   560 ;')))
+    assert new.topology_hash == old.topology_hash
+    assert new.pipes_hash != old.pipes_hash
+    assert parameter_distance(new, old) == math.inf
+
+
+def test_json_round_trip(twoloop_path):
+    signature = network_signature(parse_network_file(twoloop_path))
+    res = NetworkSignature.from_json(signature.topology_hash, signature.pipes_hash, signature.parameters_json())
+    assert res.arc_length == signature.arc_length
+    assert res.pipes == signature.pipes
+    assert res.demand == signature.demand
+    assert parameter_distance(res, signature) == 0.0
+
+
+def test_adapt_solution_scales_the_pipe_lengths(twoloop_path, tmp_path):
+    old = network_signature(parse_network_file(twoloop_path))
+    new = network_signature(parse_network_file(edited_copy(twoloop_path, tmp_path, '1    2    1000', '1    2    1500')))
+    solution = AmplSolution(
+        0.0, {'1': 210.0}, {('1', '2'): 311.1087}, {('1', '2', '13'): 600.0, ('1', '2', '14'): 400.0}
+    )
+    res = adapt_solution(solution, new, old)
+    assert res.lengths == {('1', '2', '13'): pytest.approx(900.0), ('1', '2', '14'): pytest.approx(600.0)}
+    assert res.total_cost == pytest.approx(900 * 300 + 600 * 550)
+    assert not res.is_feasible
+
+
+def test_estimate_infeasibility_of_adapted_solution(twoloop_path, twoloop_std_out_err_path, tmp_path):
+    old_network = parse_network_file(twoloop_path)
+    new_network = parse_network_file(edited_copy(twoloop_path, tmp_path, '1    2    1000', '1    2    1500'))
+    solution = parse_ampl_solution(twoloop_std_out_err_path)
+    assert estimate_infeasibility(solution, old_network).ok(1e-3)
+    res = estimate_infeasibility(
+        adapt_solution(solution, network_signature(new_network), network_signature(old_network)), new_network
+    )
+    # The pipe lengths are scaled to the new arc length, but the longer arc (1, 2) has a larger head loss
+    assert res.max_violation['length'] < 1e-3
+    assert res.max_violation['head_loss'] > 1
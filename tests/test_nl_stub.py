@@ -0,0 +1,105 @@
+import os
+import stat
+import threading
+
+import pytest
+
+from CalculateNetworkCost import AutoExecutorSettings
+from CalculateNetworkCost_NlStub import NlStubCache, solver_options_environment
+
+# Writes the stub asked for by `write "g<path>";`, and counts its executions in `ampl_calls.txt`
+FAKE_AMPL = r'''#!/usr/bin/env python3
+import os, re, sys, time
+commands = sys.stdin.read()
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ampl_calls.txt'), 'a') as f:
+    f.write('call\n')
+time.sleep(0.2)
+stub_path = re.search(r'write "g(.+)";', commands).group(1)
+with open(stub_path + '.nl', 'w') as f:
+    f.write(commands)
+'''
+
+FAILING_AMPL = r'''#!/usr/bin/env python3
+import sys
+sys.stdin.read()
+print('model.R, line 3: syntax error')
+'''
+
+
+def make_script(tmp_path, content: str) -> str:
+    script_path = tmp_path / 'ampl'
+    script_path.write_text(content)
+    script_path.chmod(script_path.stat().st_mode | stat.S_IXUSR)
+    return str(script_path)
+
+
+def ampl_calls(tmp_path) -> int:
+    calls_path = tmp_path / 'ampl_calls.txt'
+    return len(calls_path.read_text().splitlines()) if calls_path.exists() else 0
+
+
+@pytest.fixture
+def model_data(tmp_path):
+    model_path, data_path = tmp_path / 'model.R', tmp_path / 'data.dat'
+    model_path.write_text('var x >= 0;\nminimize cost: x;\n')
+    data_path.write_text('data;\n')
+    return str(model_path), str(data_path)
+
+
+def test_cache_key(tmp_path, model_data):
+    model_path, data_path = model_data
+    cache = NlStubCache(str(tmp_path / 'cache'), make_script(tmp_path, FAKE_AMPL))
+    stub_path = cache.get(model_path, data_path)
+    assert os.path.isfile(stub_path + '.nl')
+    assert cache.get(model_path, data_path) == stub_path
+    assert ampl_calls(tmp_path) == 1
+    # The setup commands are part of the key, and are executed before writing the stub
+    warm_stub_path = cache.get(model_path, data_path, 'let x := 1;')
+    assert warm_stub_path != stub_path
+    with open(warm_stub_path + '.nl') as f:
+        assert 'let x := 1;' in f.read()
+    # A new object (e.g. another process) reuses the stubs on disk
+    other_cache = NlStubCache(str(tmp_path / 'cache'), make_script(tmp_path, FAKE_AMPL))
+    assert other_cache.get(model_path, data_path, 'let x := 1;') == warm_stub_path
+    assert ampl_calls(tmp_path) == 2
+    # The contents (not the paths) of the model and data files are part of the key
+    with open(data_path, 'a') as f:
+        f.write('# edited\n')
+    assert cache.get(model_path, data_path) not in (stub_path, warm_stub_path)
+    assert ampl_calls(tmp_path) == 3
+
+
+def test_single_writer(tmp_path, model_data):
+    cache = NlStubCache(str(tmp_path / 'cache'), make_script(tmp_path, FAKE_AMPL))
+    results = list()
+    threads = [threading.Thread(target=lambda: results.append(cache.get(*model_data))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+    assert len(results) == 8 and len(set(results)) == 1 and results[0] is not None
+    assert ampl_calls(tmp_path) == 1
+    # No temporary stub is left behind
+    assert os.listdir(tmp_path / 'cache') == [os.path.basename(results[0]) + '.nl']
+
+
+def test_ampl_writes_no_stub(tmp_path, model_data, caplog):
+    cache = NlStubCache(str(tmp_path / 'cache'), make_script(tmp_path, FAILING_AMPL))
+    assert cache.get(*model_data) is None
+    assert 'syntax error' in caplog.text
+    assert NlStubCache(str(tmp_path / 'cache'), str(tmp_path / 'missing_ampl')).get(*model_data) is None
+    assert NlStubCache(str(tmp_path / 'cache'), make_script(tmp_path, FAKE_AMPL)).get(
+        str(tmp_path / 'missing.R'), model_data[1]
+    ) is None
+
+
+def test_solver_options_environment():
+    solvers = AutoExecutorSettings().solvers
+    for solver_name in ('baron', 'octeract', 'knitro'):
+        name, value = solver_options_environment(solvers[solver_name].engine_options)
+        assert name == f'{solver_name}_options'
+        assert value.startswith('threads=1' if solver_name != 'octeract' else 'num_cores=1')
+        assert '"' not in value
+    # Run using GAMS, so its options are not an AMPL `option` command
+    assert solver_options_environment(solvers['alphaecp'].engine_options) is None
+    assert solver_options_environment('option baron_options "a=1"; option knitro_options "b=2";') is None
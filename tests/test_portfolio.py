@@ -0,0 +1,95 @@
+import math
+
+import pytest
+
+from CalculateNetworkCost_NetworkParser import parse_network_file
+from CalculateNetworkCost_Portfolio import (
+    CombinationStatistics, NetworkFeatures, SolveRecord, combination_statistics, feature_distance, network_features,
+    rank_combinations, select_portfolio, time_to_best
+)
+from CalculateNetworkCost_SolverLogs import ProgressRow
+
+COMBINATIONS = [('baron', 'm1'), ('baron', 'm2'), ('octeract', 'm1'), ('octeract', 'm2'), ('knitro', 'm1')]
+
+
+def test_network_features(twoloop_path, hanoi_path):
+    twoloop = network_features(parse_network_file(twoloop_path))
+    assert twoloop[:4] == (7, 8, 14, 2)
+    assert twoloop.demand_spread > 0
+    hanoi = network_features(parse_network_file(hanoi_path))
+    assert feature_distance(twoloop, twoloop) == 0.0
+    assert feature_distance(twoloop, hanoi) == feature_distance(hanoi, twoloop) > 0
+
+
+def test_feature_distance_is_relative():
+    # 10 vs 20 nodes is about as far as 100 vs 200 nodes
+    a = feature_distance(NetworkFeatures(10, 12, 5, 3, 0.5), NetworkFeatures(20, 12, 5, 3, 0.5))
+    b = feature_distance(NetworkFeatures(100, 12, 5, 3, 0.5), NetworkFeatures(200, 12, 5, 3, 0.5))
+    assert a == pytest.approx(b, abs=0.05)
+    c = feature_distance(NetworkFeatures(10, 12, 5, 3, 0.5), NetworkFeatures(10, 12, 5, 3, 0.8))
+    assert c == pytest.approx(0.3)
+
+
+def test_time_to_best():
+    trajectory = [ProgressRow(None, 500.0, None), ProgressRow(1.0, 430.0, 100.0), ProgressRow(4.0, 419.0, 300.0)]
+    assert time_to_best(trajectory, 419.0) == 4.0
+    assert time_to_best(trajectory, 430.0) == 1.0
+    assert time_to_best(trajectory, 400.0) is None
+
+
+def test_combination_statistics():
+    records = [
+        SolveRecord('net1', 'run1', 'baron', 'm1', 100.0, 5.0),
+        SolveRecord('net1', 'run1', 'octeract', 'm1', 120.0, 2.0),
+        SolveRecord('net1', 'run2', 'baron', 'm1', 100.0, 7.0),
+        SolveRecord('net1', 'run2', 'octeract', 'm1', 100.00001, 3.0),
+        # No combination found a feasible solution, so none of them won
+        SolveRecord('net2', 'run1', 'baron', 'm1', math.inf),
+        SolveRecord('net2', 'run1', 'knitro', 'm1', math.inf),
+    ]
+    stats = combination_statistics(records)
+    assert stats[('baron', 'm1')] == CombinationStatistics(3, 2, 6.0)
+    assert stats[('octeract', 'm1')] == CombinationStatistics(2, 1, 3.0)
+    assert stats[('knitro', 'm1')] == CombinationStatistics(1, 0, math.inf)
+    assert stats[('baron', 'm1')].win_rate == pytest.approx(2 / 3)
+
+
+def test_rank_combinations():
+    stats = {
+        ('baron', 'm1'): CombinationStatistics(4, 2, 10.0),
+        ('baron', 'm2'): CombinationStatistics(4, 0, math.inf),
+        ('octeract', 'm1'): CombinationStatistics(4, 2, 5.0),
+        ('knitro', 'm1'): CombinationStatistics(2, 2, math.inf),
+    }
+    # Win rate, then time to best, then the untried combination, then the one which never won
+    assert rank_combinations(COMBINATIONS, stats) == [
+        ('knitro', 'm1'), ('octeract', 'm1'), ('baron', 'm1'), ('octeract', 'm2'), ('baron', 'm2')
+    ]
+    # Without any history, the order given by the user is kept
+    assert rank_combinations(COMBINATIONS, dict()) == COMBINATIONS
+
+
+def test_select_portfolio_explores_the_least_tried_combination():
+    stats = {
+        ('baron', 'm1'): CombinationStatistics(6, 5, 10.0),
+        ('baron', 'm2'): CombinationStatistics(6, 1, 10.0),
+        ('octeract', 'm1'): CombinationStatistics(6, 0, math.inf),
+        ('octeract', 'm2'): CombinationStatistics(2, 0, math.inf),
+        ('knitro', 'm1'): CombinationStatistics(1, 0, math.inf),
+    }
+    selected, explored = select_portfolio(COMBINATIONS, stats, 3)
+    assert explored == ('knitro', 'm1')
+    assert selected == [('baron', 'm1'), ('baron', 'm2'), ('knitro', 'm1')]
+
+    # Once it is tried as often as the others, the best ranked of the least tried ones is explored
+    stats[('knitro', 'm1')] = CombinationStatistics(2, 0, math.inf)
+    assert select_portfolio(COMBINATIONS, stats, 3)[1] == ('octeract', 'm2')
+
+
+@pytest.mark.parametrize('size, expected', [
+    (1, ([('baron', 'm1')], None)),
+    (5, (COMBINATIONS, None)),
+    (10, (COMBINATIONS, None)),
+])
+def test_select_portfolio_without_exploration(size, expected):
+    assert select_portfolio(COMBINATIONS, dict(), size) == expected
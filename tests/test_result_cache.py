@@ -0,0 +1,28 @@
+import sqlite3
+
+import CalculateNetworkCost as cnc
+from CalculateNetworkCost import AutoExecutorSettings, get_cached_best_solves
+
+
+def test_cached_best_solves_of_requested_combinations(monkeypatch):
+    connection = sqlite3.connect(':memory:')
+    cursor = connection.cursor()
+    cursor.execute('CREATE TABLE best_solves (hash_id TEXT, solve_time INTEGER, best_cost DECIMAL(10,2), '
+                   'best_solver TEXT, best_model TEXT)')
+    cursor.executemany('INSERT INTO best_solves VALUES (?, ?, ?, ?, ?)', [
+        ('abc', 300, 1000.0, 'octeract', 'm2'),
+        ('abc', 300, 1100.0, 'baron', 'm1'),
+        ('abc', 60, 900.0, 'baron', 'm1'),
+        ('xyz', 300, 800.0, 'baron', 'm1'),
+    ])
+    monkeypatch.setattr(cnc, 'cursor', cursor, raising=False)
+    my_settings = AutoExecutorSettings()
+    my_settings.data_file_hash = 'abc'
+    my_settings.r_execution_time_limit = 300
+    my_settings.solver_model_combinations = [('baron', 'm1_basic.R'), ('baron', 'm2_basic2_v2.R')]
+    # The better result of octeract is not used, as it was not asked for
+    assert get_cached_best_solves(my_settings) == [(300, 1100.0, 'baron', 'm1')]
+    my_settings.solver_model_combinations.append(('octeract', 'm2_basic2_v2.R'))
+    assert [row[2] for row in get_cached_best_solves(my_settings)] == ['octeract', 'baron']
+    my_settings.solver_model_combinations = [('knitro', 'm1_basic.R')]
+    assert get_cached_best_solves(my_settings) == []
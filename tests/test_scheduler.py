@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+
+import CalculateNetworkCost as cnc
+from CalculateNetworkCost import SolverSlotScheduler
+
+
+@pytest.fixture
+def meminfo(monkeypatch):
+    """Fields of "/proc/meminfo" (GiB) seen by `SolverSlotScheduler`, the tests change them as required"""
+    res = {'MemAvailable': 64.0, 'SwapTotal': 0.0, 'SwapFree': 0.0}
+    monkeypatch.setattr(cnc, 'read_meminfo', lambda: dict(res))
+    monkeypatch.setattr(SolverSlotScheduler, 'MEMORY_CHECK_INTERVAL', 0.05)
+    return res
+
+
+def start_acquire(scheduler: SolverSlotScheduler, name: str, n: int, admitted: list) -> threading.Thread:
+    """Returns: started thread which appends `name` to `admitted` once `scheduler.acquire(n)` returns"""
+    thread = threading.Thread(target=lambda: scheduler.acquire(n) and admitted.append(name), daemon=True)
+    thread.start()
+    # Wait till the thread is in the queue of the scheduler
+    time.sleep(0.1)
+    return thread
+
+
+def test_fifo_admission(meminfo):
+    scheduler = SolverSlotScheduler(2)
+    assert scheduler.acquire(2)
+    admitted = list()
+    big = start_acquire(scheduler, 'big', 2, admitted)
+    small = start_acquire(scheduler, 'small', 1, admitted)
+    scheduler.release(1)
+    time.sleep(0.2)
+    # One slot is free, but 'small' started waiting after 'big'
+    assert admitted == []
+    scheduler.release(1)
+    big.join(5)
+    time.sleep(0.2)
+    assert admitted == ['big']
+    scheduler.release(2)
+    small.join(5)
+    assert admitted == ['big', 'small']
+    assert scheduler.used_slots == 1
+
+
+def test_acquire_timeout(meminfo):
+    scheduler = SolverSlotScheduler(1)
+    assert scheduler.acquire(1)
+    start = time.time()
+    assert not scheduler.acquire(1, timeout=0.2)
+    assert 0.2 <= time.time() - start < 2
+    assert scheduler.used_slots == 1
+    # The caller which timed out does not block the ones after it
+    scheduler.release(1)
+    assert scheduler.acquire(1, timeout=0)
+
+
+def test_oversize_request_is_clamped(meminfo):
+    scheduler = SolverSlotScheduler(4)
+    assert scheduler.acquire(10, timeout=0)
+    assert scheduler.used_slots == 4
+    assert not scheduler.acquire(1, timeout=0.1)
+    scheduler.release(10)
+    assert scheduler.used_slots == 0
+
+
+def test_ram_reservation_and_release(meminfo):
+    meminfo['MemAvailable'] = 10.0
+    scheduler = SolverSlotScheduler(8, min_free_ram=1.0)
+    # Nothing is running, so the first solver instance is always admitted
+    assert scheduler.acquire(1, ram=20.0, timeout=0)
+    scheduler.release(1, ram=20.0)
+    assert scheduler.acquire(1, ram=5.0, timeout=0)
+    assert scheduler.reserved_ram == 5.0
+    # 10 - 5 (reserved) - 5 < 1
+    assert not scheduler.acquire(1, ram=5.0, timeout=0.1)
+    assert scheduler.acquire(1, ram=4.0, timeout=0)
+    # The first solver instance started using its RAM, so it is now a part of "MemAvailable"
+    scheduler.release(0, ram=5.0)
+    meminfo['MemAvailable'] = 5.0
+    assert scheduler.reserved_ram == 4.0
+    assert not scheduler.acquire(1, ram=1.0, timeout=0.1)
+    meminfo['MemAvailable'] = 6.0
+    assert scheduler.acquire(1, ram=1.0, timeout=0.1)
+    assert scheduler.used_slots == 3
+
+
+def test_swap(meminfo):
+    meminfo.update(SwapTotal=8.0, SwapFree=0.5)
+    scheduler = SolverSlotScheduler(8, min_free_swap=1.0)
+    assert scheduler.acquire(1, timeout=0)
+    assert not scheduler.acquire(1, timeout=0.1)
+    meminfo['SwapFree'] = 2.0
+    assert scheduler.acquire(1, timeout=0.1)
+    # Not checked if the system has less Swap than `min_free_swap`
+    meminfo.update(SwapTotal=0.5, SwapFree=0.0)
+    assert scheduler.acquire(1, timeout=0)
@@ -0,0 +1,146 @@
+import math
+
+import pytest
+
+from CalculateNetworkCost_SolverLogs import (
+    FLAG_GLOBAL_OPTIMUM, FLAG_INFEASIBLE, ProgressRow, SolverLogFollower, iter_progress_rows
+)
+
+KNITRO_FEASIBLE_LOG = '''Knitro 13.2.0: outlev=1 ms_enable=1 par_numthreads=1 maxtime_real=300
+EXIT: Locally optimal solution found.
+
+Final Statistics
+----------------
+Final objective value               =   4.19000000000000e+05
+Final feasibility error (abs / rel) =   0.00e+00 / 0.00e+00
+Knitro 13.2.0: Locally optimal or satisfactory solution.
+objective 419000; feasibility error 0
+'''
+
+KNITRO_INFEASIBLE_LOG = '''Knitro 13.2.0: outlev=1 ms_enable=1 par_numthreads=1 maxtime_real=300
+EXIT: Infeasible stopping point.
+
+Final Statistics
+----------------
+Final objective value               =   3.51000000000000e+05
+Final feasibility error (abs / rel) =   2.36e+01 / 1.31e-01
+Knitro 13.2.0: Convergence to an infeasible point.
+objective 351000; feasibility error 23.6
+'''
+
+
+def test_baron_rows(baron_log_path):
+    with open(baron_log_path, 'r') as f:
+        rows = list(iter_progress_rows(f, 'baron'))
+    assert rows == [
+        ProgressRow(None, 441497.0, None),
+        ProgressRow(0.12, 430000.0, 200000.0),
+        ProgressRow(0.14, 430000.0, 300000.0),
+        ProgressRow(1.02, 419000.0, 400000.0),
+        ProgressRow(1.55, 419000.0, 400000.0),
+        ProgressRow(2.05, 419000.0, 419000.0),
+        ProgressRow(None, None, None, frozenset([FLAG_GLOBAL_OPTIMUM])),
+        # "optimal within tolerances" of the solve message of AMPL
+        ProgressRow(None, None, None, frozenset([FLAG_GLOBAL_OPTIMUM])),
+    ]
+
+
+def test_octeract_rows(octeract_log_path):
+    with open(octeract_log_path, 'r') as f:
+        rows = list(iter_progress_rows(f, 'octeract'))
+    assert rows == [
+        ProgressRow(0.0, 500000.0, 0.0, frozenset([FLAG_INFEASIBLE])),
+        ProgressRow(1.0, 430000.0, 200000.0),
+        ProgressRow(3.0, 419000.0, 400000.0),
+        ProgressRow(5.0, 419000.0, 419000.0),
+        ProgressRow(None, 419000.0, None, frozenset([FLAG_GLOBAL_OPTIMUM])),
+    ]
+
+
+def test_follow_baron(baron_log_path):
+    follower = SolverLogFollower(baron_log_path, 'baron').update()
+    assert follower.has_progress_table
+    assert (follower.upper_bound, follower.lower_bound, follower.solver_time) == (419000.0, 419000.0, 2.05)
+    assert follower.global_optimum_proved
+    assert follower.total_cost == 419000.0
+    assert follower.best_solution() == (True, 419000.0)
+    # Only the rows which improved some bound
+    assert [(row.time, row.upper_bound) for row in follower.trajectory] == [
+        (None, 441497.0), (0.12, 430000.0), (0.14, 430000.0), (1.02, 419000.0), (2.05, 419000.0)
+    ]
+
+
+def test_follow_growing_file(baron_log_path, tmp_path):
+    with open(baron_log_path, 'rb') as f:
+        content = f.read()
+    file_path = tmp_path / 'std_out_err.txt'
+    follower = SolverLogFollower(str(file_path), 'baron')
+    # The file does not exist yet
+    assert follower.update().best_solution() == (False, 0.0)
+
+    # Ends in the middle of the row of time 1.02
+    middle = content.index(b'1.02') + 2
+    file_path.write_bytes(content[:middle])
+    follower.update()
+    assert (follower.upper_bound, follower.lower_bound) == (430000.0, 300000.0)
+    assert follower.last_update_time > 0
+    assert follower.total_cost is None
+
+    with open(file_path, 'ab') as f:
+        f.write(content[middle:])
+    follower.update()
+    assert (follower.upper_bound, follower.lower_bound) == (419000.0, 419000.0)
+    assert follower.total_cost == 419000.0
+
+    # The file is rewritten from the start
+    file_path.write_bytes(b'BARON 23.1.5\n')
+    follower.update()
+    assert follower.upper_bound == math.inf
+    assert follower.total_cost is None
+
+
+def test_follow_octeract_infeasible_upper_bound(octeract_log_path, tmp_path):
+    with open(octeract_log_path, 'r') as f:
+        lines = f.readlines()
+    file_path = tmp_path / 'std_out_err.txt'
+    # Till the first row of the table, whose upper bound is infeasible
+    file_path.write_text(''.join(lines[:6]))
+    follower = SolverLogFollower(str(file_path), 'octeract').update()
+    assert follower.infeasible_flag
+    assert follower.upper_bound == math.inf
+    assert follower.lower_bound == 0.0
+    assert not follower.solution_found()
+
+    follower = SolverLogFollower(octeract_log_path, 'octeract').update()
+    assert not follower.infeasible_flag
+    assert follower.global_optimum_proved
+    assert follower.best_solution() == (True, 419000.0)
+
+
+@pytest.mark.parametrize('log, expected', [
+    (KNITRO_FEASIBLE_LOG, (True, 419000.0)),
+    (KNITRO_INFEASIBLE_LOG, (False, 0.0)),
+])
+def test_follow_knitro(log, expected, tmp_path):
+    file_path = tmp_path / 'std_out_err.txt'
+    file_path.write_text(log)
+    follower = SolverLogFollower(str(file_path), 'knitro').update()
+    assert not follower.has_progress_table
+    assert follower.best_solution() == expected
+    assert follower.lower_bound == -math.inf
+
+
+def test_follow_knitro_infeasible_with_total_cost(tmp_path):
+    file_path = tmp_path / 'std_out_err.txt'
+    file_path.write_text(KNITRO_INFEASIBLE_LOG + 'total_cost = 351000\n')
+    follower = SolverLogFollower(str(file_path), 'knitro').update()
+    assert follower.final_point_infeasible
+    assert follower.best_solution() == (False, 351000.0)
+
+
+def test_solver_without_progress_table(baron_log_path):
+    follower = SolverLogFollower(baron_log_path, 'alphaecp').update()
+    assert not follower.has_progress_table
+    assert follower.trajectory == []
+    # Only the value displayed by AMPL is known
+    assert follower.best_solution() == (True, 419000.0)
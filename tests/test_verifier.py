@@ -0,0 +1,90 @@
+import math
+
+import pytest
+
+from CalculateNetworkCost_NetworkParser import parse_network_file
+from CalculateNetworkCost_Verifier import HAZEN_WILLIAMS_OMEGA, NetworkVerifier, VerificationResult
+from CalculateNetworkCost_WarmStart import AmplSolution
+
+# Source 1 supplies node 2 and, through node 2, node 3
+CHAIN_NETWORK = '''
+set nodes := 1 2 3 ;
+set pipes := 1 2 ;
+param : arcs : L :=
+1 2 100
+2 3 200 ;
+param d := 1 100 2 200 ;
+param C := 1 10 2 20 ;
+param R := 1 130 2 130 ;
+param E := 1 100 2 50 3 40 ;
+param P := 1 0 2 10 3 10 ;
+param D := 1 -15 2 10 3 5 ;
+param Source := 1 ;
+'''
+
+
+def head_loss(flow: float, lengths_diameters) -> float:
+    """Returns: right hand side of con3 for an arc with pipes of the given (length, diameter), all with R = 130"""
+    resistance = sum(
+        HAZEN_WILLIAMS_OMEGA * length / ((130 ** 1.852) * (d / 1000) ** 4.87) for length, d in lengths_diameters
+    )
+    return flow * abs(flow) ** 0.852 * (0.001 ** 1.852) * resistance
+
+
+@pytest.fixture
+def verifier(tmp_path):
+    data_file_path = tmp_path / 'chain.dat'
+    data_file_path.write_text(CHAIN_NETWORK)
+    return NetworkVerifier(parse_network_file(str(data_file_path)))
+
+
+def feasible_solution() -> AmplSolution:
+    h1 = 100.0
+    h2 = h1 - head_loss(15, [(100, 200)])
+    h3 = h2 - head_loss(5, [(150, 100), (50, 200)])
+    return AmplSolution(
+        100 * 20 + 150 * 10 + 50 * 20,
+        {'1': h1, '2': h2, '3': h3},
+        {('1', '2'): 15.0, ('2', '3'): 5.0},
+        {('1', '2', '2'): 100.0, ('2', '3', '1'): 150.0, ('2', '3', '2'): 50.0}
+    )
+
+
+def test_feasible_solution(verifier):
+    res = verifier.verify(feasible_solution())
+    assert set(res.max_violation.keys()) == set(VerificationResult.CONSTRAINTS)
+    assert res.worst() == pytest.approx(0.0, abs=1e-9)
+    assert res.ok(1e-6)
+
+
+def test_violations(verifier):
+    solution = feasible_solution()
+    solution.flows[('2', '3')] = 6.0
+    solution.heads['3'] = 45.0
+    solution.lengths[('2', '3', '1')] = 100.0
+    res = verifier.verify(solution)
+    # Node 2 sends 1 more than node 3 needs
+    assert res.max_violation['flow'] == pytest.approx(1.0)
+    assert res.max_violation['pressure'] == pytest.approx(5.0)
+    assert res.max_violation['length'] == pytest.approx(50.0)
+    assert res.max_violation['head_loss'] > 0
+    assert res.max_violation['source'] == 0.0
+    assert not res.ok(1e-6)
+
+
+def test_missing_values_are_infinite_violations(verifier):
+    solution = feasible_solution()
+    del solution.heads['3']
+    del solution.flows[('1', '2')]
+    res = verifier.verify(solution)
+    assert math.isinf(res.max_violation['flow'])
+    assert math.isinf(res.max_violation['pressure'])
+    assert math.isinf(res.max_violation['head_loss'])
+    assert res.max_violation['source'] == pytest.approx(0.0)
+
+
+def test_negative_length_is_a_violation(verifier):
+    solution = feasible_solution()
+    solution.lengths[('1', '2', '1')] = -10.0
+    solution.lengths[('1', '2', '2')] = 110.0
+    assert verifier.verify(solution).max_violation['length'] == pytest.approx(10.0)
@@ -0,0 +1,87 @@
+import pytest
+
+from CalculateNetworkCost_WarmStart import AmplSolution, ampl_key, find_best_prior_solution, parse_ampl_solution
+
+
+def write_result_file(result_dir, std_out_err_path: str, cost: float, status: str = 'True', model: str = 'm1'):
+    """Write `0_result.txt` in the format of `CalculateNetworkCost.py`"""
+    result_dir.mkdir(parents=True)
+    (result_dir / '0_result.txt').write_text(f'{status}\nbaron\n{model}\n{std_out_err_path}\n{cost}\n')
+
+
+def test_parse_twoloop(twoloop_std_out_err_path):
+    solution = parse_ampl_solution(twoloop_std_out_err_path)
+    assert solution.total_cost == 417366
+    assert len(solution.heads) == 7
+    assert solution.heads['2'] == pytest.approx(203.244)
+    assert len(solution.flows) == 8
+    assert solution.flows[('7', '5')] == pytest.approx(-55.4227)
+    assert len(solution.lengths) == 10
+    assert solution.lengths[('4', '6', '9')] == pytest.approx(408.743)
+    assert solution.is_feasible
+
+
+def test_parse_split_flows(twoloop_std_out_err_path, tmp_path):
+    with open(twoloop_std_out_err_path, 'r') as f:
+        content = f.read()
+    start = content.index('q[i,j] :=')
+    end = content.index(';', start) + 1
+    file_path = tmp_path / 'std_out_err.txt'
+    file_path.write_text(content[:start] + ': q1[i,j] q2[i,j] :=\n1 2 311.109 0\n7 5 0 55.4227\n;' + content[end:])
+    assert parse_ampl_solution(str(file_path)).flows == {('1', '2'): 311.109, ('7', '5'): -55.4227}
+
+
+def test_parse_incomplete_output(twoloop_std_out_err_path, tmp_path):
+    with open(twoloop_std_out_err_path, 'r') as f:
+        content = f.read()
+    file_path = tmp_path / 'std_out_err.txt'
+    # The solver was killed before AMPL displayed `total_cost`
+    file_path.write_text(content[:content.index('total_cost')])
+    assert parse_ampl_solution(str(file_path)) is None
+    file_path.write_text('Baron: infeasible problem\n')
+    assert parse_ampl_solution(str(file_path)) is None
+    assert parse_ampl_solution(str(tmp_path / 'missing.txt')) is None
+
+
+def test_find_best_prior_solution(twoloop_std_out_err_path, tmp_path):
+    worse = tmp_path / 'worse_std_out_err.txt'
+    with open(twoloop_std_out_err_path, 'r') as f:
+        worse.write_text(f.read().replace('total_cost = 417366', 'total_cost = 500000'))
+    write_result_file(tmp_path / 'abc', str(worse), 500000)
+    write_result_file(tmp_path / 'abc_e1', twoloop_std_out_err_path, 417366)
+    # Not feasible, not a model with the same variables, or of a different network
+    write_result_file(tmp_path / 'abc_e2', twoloop_std_out_err_path, 1, status='False')
+    write_result_file(tmp_path / 'abc_e3', twoloop_std_out_err_path, 1, model='m3')
+    write_result_file(tmp_path / 'xyz', twoloop_std_out_err_path, 1)
+    assert find_best_prior_solution(str(tmp_path), 'abc').total_cost == 417366
+    assert find_best_prior_solution(str(tmp_path), 'def') is None
+
+
+def test_ampl_let_statements():
+    solution = AmplSolution(
+        10.0, {'1': 210.0, 'n"2': 200.0}, {('1', 'n"2'): -5.5}, {('1', 'n"2', '3'): 1000.0}
+    )
+    assert solution.ampl_let_statements('m1').splitlines() == [
+        'let h[1] := 210.0;',
+        'let h["n""2"] := 200.0;',
+        'let q[1,"n""2"] := -5.5;',
+        'let l[1,"n""2",3] := 1000.0;',
+    ]
+    # Model m2 splits the flow into q1 - q2
+    assert solution.ampl_let_statements('m2').splitlines()[2:4] == [
+        'let q1[1,"n""2"] := 0.0;',
+        'let q2[1,"n""2"] := 5.5;',
+    ]
+    assert solution.ampl_let_statements('m3') == ''
+
+
+def test_ampl_key():
+    assert ampl_key('12') == '12'
+    assert ampl_key('1e3') == '1e3'
+    assert ampl_key('A') == '"A"'
+
+
+def test_parsed_solution_as_warm_start(twoloop_std_out_err_path):
+    statements = parse_ampl_solution(twoloop_std_out_err_path).ampl_let_statements('m1').splitlines()
+    assert len(statements) == 7 + 8 + 10
+    assert 'let h[2] := 203.244;' in statements